@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la analítica vectorizada
+Compara cada estadística calculada con NumPy contra el recorrido de los partidos
+"""
+
+import sys
+import time
+
+from comun import crear_liga, medir
+from models import TablaPosiciones
+from src.analitica import Analitica, NUMPY_DISPONIBLE
+
+
+def recalcular_tabla(sistema):
+    """Recalcula la tabla de posiciones recorriendo todos los partidos"""
+    tabla = TablaPosiciones()
+    for codigo in sistema.codigos_en_orden():
+        tabla.registrar_equipo(codigo)
+    for partido in sistema.partidos:
+        tabla.registrar_partido(partido)
+    return tabla.filas()
+
+
+def main():
+    if not NUMPY_DISPONIBLE:
+        print("NumPy no está instalado: pip install numpy")
+        sys.exit(1)
+    
+    num_partidos = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    sistema = crear_liga(40, num_partidos)
+    vectorizada = Analitica(sistema, usar_numpy=True)
+    bucles = Analitica(sistema, usar_numpy=False)
+    
+    inicio = time.perf_counter()
+    eventos = vectorizada.eventos()
+    print(f"Exportación de {len(eventos.tipo):,} eventos de {num_partidos:,} partidos: "
+          f"{(time.perf_counter() - inicio) * 1000:.1f} ms\n")
+    
+    casos = [
+        ("Tabla de posiciones", vectorizada.tabla_posiciones, lambda: recalcular_tabla(sistema)),
+        ("Tabla de goleadores", vectorizada.tabla_goleadores, bucles.tabla_goleadores),
+        ("Goles por minuto", vectorizada.goles_por_minuto, bucles.goles_por_minuto),
+        ("Tarjetas por equipo", vectorizada.tarjetas_por_equipo, bucles.tarjetas_por_equipo),
+        ("Local / visitante", vectorizada.local_visitante, bucles.local_visitante),
+    ]
+    
+    print(f"{'Estadística':<22} {'Bucles (ms)':>12} {'NumPy (ms)':>12} {'Aceleración':>12}")
+    print("-" * 61)
+    for nombre, con_numpy, con_bucles in casos:
+        if con_numpy() != con_bucles():
+            print(f"{nombre}: los resultados no coinciden")
+            sys.exit(1)
+        tiempo_bucles = medir(con_bucles, repeticiones=3)
+        tiempo_numpy = medir(con_numpy, repeticiones=10)
+        print(f"{nombre:<22} {tiempo_bucles:>12.1f} {tiempo_numpy:>12.1f} "
+              f"{tiempo_bucles / tiempo_numpy:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark de importación en lote
+Compara la importación secuencial con el modo en paralelo por procesos y mide el trabajo
+que queda en el proceso principal, que limita la aceleración posible
+"""
+
+import os
+import sys
+import tempfile
+import time
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from models import SistemaFutbol
+from src.dsl_externo import importar_en_lote
+from comun import crear_equipos, crear_liga, escribir_archivos_dsl
+
+PROCESOS = (1, 2, 4, 8)
+
+
+def main():
+    num_partidos = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    origen = crear_liga(20, num_partidos)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        escribir_archivos_dsl(origen, directorio, partidos_por_archivo=500)
+
+        print(f"Núcleos disponibles: {len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()}")
+        print(f"{'Procesos':>10} {'Segundos':>10} {'Partidos/s':>12} {'CPU principal s':>16} {'Techo':>8}")
+        print("-" * 60)
+        secuencial = None
+        for procesos in PROCESOS:
+            sistema = SistemaFutbol()
+            crear_equipos(sistema, 20)
+            cpu = time.process_time()
+            resumen = importar_en_lote([directorio], sistema, procesos=procesos)
+            # Solo cuenta el proceso principal: lectura de tramos, armado y agregado de partidos
+            cpu = time.process_time() - cpu
+            assert resumen.partidos == num_partidos and resumen.errores == 0
+            if secuencial is None:
+                secuencial = resumen.segundos
+            # Aceleración máxima con núcleos ilimitados: el proceso principal no se reparte
+            techo = f"{secuencial / cpu:>7.1f}x" if procesos > 1 else ""
+            print(f"{procesos:>10} {resumen.segundos:>10.2f} {resumen.partidos_por_segundo:>12.0f} "
+                  f"{cpu:>16.2f} {techo:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la instrumentación
+Costo por llamada de un tramo medido, desactivado y activo, frente al costo de agregar un partido
+"""
+
+import gc
+import os
+import sys
+import time
+import timeit
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from models import SistemaFutbol
+from src import instrumentacion
+from comun import crear_equipos, crear_liga
+
+# Tramos que recorre cada partido agregado: agregar_partido y sus tres agregados
+TRAMOS_POR_PARTIDO = 4
+
+
+class Medida:
+    """Método medido como los agregados: la envoltura se instala solo al activar"""
+    
+    @instrumentacion.medido('bench.metodo')
+    def metodo(self, valor):
+        return valor
+    
+    def directo(self, valor):
+        return valor
+
+
+@instrumentacion.medido('bench.funcion')
+def funcion_medida(valor):
+    """Función de módulo medida: consulta la bandera en cada llamada"""
+    return valor
+
+
+def funcion(valor):
+    return valor
+
+
+def nanosegundos_por_llamada(llamar, repeticiones: int = 1_000_000) -> float:
+    """Mejor de 7 mediciones del tiempo de una llamada, en nanosegundos"""
+    return min(timeit.repeat(lambda: llamar(1), number=repeticiones, repeat=7)) * 1e9 / repeticiones
+
+
+def main():
+    num_partidos = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    liga = crear_liga(40, num_partidos)
+    
+    gc.disable()
+    sistema = SistemaFutbol()
+    crear_equipos(sistema, 40)
+    inicio = time.perf_counter()
+    for partido in liga.partidos:
+        sistema.agregar_partido(partido)
+    por_partido = (time.perf_counter() - inicio) * 1e9 / num_partidos
+    
+    objeto = Medida()
+    casos = []
+    for tipo, directa, medida in (("Método", lambda valor: objeto.directo(valor), lambda valor: objeto.metodo(valor)),
+                                  ("Función", funcion, funcion_medida)):
+        base = nanosegundos_por_llamada(directa)
+        instrumentacion.desactivar()
+        casos.append((f"{tipo}, desactivada", nanosegundos_por_llamada(medida) - base))
+        instrumentacion.activar(resumen_al_salir=False)
+        casos.append((f"{tipo}, activa", nanosegundos_por_llamada(medida) - base))
+        instrumentacion.desactivar()
+    gc.enable()
+    
+    print(f"agregar_partido:        {por_partido / 1000:>10.1f} µs/partido ({TRAMOS_POR_PARTIDO} tramos)")
+    for nombre, extra in casos:
+        print(f"{nombre + ':':<22} {extra:>+8.0f} ns/tramo  "
+              f"{extra * TRAMOS_POR_PARTIDO * 100 / por_partido:>+6.2f} % por partido agregado")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark del lexer del DSL externo
+Verifica que el lexer rápido produzca los mismos tokens que el lexer PLY
+(archivos sintéticos, ejemplos y texto aleatorio) y compara líneas por segundo
+"""
+
+import gc
+import glob
+import os
+import random
+import sys
+import time
+from collections import deque
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.dsl_externo import LexerRapido, ParserFutbol
+from comun import crear_liga, partido_a_dsl
+
+# Fragmentos para armar líneas aleatorias, válidas o no
+FRAGMENTOS = ['FECHA:', 'EQUIPO LOCAL:', 'equipo visitante :', 'GOL:', 'TARJETA:', 'CAMBIO:',
+              'ARBITRO:', 'BAR', 'rma', 'AMARILLA', 'roja', '12', '3-4-3', '15/10/2023',
+              ',', ' ', '\t', '\r', '\n', '#', ':', '-', '/', '$', 'é', 'Ñ', '0', '9']
+
+
+def tokens(lexer, texto: str) -> list:
+    """Tokens de un texto como tuplas comparables"""
+    lexer.lineno = 1
+    lexer.input(texto)
+    return [(t.type, t.value, t.lineno, t.lexpos) for t in iter(lexer.token, None)]
+
+
+def consumir(lexer, texto: str):
+    """Recorre todos los tokens de un texto sin conservarlos"""
+    lexer.lineno = 1
+    lexer.input(texto)
+    deque(iter(lexer.token, None), maxlen=0)
+
+
+def textos_de_prueba(texto_liga: str, cantidad: int = 5000) -> list:
+    raiz = os.path.join(os.path.dirname(__file__), '..')
+    textos = [texto_liga]
+    for ruta in sorted(glob.glob(os.path.join(raiz, 'ejemplos', '*.txt'))):
+        with open(ruta, encoding='utf-8') as archivo:
+            textos.append(archivo.read())
+    rng = random.Random(0)
+    for _ in range(cantidad):
+        textos.append(''.join(rng.choice(FRAGMENTOS) for _ in range(rng.randint(0, 30))))
+    
+    # Líneas válidas con pequeñas alteraciones, para ejercitar el camino de líneas regulares
+    lineas = texto_liga.splitlines(True)[:500]
+    for _ in range(cantidad * 4):
+        texto = ''.join(rng.choice(lineas) for _ in range(rng.randint(1, 5)))
+        for _ in range(rng.randint(0, 3)):
+            posicion = rng.randint(0, len(texto))
+            texto = texto[:posicion] + rng.choice(FRAGMENTOS) + texto[posicion + rng.randint(0, 1):]
+        textos.append(texto.lower() if rng.random() < 0.3 else texto)
+    return textos
+
+
+def main():
+    num_partidos = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    sistema = crear_liga(20, num_partidos)
+    texto = ''.join(partido_a_dsl(partido) for partido in sistema.partidos)
+    num_lineas = sum(1 for linea in texto.splitlines() if linea.strip())
+    lexer_ply = ParserFutbol(sistema).lexer
+    
+    textos = textos_de_prueba(texto)
+    distintos = sum(tokens(lexer_ply, t) != tokens(LexerRapido(), t) for t in textos)
+    print(f"Comparación de tokens: {len(textos) - distintos}/{len(textos)} textos idénticos")
+    if distintos:
+        sys.exit(1)
+    
+    print(f"\n{num_partidos:,} partidos, {num_lineas:,} líneas\n")
+    print(f"{'Etapa':<30} {'Segundos':>10} {'Líneas/s':>12}")
+    print("-" * 54)
+    casos = [
+        ("Tokens, lexer PLY", lambda: consumir(lexer_ply, texto)),
+        ("Tokens, lexer rápido", lambda: consumir(LexerRapido(), texto)),
+        ("Análisis, lexer PLY", lambda: ParserFutbol(sistema).analizar_texto(texto)),
+        ("Análisis, lexer rápido", lambda: ParserFutbol(sistema, lexer_rapido=True).analizar_texto(texto)),
+    ]
+    # Como timeit, sin recolector de basura: la liga sintética infla el costo de cada pasada
+    gc.disable()
+    for nombre, funcion in casos:
+        inicio = time.perf_counter()
+        funcion()
+        segundos = time.perf_counter() - inicio
+        print(f"{nombre:<30} {segundos:>10.2f} {num_lineas / segundos:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memoria de los eventos
+Compara eventos con __dict__ (definición anterior) contra los eventos con __slots__
+"""
+
+import sys
+import os
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+# Agregar el directorio raíz al path para importar models
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import models
+
+
+@dataclass
+class EventoConDict:
+    """Evento tal como estaba definido antes, con __dict__ por instancia"""
+    tiempo: int
+    equipo: str
+
+
+@dataclass
+class GolConDict(EventoConDict):
+    autor: int
+    asistente: Optional[int] = None
+
+
+@dataclass
+class TarjetaConDict(EventoConDict):
+    jugador: int
+    color: str
+
+
+@dataclass
+class CambioConDict(EventoConDict):
+    jugador_sale: int
+    jugador_entra: int
+
+
+def medir_memoria(gol, tarjeta, cambio, cantidad: int) -> float:
+    """Crea `cantidad` eventos mezclados y devuelve los MB reservados"""
+    equipos = ["BAR", "RMA"]
+    tracemalloc.start()
+    eventos = []
+    for i in range(cantidad):
+        tipo = i % 3
+        equipo = equipos[i % 2]
+        if tipo == 0:
+            eventos.append(gol(i % 90, equipo, i % 11 + 1, i % 10 + 1))
+        elif tipo == 1:
+            eventos.append(tarjeta(i % 90, equipo, i % 11 + 1, "AMARILLA"))
+        else:
+            eventos.append(cambio(i % 90, equipo, i % 11 + 1, i % 6 + 12))
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return actual / (1024 * 1024)
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    con_dict = medir_memoria(GolConDict, TarjetaConDict, CambioConDict, cantidad)
+    con_slots = medir_memoria(models.Gol, models.Tarjeta, models.Cambio, cantidad)
+    
+    print(f"Eventos:        {cantidad:>12,}")
+    print(f"Con __dict__:   {con_dict:>10.1f} MB")
+    print(f"Con __slots__:  {con_slots:>10.1f} MB")
+    print(f"Ahorro:         {(1 - con_slots / con_dict) * 100:>10.1f} %")
+
+
+if __name__ == "__main__":
+    main()
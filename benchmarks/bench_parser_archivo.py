@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark del análisis de archivos del DSL externo
+Compara la gramática completa en una sola pasada con el análisis línea por línea
+"""
+
+import os
+import sys
+import tempfile
+import time
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.dsl_externo import ParserFutbol
+from src.dsl_externo.importador import _importar_bloque, iterar_bloques
+from comun import crear_liga, partido_a_dsl
+
+
+def por_lineas(sistema, ruta: str) -> list:
+    """Camino anterior: un comando por línea con split y un diccionario por partido"""
+    parser = ParserFutbol(sistema)
+    partidos = []
+    for _, lineas in iterar_bloques(ruta):
+        partido, errores = _importar_bloque(parser, lineas)
+        assert partido is not None and not errores
+        partidos.append(partido)
+    return partidos
+
+
+def una_pasada(sistema, ruta: str) -> list:
+    """Gramática `archivo : partidos` con una sola llamada a parse"""
+    parser = ParserFutbol(sistema)
+    partidos = parser.analizar_archivo(ruta)
+    assert not parser.diagnosticos
+    return partidos
+
+
+def una_pasada_rapida(sistema, ruta: str) -> list:
+    """La misma gramática tokenizando con `LexerRapido`"""
+    parser = ParserFutbol(sistema, lexer_rapido=True)
+    partidos = parser.analizar_archivo(ruta)
+    assert not parser.diagnosticos
+    return partidos
+
+
+def main():
+    num_partidos = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    sistema = crear_liga(20, num_partidos)
+    
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "partidos.txt")
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            for partido in sistema.partidos:
+                archivo.write(partido_a_dsl(partido))
+        with open(ruta, encoding='utf-8') as archivo:
+            num_lineas = sum(1 for linea in archivo if linea.strip())
+        
+        print(f"{num_partidos:,} partidos, {num_lineas:,} líneas\n")
+        print(f"{'Camino':<24} {'Segundos':>10} {'Líneas/s':>12} {'Partidos/s':>12}")
+        print("-" * 61)
+        resultados = {}
+        caminos = (("Línea por línea", por_lineas), ("Gramática completa", una_pasada),
+                   ("Gramática, lexer rápido", una_pasada_rapida))
+        for nombre, analizar in caminos:
+            inicio = time.perf_counter()
+            resultados[nombre] = analizar(sistema, ruta)
+            segundos = time.perf_counter() - inicio
+            print(f"{nombre:<24} {segundos:>10.2f} {num_lineas / segundos:>12,.0f} "
+                  f"{num_partidos / segundos:>12,.0f}")
+    
+    referencia = resultados["Línea por línea"]
+    if any(partidos != referencia for partidos in resultados.values()):
+        print("Los partidos construidos no coinciden")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark de construcción del parser PLY
+Compara el costo de arranque y por comando de consola
+"""
+
+import subprocess
+import sys
+import os
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import ply.lex as lex
+import ply.yacc as yacc
+from src.dsl_externo import dsl_externo
+from src.dsl_externo import procesar_comando_partido
+from comun import crear_liga, medir
+
+COMANDO = "EQUIPO LOCAL: AAA"
+
+
+def medir_arranque() -> float:
+    """Mide en un proceso nuevo la primera construcción del parser, en ms"""
+    codigo = (
+        "import time, sys; sys.path.insert(0, '.');"
+        "from src.dsl_externo import ParserFutbol;"
+        "from models import SistemaFutbol;"
+        "inicio = time.perf_counter(); ParserFutbol(SistemaFutbol());"
+        "print((time.perf_counter() - inicio) * 1000)"
+    )
+    raiz = os.path.join(os.path.dirname(__file__), '..')
+    salida = subprocess.run([sys.executable, "-c", codigo], cwd=raiz,
+                            capture_output=True, text=True, check=True)
+    return float(salida.stdout.strip())
+
+
+def construir_tablas():
+    """Reconstruye lexer y tablas LALR como se hacía antes en cada instancia"""
+    lex.lex(module=dsl_externo, reflags=dsl_externo.FLAGS_LEXER)
+    yacc.yacc(module=dsl_externo, debug=False, write_tables=False, errorlog=yacc.NullLogger())
+
+
+def main():
+    sistema = crear_liga(2, 0)
+    
+    print(f"Arranque (primer ParserFutbol):          {medir_arranque():8.3f} ms")
+    print(f"Reconstrucción de tablas por comando:    {medir(construir_tablas, 50):8.3f} ms")
+    print(f"procesar_comando_partido (compartido):   "
+          f"{medir(lambda: procesar_comando_partido(COMANDO, sistema), 2000):8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark del dibujo de tablas
+Compara escrituras y tiempo del dibujo en un único buffer contra el dibujo línea por línea
+anterior, para la tabla de goleadores completa y para una sola página de una lista o de un
+iterador con anchos fijos
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.generador import GeneradorLiga
+from src.ui import ui
+from src.ui.ui_renderer import Colors
+from bench_suite import filas_goleadores
+
+HEADERS = ["Pos", "Jugador", "Equipo", "Goles"]
+TITULO = "Ranking de Goleadores"
+FILAS_POR_PAGINA = 20
+
+
+class SalidaContada(io.StringIO):
+    """Salida en memoria que cuenta las llamadas a `write`, como las vería una terminal remota"""
+    
+    def __init__(self):
+        super().__init__()
+        self.escrituras = 0
+    
+    def write(self, texto):
+        self.escrituras += 1
+        return super().write(texto)
+
+
+def print_table_por_lineas(headers, rows, title="", align="left"):
+    """Dibujo anterior: un `print` por línea y anchos recorriendo todas las filas por columna"""
+    col_widths = []
+    for i, header in enumerate(headers):
+        max_width = len(header)
+        for row in rows:
+            if i < len(row):
+                max_width = max(max_width, len(str(row[i])))
+        col_widths.append(min(max_width + 2, 20))
+    if title:
+        print(f"\n{ui.theme.secondary}{Colors.BOLD}")
+        print(f"📊 {title}")
+        print("─" * len(f"📊 {title}"))
+        print(f"{Colors.RESET}")
+    print(f"{ui.theme.primary}{Colors.BOLD}")
+    print("┌" + "┬".join("─" * width for width in col_widths) + "┐")
+    header_row = "│"
+    for i, header in enumerate(headers):
+        header_row += f" {header:<{col_widths[i]-1}}│"
+    print(header_row)
+    print("├" + "┼".join("─" * width for width in col_widths) + "┤")
+    print(f"{Colors.RESET}")
+    for row_idx, row in enumerate(rows):
+        color = ui.theme.text_primary if row_idx % 2 == 0 else ui.theme.text_secondary
+        print(f"{color}")
+        row_str = "│"
+        for i, cell in enumerate(row):
+            if i < len(col_widths):
+                cell_str = str(cell)[:col_widths[i]-1]
+                if align == "right":
+                    row_str += f" {cell_str:>{col_widths[i]-1}}│"
+                else:
+                    row_str += f" {cell_str:<{col_widths[i]-1}}│"
+        print(row_str)
+        print(f"{Colors.RESET}")
+    print(f"{ui.theme.primary}{Colors.BOLD}")
+    print("└" + "┴".join("─" * width for width in col_widths) + "┘")
+    print(f"{Colors.RESET}")
+
+
+def medir(dibujar, repeticiones: int = 5):
+    """Mejor tiempo de `repeticiones` dibujos, escrituras del último y su texto"""
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        salida = SalidaContada()
+        with contextlib.redirect_stdout(salida):
+            inicio = time.perf_counter()
+            dibujar()
+            mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, salida.escrituras, salida.getvalue()
+
+
+def main():
+    num_filas = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    generador = GeneradorLiga(20, semilla=0, jugadores_por_equipo=num_filas // 20 + 30)
+    sistema = generador.crear_sistema(num_filas * 2)
+    filas = filas_goleadores(sistema)[:num_filas]
+    
+    anterior = medir(lambda: print_table_por_lineas(HEADERS, filas, TITULO))
+    completa = medir(lambda: ui.print_table(HEADERS, filas, TITULO))
+    pagina = medir(lambda: ui.print_table(HEADERS, filas, TITULO, page=2, page_size=FILAS_POR_PAGINA))
+    anchos = ui.column_widths(HEADERS, filas, sample=200)
+    generador_filas = medir(lambda: ui.print_table(HEADERS, iter(filas), TITULO, page=2, page_size=FILAS_POR_PAGINA,
+                                                   col_widths=anchos))
+    if completa[2] != anterior[2]:
+        raise RuntimeError("El dibujo en un buffer no coincide con el dibujo línea por línea")
+    
+    print(f"Tabla de goleadores: {len(filas):,} filas")
+    print(f"{'Dibujo':<34} {'Escrituras':>10} {'ms':>10} {'Bytes':>12}")
+    for nombre, (segundos, escrituras, texto) in (("Línea por línea (anterior)", anterior),
+                                                  ("Buffer único", completa),
+                                                  (f"Buffer único, página de {FILAS_POR_PAGINA}", pagina),
+                                                  ("Iterador, página con anchos fijos", generador_filas)):
+        print(f"{nombre:<34} {escrituras:>10,} {segundos * 1000:>10.2f} {len(texto.encode()):>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark del registro de equipos
+Mide la memoria de los códigos internados en partidos analizados y el costo de agregar partidos
+"""
+
+import sys
+import os
+import gc
+import time
+import tracemalloc
+# Agregar el directorio raíz al path para importar models
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from models import SistemaFutbol
+from comun import crear_equipos, crear_liga, partido_a_dsl
+from src.dsl_externo import ParserFutbol
+
+
+def codigos_de(partidos: list) -> list:
+    """Todas las referencias a códigos de equipo guardadas en los partidos y sus eventos"""
+    codigos = []
+    for partido in partidos:
+        codigos.append(partido.equipo_local)
+        codigos.append(partido.equipo_visitante)
+        codigos.extend(evento.equipo for evento in partido.eventos)
+    return codigos
+
+
+def bytes_distintos(codigos: list) -> int:
+    """Bytes ocupados por los objetos str distintos (por identidad) de la lista"""
+    distintos = {id(codigo): codigo for codigo in codigos}
+    return sum(sys.getsizeof(codigo) for codigo in distintos.values())
+
+
+def sin_internar(partidos: list):
+    """Reemplaza cada código por una copia propia, como quedaban antes del registro"""
+    for partido in partidos:
+        partido.equipo_local = partido.equipo_local.encode().decode()
+        partido.equipo_visitante = partido.equipo_visitante.encode().decode()
+        for evento in partido.eventos:
+            evento.equipo = evento.equipo.encode().decode()
+
+
+def main():
+    num_partidos = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    liga = crear_liga(40, num_partidos)
+    texto = "".join(partido_a_dsl(partido) for partido in liga.partidos)
+    
+    sistema = SistemaFutbol()
+    crear_equipos(sistema, 40)
+    gc.collect()
+    tracemalloc.start()
+    partidos = ParserFutbol(sistema).analizar_texto(texto)
+    memoria_analisis, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    codigos = codigos_de(partidos)
+    internados = len({id(codigo) for codigo in codigos})
+    bytes_internados = bytes_distintos(codigos)
+    sin_internar(partidos)
+    bytes_copias = bytes_distintos(codigos_de(partidos))
+    
+    # Agregar los partidos vuelve a internar sus códigos en el registro del sistema
+    gc.disable()
+    inicio = time.perf_counter()
+    for partido in partidos:
+        sistema.agregar_partido(partido)
+    segundos = time.perf_counter() - inicio
+    gc.enable()
+    internados_al_agregar = len({id(codigo) for codigo in codigos_de(partidos)})
+    
+    print(f"Partidos:                {len(partidos):>12,}")
+    print(f"Referencias a códigos:   {len(codigos):>12,}")
+    print(f"Memoria del análisis:    {memoria_analisis / (1024 * 1024):>10.1f} MB")
+    print(f"Códigos internados:      {internados:>12,} objetos  {bytes_internados / 1024:>10.1f} KB")
+    print(f"Códigos sin internar:    {len(codigos):>12,} objetos  {bytes_copias / 1024:>10.1f} KB")
+    print(f"Tras agregar_partido:    {internados_al_agregar:>12,} objetos")
+    print(f"agregar_partido:         {segundos * 1e6 / len(partidos):>10.1f} µs/partido")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark del servidor de ingesta
+Muchos clientes concurrentes envían partidos completos línea por línea
+"""
+
+import asyncio
+import sys
+import time
+
+from comun import crear_equipos, crear_liga, partido_a_dsl
+from models import SistemaFutbol
+from src.dsl_externo import ServidorIngesta
+
+
+async def cliente(puerto: int, partidos: list) -> int:
+    """Envía los partidos sin esperar cada respuesta y devuelve las respuestas con error"""
+    lector, escritor = await asyncio.open_connection('127.0.0.1', puerto)
+    lineas = []
+    for partido in partidos:
+        lineas.extend(linea for linea in partido_a_dsl(partido).splitlines() if linea)
+        lineas.append("FIN")
+    
+    async def enviar():
+        for linea in lineas:
+            escritor.write(f"{linea}\n".encode('utf-8'))
+            await escritor.drain()
+    
+    envio = asyncio.create_task(enviar())
+    errores = 0
+    for _ in lineas:
+        respuesta = await lector.readline()
+        if respuesta.startswith(b"ERROR"):
+            errores += 1
+    await envio
+    escritor.close()
+    await escritor.wait_closed()
+    return errores
+
+
+async def correr(num_clientes: int, partidos_por_cliente: int, max_pendientes: int):
+    origen = crear_liga(20, num_clientes * partidos_por_cliente)
+    sistema = SistemaFutbol()
+    crear_equipos(sistema, 20)
+    
+    servidor = ServidorIngesta(sistema, max_pendientes=max_pendientes)
+    await servidor.iniciar('127.0.0.1', 0)
+    puerto = servidor.direcciones[0][1]
+    
+    inicio = time.perf_counter()
+    errores = await asyncio.gather(*(
+        cliente(puerto, origen.partidos[i::num_clientes]) for i in range(num_clientes)))
+    await servidor.cerrar()
+    segundos = time.perf_counter() - inicio
+    
+    e = servidor.estadisticas
+    print(f"Clientes: {num_clientes}  Partidos: {e.partidos_aplicados}  Líneas: {e.lineas}  "
+          f"Errores: {sum(errores)}")
+    print(f"⏱️  {segundos:.2f} s - {e.lineas / segundos:,.0f} líneas/s - "
+          f"{e.partidos_aplicados / segundos:,.0f} partidos/s")
+    
+    if sistema.obtener_tabla_posiciones() != origen.obtener_tabla_posiciones():
+        print("❌ La tabla de posiciones no coincide con la liga enviada")
+        sys.exit(1)
+
+
+def main():
+    num_clientes = int(sys.argv[1]) if len(sys.argv) > 1 else 48
+    partidos_por_cliente = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    max_pendientes = int(sys.argv[3]) if len(sys.argv) > 3 else 16
+    asyncio.run(correr(num_clientes, partidos_por_cliente, max_pendientes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark de arranque en frío
+Compara cargar un snapshot binario contra reprocesar los archivos del DSL externo
+"""
+
+import os
+import sys
+import tempfile
+import time
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from models import SistemaFutbol
+from src.dsl_externo import importar_en_lote
+from src.persistencia import cargar_snapshot, guardar_snapshot
+from comun import crear_equipos, crear_liga, escribir_archivos_dsl
+
+
+def main():
+    num_partidos = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    origen = crear_liga(20, num_partidos)
+    
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = escribir_archivos_dsl(origen, directorio, partidos_por_archivo=1000)
+        ruta_snapshot = os.path.join(directorio, "sistema.snap")
+        guardar_snapshot(origen, ruta_snapshot)
+        
+        inicio = time.perf_counter()
+        sistema = SistemaFutbol()
+        crear_equipos(sistema, 20)
+        importar_en_lote(rutas, sistema)
+        tiempo_dsl = time.perf_counter() - inicio
+        
+        inicio = time.perf_counter()
+        cargado = cargar_snapshot(ruta_snapshot)
+        tiempo_snapshot = time.perf_counter() - inicio
+        assert len(cargado.partidos) == num_partidos
+        
+        tamano_dsl = sum(os.path.getsize(ruta) for ruta in rutas)
+        tamano_snapshot = os.path.getsize(ruta_snapshot)
+    
+    print(f"Partidos:           {num_partidos:>10,}")
+    print(f"Reproceso DSL:      {tiempo_dsl:>10.2f} s   {tamano_dsl / 1024 / 1024:>8.1f} MB")
+    print(f"Carga de snapshot:  {tiempo_snapshot:>10.2f} s   {tamano_snapshot / 1024 / 1024:>8.1f} MB")
+    print(f"Aceleración:        {tiempo_dsl / tiempo_snapshot:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks sobre ligas sintéticas
+Mide análisis de archivos, tablas, listado de resultados y dibujo de tablas a varias escalas
+y guarda los resultados en JSON para seguir regresiones entre versiones
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from itertools import islice
+from statistics import median
+from typing import Callable, Dict, List, Optional, Tuple
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from models import SistemaFutbol
+from src.dsl_externo import importar_en_lote
+from src.generador import GeneradorLiga
+from src.menu import MenuPrincipal
+from src.ui import ui
+
+ESCALAS = (10, 1_000, 100_000, 1_000_000)
+VERSION_FORMATO = 1
+
+
+def medir_repetido(funcion: Callable, tiempo_minimo: float = 0.2, minimo: int = 5) -> Tuple[float, int]:
+    """Mediana en segundos de llamadas repetidas hasta juntar `tiempo_minimo` y `minimo` llamadas"""
+    tiempos = []
+    total = 0.0
+    while len(tiempos) < minimo or total < tiempo_minimo:
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+        total += tiempos[-1]
+    return median(tiempos), len(tiempos)
+
+
+def filas_posiciones(sistema: SistemaFutbol) -> List[List[str]]:
+    """Filas de la tabla de posiciones completa, con el formato del menú"""
+    return [[str(i), fila['equipo'], str(fila['partidos_jugados']), str(fila['ganados']),
+             str(fila['empatados']), str(fila['perdidos']), str(fila['goles_a_favor']),
+             str(fila['goles_en_contra']), f"{fila['diferencia_goles']:+d}", str(fila['puntos'])]
+            for i, fila in enumerate(sistema.obtener_tabla_posiciones(), 1)]
+
+
+def filas_goleadores(sistema: SistemaFutbol) -> List[List[str]]:
+    """Filas del ranking de goleadores completo, con el formato del menú"""
+    return [[str(i), goleador['jugador'], goleador['equipo'], str(goleador['goles'])]
+            for i, goleador in enumerate(sistema.obtener_tabla_goleadores(), 1)]
+
+
+def listar_resultados(sistema: SistemaFutbol, **filtros) -> str:
+    """Texto de una página de resultados con sus eventos, como la muestra el menú"""
+    consulta = sistema.consultar_partidos(**filtros)
+    lineas = []
+    for i, partido in enumerate(consulta.partidos, consulta.inicio):
+        lineas.append(f"{i}. {partido}")
+        lineas.extend(f"   - {evento}" for evento in sorted(partido.eventos, key=lambda e: e.tiempo))
+    return "\n".join(lineas)
+
+
+def dibujar_tabla(headers: List[str], filas: List[List[str]], titulo: str) -> str:
+    """Salida de `ui.print_table` capturada en memoria"""
+    salida = io.StringIO()
+    with contextlib.redirect_stdout(salida):
+        ui.print_table(headers, filas, titulo)
+    return salida.getvalue()
+
+
+def dibujar_pantalla_goleadores(sistema: SistemaFutbol, anchos: List[int], pagina: int) -> str:
+    """Una pantalla del ranking de goleadores como la muestra el menú: solo las filas de la página"""
+    desde = (pagina - 1) * MenuPrincipal.FILAS_POR_PAGINA
+    filas = ([str(i), goleador['jugador'], goleador['equipo'], str(goleador['goles'])]
+             for i, goleador in enumerate(islice(sistema.iterar_tabla_goleadores(), desde, None), desde + 1))
+    return ui.format_table(["Pos", "Jugador", "Equipo", "Goles"], filas, "Ranking de Goleadores",
+                           page_size=MenuPrincipal.FILAS_POR_PAGINA, col_widths=anchos)
+
+
+def medir_escala(escala: int, num_equipos: int, semilla: int, tiempo_minimo: float) -> List[Dict]:
+    """Genera una liga de `escala` partidos, la importa desde archivos y mide cada caso"""
+    generador = GeneradorLiga(num_equipos, semilla)
+    resultados = []
+    
+    def registrar(caso: str, segundos: float, repeticiones: int = 1, unidades: Optional[int] = None):
+        resultado = {'escala': escala, 'caso': caso, 'segundos': segundos, 'repeticiones': repeticiones}
+        if unidades is not None:
+            resultado['unidades'] = unidades
+            resultado['por_segundo'] = unidades / segundos if segundos else None
+        resultados.append(resultado)
+        tasa = f"{resultado['por_segundo']:>14,.0f}/s" if unidades is not None else ""
+        print(f"{escala:>10,} {caso:<28} {segundos * 1000:>12.3f} ms {repeticiones:>6} {tasa}")
+    
+    with tempfile.TemporaryDirectory() as directorio:
+        inicio = time.perf_counter()
+        generador.escribir_dsl(directorio, escala, partidos_por_archivo=5000)
+        registrar('generacion_dsl', time.perf_counter() - inicio, unidades=escala)
+        
+        sistema = SistemaFutbol()
+        for equipo in generador.equipos():
+            sistema.agregar_equipo(equipo)
+        resumen = importar_en_lote([directorio], sistema)
+        if resumen.errores or resumen.partidos != escala:
+            raise RuntimeError(f"Importación inválida: {resumen.partidos} partidos, {resumen.errores} errores")
+        registrar('analisis_archivos', resumen.segundos, unidades=resumen.lineas)
+    
+    fecha_media = sistema.partidos[len(sistema.partidos) // 2].fecha
+    ultima_pagina = sistema.consultar_partidos().total_paginas
+    codigo = generador.codigos[0]
+    casos = [
+        ('tabla_posiciones', sistema.obtener_tabla_posiciones),
+        ('tabla_posiciones_historica', lambda: sistema.obtener_tabla_posiciones(hasta=fecha_media)),
+        ('tabla_goleadores', sistema.obtener_tabla_goleadores),
+        ('listado_resultados', lambda: listar_resultados(sistema, pagina=ultima_pagina // 2 + 1)),
+        ('listado_resultados_equipo', lambda: listar_resultados(sistema, equipo=codigo, pagina=2)),
+    ]
+    for caso, funcion in casos:
+        registrar(caso, *medir_repetido(funcion, tiempo_minimo))
+    
+    posiciones = filas_posiciones(sistema)
+    goleadores = filas_goleadores(sistema)
+    registrar('dibujo_tabla_posiciones', *medir_repetido(
+        lambda: dibujar_tabla(["Pos", "Equipo", "PJ", "G", "E", "P", "GF", "GC", "DG", "Pts"],
+                              posiciones, "Clasificación de Equipos"), tiempo_minimo), unidades=len(posiciones))
+    registrar('dibujo_tabla_goleadores', *medir_repetido(
+        lambda: dibujar_tabla(["Pos", "Jugador", "Equipo", "Goles"], goleadores,
+                              "Ranking de Goleadores"), tiempo_minimo), unidades=len(goleadores))
+    # Pantalla de la primera página y de la del medio: su costo no debería depender de la escala
+    anchos = ui.column_widths(["Pos", "Jugador", "Equipo", "Goles"], goleadores, sample=MenuPrincipal.MUESTRA_ANCHOS)
+    pagina_media = len(goleadores) // MenuPrincipal.FILAS_POR_PAGINA // 2 + 1
+    registrar('pantalla_goleadores', *medir_repetido(
+        lambda: dibujar_pantalla_goleadores(sistema, anchos, 1), tiempo_minimo))
+    registrar('pantalla_goleadores_media', *medir_repetido(
+        lambda: dibujar_pantalla_goleadores(sistema, anchos, pagina_media), tiempo_minimo))
+    return resultados
+
+
+def entorno() -> Dict:
+    """Datos de la máquina y la versión medida, para comparar resultados comparables"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {'python': platform.python_version(), 'implementacion': platform.python_implementation(),
+            'plataforma': platform.platform(), 'procesadores': os.cpu_count(), 'commit': commit}
+
+
+def comparar(actual: Dict, ruta_base: str, tolerancia: float) -> int:
+    """Compara con un resultado anterior; devuelve la cantidad de casos más lentos que la tolerancia"""
+    with open(ruta_base, 'r', encoding='utf-8') as archivo:
+        base = json.load(archivo)
+    anteriores = {(r['escala'], r['caso']): r['segundos'] for r in base['resultados']}
+    
+    print(f"\nComparación con {ruta_base} (commit {base['entorno'].get('commit')})")
+    print(f"{'Escala':>10} {'Caso':<28} {'Antes ms':>12} {'Ahora ms':>12} {'Relación':>9}")
+    regresiones = 0
+    for resultado in actual['resultados']:
+        anterior = anteriores.get((resultado['escala'], resultado['caso']))
+        if not anterior:
+            continue
+        relacion = resultado['segundos'] / anterior
+        marca = ""
+        if relacion > 1 + tolerancia:
+            regresiones += 1
+            marca = " ⚠️"
+        print(f"{resultado['escala']:>10,} {resultado['caso']:<28} {anterior * 1000:>12.3f} "
+              f"{resultado['segundos'] * 1000:>12.3f} {relacion:>8.2f}x{marca}")
+    return regresiones
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argumentos = argparse.ArgumentParser(description="Suite de benchmarks sobre ligas sintéticas")
+    argumentos.add_argument('--escalas', type=int, nargs='+', default=list(ESCALAS),
+                            help="Cantidades de partidos a medir")
+    argumentos.add_argument('--equipos', type=int, default=20, help="Equipos de la liga")
+    argumentos.add_argument('--semilla', type=int, default=0, help="Semilla del generador")
+    argumentos.add_argument('--tiempo-minimo', type=float, default=0.2,
+                            help="Segundos mínimos de medición de cada caso repetido")
+    argumentos.add_argument('--salida', default='resultados_suite.json', help="Archivo JSON de resultados")
+    argumentos.add_argument('--comparar', help="JSON de una corrida anterior contra el cual comparar")
+    argumentos.add_argument('--tolerancia', type=float, default=0.2,
+                            help="Aumento relativo de tiempo a partir del cual un caso es una regresión")
+    args = argumentos.parse_args(argv)
+    
+    resultado = {'formato': VERSION_FORMATO, 'fecha': datetime.now().isoformat(timespec='seconds'),
+                 'entorno': entorno(), 'equipos': args.equipos, 'semilla': args.semilla, 'resultados': []}
+    print(f"{'Escala':>10} {'Caso':<28} {'Mediana':>15} {'Rep.':>6} {'Tasa':>16}")
+    print("-" * 80)
+    for escala in args.escalas:
+        resultado['resultados'].extend(medir_escala(escala, args.equipos, args.semilla, args.tiempo_minimo))
+    
+    with open(args.salida, 'w', encoding='utf-8') as archivo:
+        json.dump(resultado, archivo, indent=2, ensure_ascii=False)
+    print(f"\n💾 Resultados guardados en {args.salida}")
+    
+    if args.comparar:
+        return 1 if comparar(resultado, args.comparar, args.tolerancia) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
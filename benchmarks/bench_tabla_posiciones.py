@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la tabla de posiciones
+Muestra que la latencia de consulta no crece con la cantidad de partidos,
+tanto para la tabla actual como para la tabla a una fecha pasada
+"""
+
+import random
+
+from comun import crear_liga, medir
+
+
+def main():
+    print(f"{'Partidos':>10} {'Consulta (ms)':>15} {'A una fecha (ms)':>18}")
+    print("-" * 45)
+    for num_partidos in (1_000, 10_000, 50_000, 100_000):
+        sistema = crear_liga(20, num_partidos)
+        tiempo = medir(sistema.obtener_tabla_posiciones, repeticiones=1000)
+        
+        # Fechas al azar: la primera consulta de cada tramo crea sus puntos de control
+        rng = random.Random(0)
+        fechas = [partido.fecha for partido in rng.sample(sistema.partidos, 200)]
+        for fecha in fechas:
+            sistema.obtener_tabla_posiciones(hasta=fecha)
+        consultas = iter(fechas * 5)
+        tiempo_historico = medir(lambda: sistema.obtener_tabla_posiciones(hasta=next(consultas)),
+                                 repeticiones=1000)
+        print(f"{num_partidos:>10} {tiempo:>15.4f} {tiempo_historico:>18.4f}")
+
+
+if __name__ == "__main__":
+    main()
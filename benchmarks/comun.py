@@ -0,0 +1,80 @@
+"""
+Utilidades compartidas por los benchmarks
+Construcción de ligas sintéticas y medición de tiempos
+"""
+
+import random
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+# Agregar el directorio raíz al path para importar models
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from models import Equipo, Partido, SistemaFutbol
+from src.generador import partido_a_dsl
+
+
+def crear_equipos(sistema: SistemaFutbol, num_equipos: int, jugadores_por_equipo: int = 17):
+    """Registra equipos con códigos de 3 letras y plantel completo"""
+    for i in range(num_equipos):
+        codigo = chr(65 + i // 676 % 26) + chr(65 + i // 26 % 26) + chr(65 + i % 26)
+        equipo = Equipo(f"Equipo {codigo}", codigo)
+        for numero in range(1, jugadores_por_equipo + 1):
+            equipo.agregar_jugador(numero, f"Jugador {numero} {codigo}")
+        sistema.agregar_equipo(equipo)
+
+
+def crear_partido(rng: random.Random, codigos: list, fecha: datetime) -> Partido:
+    """Crea un partido aleatorio entre dos equipos distintos"""
+    local, visitante = rng.sample(codigos, 2)
+    partido = Partido(
+        fecha=fecha,
+        equipo_local=local,
+        equipo_visitante=visitante,
+        formacion_local="4-3-3",
+        formacion_visitante="4-4-2",
+        titulares_local=list(range(1, 12)),
+        titulares_visitante=list(range(1, 12)),
+        banco_local=list(range(12, 18)),
+        banco_visitante=list(range(12, 18))
+    )
+    for _ in range(rng.randint(0, 5)):
+        equipo = local if rng.random() < 0.5 else visitante
+        partido.agregar_gol(equipo, rng.randint(1, 90), rng.randint(2, 11))
+    if rng.random() < 0.5:
+        partido.agregar_tarjeta(local, rng.randint(1, 90), rng.randint(2, 11), "AMARILLA")
+    partido.agregar_cambio(visitante, rng.randint(46, 85), rng.randint(2, 11), rng.randint(12, 17))
+    return partido
+
+
+def crear_liga(num_equipos: int, num_partidos: int, semilla: int = 42) -> SistemaFutbol:
+    """Crea un sistema con equipos y partidos sintéticos"""
+    rng = random.Random(semilla)
+    sistema = SistemaFutbol()
+    crear_equipos(sistema, num_equipos)
+    codigos = list(sistema.equipos.keys())
+    inicio = datetime(2000, 1, 1)
+    for i in range(num_partidos):
+        sistema.agregar_partido(crear_partido(rng, codigos, inicio + timedelta(days=i // 10)))
+    return sistema
+
+
+def medir(funcion: Callable, repeticiones: int = 100) -> float:
+    """Devuelve el tiempo promedio de una llamada en milisegundos"""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def escribir_archivos_dsl(sistema: SistemaFutbol, directorio: str, partidos_por_archivo: int) -> list:
+    """Escribe los partidos del sistema en archivos .txt y devuelve sus rutas"""
+    rutas = []
+    for inicio in range(0, len(sistema.partidos), partidos_por_archivo):
+        ruta = os.path.join(directorio, f"partidos_{len(rutas):04d}.txt")
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            for partido in sistema.partidos[inicio:inicio + partidos_por_archivo]:
+                archivo.write(partido_a_dsl(partido))
+        rutas.append(ruta)
+    return rutas
@@ -4,10 +4,19 @@ Script de demostración completa del Sistema de Fútbol
 Muestra el uso de DSL Interno y Externo
 """
 
+import argparse
+import os
+
 from src.dsl_interno import SistemaFutbol
 from src.dsl_externo import procesar_archivo_partidos
+from src.persistencia import cargar_snapshot, guardar_snapshot
 
 def main():
+    argumentos = argparse.ArgumentParser(description="Demo del sistema de gestión de partidos")
+    argumentos.add_argument('--snapshot',
+                            help="Snapshot binario: se carga si existe, si no se crea al terminar la carga")
+    args = argumentos.parse_args()
+    
     print("=" * 80)
     print("DEMO COMPLETA DEL SISTEMA DE GESTIÓN DE PARTIDOS DE FÚTBOL")
     print("=" * 80)
@@ -15,6 +24,21 @@ def main():
     # Inicializar sistema
     sistema = SistemaFutbol()
     
+    if args.snapshot and os.path.exists(args.snapshot):
+        print(f"\n📂 Cargando sistema desde snapshot {args.snapshot}...")
+        cargar_snapshot(args.snapshot, sistema)
+        print(f"✅ {len(sistema.equipos)} equipos y {len(sistema.partidos)} partidos cargados")
+    elif not cargar_datos(sistema):
+        return
+    elif args.snapshot:
+        guardar_snapshot(sistema, args.snapshot)
+        print(f"\n💾 Snapshot guardado en {args.snapshot}")
+    
+    mostrar_estadisticas(sistema)
+
+
+def cargar_datos(sistema: SistemaFutbol) -> bool:
+    """Crea los equipos con el DSL interno y carga los partidos con el DSL externo"""
     # ========================================
     # PASO 1: Crear equipos con DSL Interno
     # ========================================
@@ -74,8 +98,13 @@ def main():
         print(f"\n📈 Total de partidos en el sistema: {len(sistema.partidos)}")
     else:
         print("❌ Error cargando partidos")
-        return
+        return False
     
+    return True
+
+
+def mostrar_estadisticas(sistema: SistemaFutbol):
+    """Muestra resultados, tabla de posiciones y goleadores"""
     # ========================================
     # PASO 4: Mostrar resultados
     # ========================================
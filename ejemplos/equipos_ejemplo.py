@@ -0,0 +1,34 @@
+# ========================================
+# Equipos de ejemplo para la importación en lote
+# ========================================
+# Se ejecuta con la variable `sistema` ya definida:
+#   python importar.py --equipos ejemplos/equipos_ejemplo.py ejemplos/
+
+barcelona = sistema.crear_equipo().con_nombre("FC Barcelona").con_codigo("BAR")
+for numero, nombre in [
+    (1, "Ter Stegen"), (2, "Dest"), (3, "Piqué"), (4, "Araujo"),
+    (5, "Busquets"), (6, "Pedri"), (7, "Dembélé"), (8, "De Jong"),
+    (9, "Lewandowski"), (10, "Ansu Fati"), (11, "Ferran Torres"),
+    (12, "Peña"), (13, "Iñaki Peña"), (14, "Kessié"),
+    (15, "Christensen"), (16, "Raphinha"), (17, "Marcos Alonso")
+]:
+    barcelona.agregar_jugador(numero, nombre)
+sistema.registrar_equipo(barcelona)
+
+real_madrid = sistema.crear_equipo().con_nombre("Real Madrid").con_codigo("RMA")
+for numero, nombre in [
+    (1, "Courtois"), (2, "Carvajal"), (3, "Militao"), (4, "Alaba"),
+    (5, "Tchouameni"), (6, "Nacho"), (7, "Vinicius Jr"), (8, "Kroos"),
+    (9, "Benzema"), (10, "Modric"), (11, "Asensio"),
+    (12, "Lunin"), (13, "Vallejo"), (14, "Casemiro"),
+    (15, "Valverde"), (16, "Rodrygo"), (17, "Lucas Vázquez")
+]:
+    real_madrid.agregar_jugador(numero, nombre)
+sistema.registrar_equipo(real_madrid)
+
+# Equipos usados por mis_partidos.txt y partido_nuevo.txt (solo 11 jugadores)
+for codigo, nombre_equipo in [("ABC", "Equipo ABC"), ("DEF", "Equipo DEF")]:
+    equipo = sistema.crear_equipo().con_nombre(nombre_equipo).con_codigo(codigo)
+    for numero in range(1, 12):
+        equipo.agregar_jugador(numero, f"Jugador {numero} {codigo}")
+    sistema.registrar_equipo(equipo)
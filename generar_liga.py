@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Generación de ligas sintéticas como archivos del DSL externo
+Uso: python generar_liga.py datos/ --equipos 20 --partidos 1000 --semilla 7
+"""
+
+import sys
+
+from src.generador.generador import main
+
+if __name__ == "__main__":
+    sys.exit(main())
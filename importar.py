@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Importación en lote de archivos de partidos
+Uso: python importar.py --equipos ejemplos/equipos_ejemplo.py ejemplos/
+"""
+
+import sys
+
+from src.dsl_externo.importador import main
+
+if __name__ == "__main__":
+    sys.exit(main())
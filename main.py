@@ -4,21 +4,42 @@ Sistema de Gestión de Partidos de Fútbol
 Entregable 3 - DSL Interno y Externo
 """
 
+import argparse
+import os
+
 from src.menu import MenuPrincipal
 from src.dsl_interno import SistemaFutbol
+from src.persistencia import cargar_snapshot, guardar_snapshot
+from src import instrumentacion
 
 def main():
     """Función principal del sistema"""
+    argumentos = argparse.ArgumentParser(description="Sistema de gestión de partidos de fútbol")
+    argumentos.add_argument('--snapshot',
+                            help="Snapshot binario a cargar al iniciar y a guardar al salir")
+    argumentos.add_argument('--perfil', nargs='?', const='resumen', metavar='ARCHIVO',
+                            help="Muestra el tiempo por etapa al salir; con ARCHIVO guarda "
+                                 "además un perfil de cProfile")
+    args = argumentos.parse_args()
+    instrumentacion.configurar(args.perfil)
+    
     print("=" * 60)
     print("    SISTEMA DE GESTIÓN DE PARTIDOS DE FÚTBOL")
     print("=" * 60)
     
     # Inicializar el sistema
     sistema = SistemaFutbol()
+    if args.snapshot and os.path.exists(args.snapshot):
+        cargar_snapshot(args.snapshot, sistema)
+        print(f"📂 Snapshot cargado: {len(sistema.equipos)} equipos, {len(sistema.partidos)} partidos")
     
     # Crear y ejecutar el menú principal
     menu = MenuPrincipal(sistema)
     menu.ejecutar()
+    
+    if args.snapshot:
+        guardar_snapshot(sistema, args.snapshot)
+        print(f"💾 Snapshot guardado en {args.snapshot}")
 
 if __name__ == "__main__":
     main()
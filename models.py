@@ -1,6 +1,48 @@
+import sys
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
+from src.instrumentacion import contar, medido
+
+# Los eventos usan __slots__ (Python 3.10+) para no reservar un __dict__ por instancia
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class ListaVersionada(list):
+    """Lista que cuenta sus modificaciones.
+    
+    Cada operación que la modifica (agregar, quitar, reemplazar o reordenar
+    elementos) incrementa `version`, así los cachés derivados de la lista se
+    invalidan ante cualquier escritura y no solo cuando cambia su largo.
+    """
+    __slots__ = ('version',)
+    
+    def __init__(self, iterable: Iterable = ()):
+        super().__init__(iterable)
+        self.version = 0
+    
+    def __reduce__(self):
+        # Al copiar o deserializar se reconstruye con `__init__`; los cachés se recalculan una vez
+        return (ListaVersionada, (list(self),))
+
+
+def _modificacion(nombre: str) -> Callable:
+    original = getattr(list, nombre)
+    
+    def metodo(self, *args, **kwargs):
+        resultado = original(self, *args, **kwargs)
+        self.version += 1
+        return resultado
+    metodo.__name__ = nombre
+    return metodo
+
+
+for _nombre in ('append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse',
+                '__setitem__', '__delitem__', '__iadd__', '__imul__'):
+    setattr(ListaVersionada, _nombre, _modificacion(_nombre))
 
 
 @dataclass
@@ -19,27 +61,50 @@ class Equipo:
     nombre: str
     codigo: str
     jugadores: List[Jugador] = field(default_factory=list)
+    # Índice por número de camiseta, válido mientras `jugadores` sea la misma lista en la misma versión
+    _indice: Dict[int, Jugador] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _lista_indexada: Optional[ListaVersionada] = field(default=None, init=False, repr=False, compare=False)
+    _version_indice: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._reconstruir_indice()
+    
+    def _reconstruir_indice(self):
+        """Reconstruye el índice a partir de la lista de jugadores"""
+        if not isinstance(self.jugadores, ListaVersionada):
+            self.jugadores = ListaVersionada(self.jugadores)
+        self._indice = {jugador.numero: jugador for jugador in self.jugadores}
+        self._lista_indexada = self.jugadores
+        self._version_indice = self.jugadores.version
+    
+    def _sincronizar_indice(self):
+        """Reconstruye el índice si la lista de jugadores se reemplazó o modificó directamente"""
+        jugadores = self.jugadores
+        if jugadores is not self._lista_indexada or jugadores.version != self._version_indice:
+            self._reconstruir_indice()
     
     def agregar_jugador(self, numero: int, nombre: str) -> 'Equipo':
         """Agrega un jugador al equipo verificando que no se repita el número"""
-        if any(jugador.numero == numero for jugador in self.jugadores):
+        self._sincronizar_indice()
+        if numero in self._indice:
             raise ValueError(f"El número {numero} ya está ocupado en el equipo {self.nombre}")
         
-        self.jugadores.append(Jugador(numero, nombre))
+        jugador = Jugador(numero, nombre)
+        self.jugadores.append(jugador)
+        self._indice[numero] = jugador
+        self._version_indice = self.jugadores.version
         return self
     
     def obtener_jugador(self, numero: int) -> Optional[Jugador]:
         """Obtiene un jugador por su número de camiseta"""
-        for jugador in self.jugadores:
-            if jugador.numero == numero:
-                return jugador
-        return None
+        self._sincronizar_indice()
+        return self._indice.get(numero)
     
     def __str__(self):
         return f"{self.nombre} ({self.codigo})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Evento:
     """Representa un evento en un partido (gol, tarjeta, cambio)"""
     tiempo: int
@@ -49,7 +114,7 @@ class Evento:
         return f"Minuto {self.tiempo}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Gol(Evento):
     """Representa un gol en el partido"""
     autor: int  # número del jugador
@@ -60,7 +125,7 @@ class Gol(Evento):
         return f"Gol de {self.autor} para {self.equipo} al minuto {self.tiempo}{asistente_str}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Tarjeta(Evento):
     """Representa una tarjeta en el partido"""
     jugador: int  # número del jugador
@@ -70,7 +135,7 @@ class Tarjeta(Evento):
         return f"Tarjeta {self.color} para {self.jugador} ({self.equipo}) al minuto {self.tiempo}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Cambio(Evento):
     """Representa un cambio de jugador en el partido"""
     jugador_sale: int  # número del jugador que sale
@@ -93,34 +158,76 @@ class Partido:
     banco_local: List[int]  # números de camiseta
     banco_visitante: List[int]  # números de camiseta
     eventos: List[Evento] = field(default_factory=list)
+    # Marcador acumulado por equipo y resultado en caché, válidos mientras `eventos`
+    # sea la misma lista en la misma versión
+    _goles: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _lista_contada: Optional[ListaVersionada] = field(default=None, init=False, repr=False, compare=False)
+    _version_contada: int = field(default=0, init=False, repr=False, compare=False)
+    _resultado: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._recontar_goles()
+    
+    def _recontar_goles(self):
+        """Recalcula el marcador en una sola pasada por los eventos"""
+        if not isinstance(self.eventos, ListaVersionada):
+            self.eventos = ListaVersionada(self.eventos)
+        goles: Dict[str, int] = {}
+        for evento in self.eventos:
+            if isinstance(evento, Gol):
+                goles[evento.equipo] = goles.get(evento.equipo, 0) + 1
+        self._goles = goles
+        self._lista_contada = self.eventos
+        self._version_contada = self.eventos.version
+        self._resultado = None
+    
+    def _sincronizar_goles(self):
+        """Recalcula el marcador si la lista de eventos se reemplazó o modificó directamente"""
+        eventos = self.eventos
+        if eventos is not self._lista_contada or eventos.version != self._version_contada:
+            self._recontar_goles()
+    
+    def agregar_evento(self, evento: Evento):
+        """Agrega un evento ya construido al partido"""
+        self._sincronizar_goles()
+        self.eventos.append(evento)
+        self._version_contada = self.eventos.version
+        if isinstance(evento, Gol):
+            self._goles[evento.equipo] = self._goles.get(evento.equipo, 0) + 1
+            self._resultado = None
     
     def agregar_gol(self, equipo: str, tiempo: int, autor: int, asistente: Optional[int] = None):
         """Agrega un gol al partido"""
-        self.eventos.append(Gol(tiempo, equipo, autor, asistente))
+        self.agregar_evento(Gol(tiempo, equipo, autor, asistente))
     
     def agregar_tarjeta(self, equipo: str, tiempo: int, jugador: int, color: str):
         """Agrega una tarjeta al partido"""
-        self.eventos.append(Tarjeta(tiempo, equipo, jugador, color))
+        self.agregar_evento(Tarjeta(tiempo, equipo, jugador, color))
     
     def agregar_cambio(self, equipo: str, tiempo: int, jugador_sale: int, jugador_entra: int):
         """Agrega un cambio al partido"""
-        self.eventos.append(Cambio(tiempo, equipo, jugador_sale, jugador_entra))
+        self.agregar_evento(Cambio(tiempo, equipo, jugador_sale, jugador_entra))
     
     def obtener_goles_equipo(self, equipo: str) -> int:
         """Obtiene la cantidad de goles de un equipo"""
-        return len([evento for evento in self.eventos if isinstance(evento, Gol) and evento.equipo == equipo])
+        self._sincronizar_goles()
+        return self._goles.get(equipo, 0)
     
     def obtener_resultado(self) -> Dict[str, int]:
         """Obtiene el resultado del partido"""
-        goles_local = self.obtener_goles_equipo(self.equipo_local)
-        goles_visitante = self.obtener_goles_equipo(self.equipo_visitante)
-        
-        return {
-            'local': goles_local,
-            'visitante': goles_visitante,
-            'ganador': self.equipo_local if goles_local > goles_visitante else 
-                      self.equipo_visitante if goles_visitante > goles_local else None
-        }
+        self._sincronizar_goles()
+        if self._resultado is None:
+            goles_local = self._goles.get(self.equipo_local, 0)
+            goles_visitante = self._goles.get(self.equipo_visitante, 0)
+            
+            self._resultado = {
+                'local': goles_local,
+                'visitante': goles_visitante,
+                'ganador': self.equipo_local if goles_local > goles_visitante else 
+                          self.equipo_visitante if goles_visitante > goles_local else None
+            }
+        
+        return dict(self._resultado)
     
     def obtener_puntos_equipo(self, equipo: str) -> int:
         """Obtiene los puntos que suma un equipo en este partido"""
@@ -137,105 +244,915 @@ class Partido:
         return f"{self.fecha.strftime('%d/%m/%Y')} - {self.equipo_local} {resultado['local']}-{resultado['visitante']} {self.equipo_visitante}"
 
 
+# Duración reglamentaria usada para los minutos de quienes terminan el partido en cancha
+DURACION_PARTIDO = 90
+
+
+class EventoImposible(ValueError):
+    """Evento que no puede ocurrir dado el estado actual del partido"""
+
+
+class EstadoPartido:
+    """Estado en vivo de un partido, actualizado evento por evento.
+    
+    Mantiene los jugadores en cancha y disponibles en el banco, amarillas,
+    expulsados, el marcador y los minutos de entrada y salida de cada
+    jugador, de modo que cada evento se valida y aplica en O(1) sin repasar
+    los anteriores. Los eventos deben llegar en orden cronológico; una
+    segunda amarilla expulsa al jugador como una roja.
+    """
+    
+    def __init__(self, equipo_local: str, equipo_visitante: str,
+                 titulares_local: List[int], titulares_visitante: List[int],
+                 banco_local: List[int], banco_visitante: List[int], duracion: int = DURACION_PARTIDO):
+        self.equipo_local = equipo_local
+        self.equipo_visitante = equipo_visitante
+        self.duracion = duracion
+        self.minuto = 0
+        self.finalizado = False
+        self._en_cancha: Dict[str, set] = {equipo_local: set(titulares_local),
+                                           equipo_visitante: set(titulares_visitante)}
+        # Suplentes que todavía pueden entrar (un titular listado en el banco no cuenta)
+        self._disponibles: Dict[str, set] = {equipo_local: set(banco_local) - set(titulares_local),
+                                             equipo_visitante: set(banco_visitante) - set(titulares_visitante)}
+        self._plantel: Dict[str, set] = {equipo_local: set(titulares_local) | set(banco_local),
+                                         equipo_visitante: set(titulares_visitante) | set(banco_visitante)}
+        self._goles: Dict[str, int] = {equipo_local: 0, equipo_visitante: 0}
+        self._amarillas: Dict[Tuple[str, int], int] = {}
+        self._expulsados: set = set()
+        self._entrada: Dict[Tuple[str, int], int] = {}
+        self._salida: Dict[Tuple[str, int], int] = {}
+        for equipo, titulares in ((equipo_local, titulares_local), (equipo_visitante, titulares_visitante)):
+            for numero in titulares:
+                self._entrada[(equipo, numero)] = 0
+    
+    @classmethod
+    def desde_partido(cls, partido: 'Partido', duracion: int = DURACION_PARTIDO) -> 'EstadoPartido':
+        """Reconstruye el estado final de un partido aplicando sus eventos por minuto"""
+        estado = cls(partido.equipo_local, partido.equipo_visitante,
+                     partido.titulares_local, partido.titulares_visitante,
+                     partido.banco_local, partido.banco_visitante, duracion)
+        for evento in sorted(partido.eventos, key=lambda e: e.tiempo):
+            estado.aplicar(evento)
+        estado.finalizar()
+        return estado
+    
+    def aplicar(self, evento: Evento):
+        """Valida y aplica un evento; lanza EventoImposible sin modificar el estado"""
+        if self.finalizado:
+            raise EventoImposible("El partido ya finalizó")
+        equipo = evento.equipo
+        if equipo not in self._en_cancha:
+            raise EventoImposible(f"El equipo {equipo} no juega este partido")
+        if evento.tiempo < self.minuto:
+            raise EventoImposible(f"Minuto {evento.tiempo} anterior al último evento (minuto {self.minuto})")
+        
+        en_cancha = self._en_cancha[equipo]
+        if isinstance(evento, Gol):
+            if evento.autor not in en_cancha:
+                raise EventoImposible(f"El jugador {evento.autor} de {equipo} no está en cancha")
+            if evento.asistente is not None:
+                if evento.asistente == evento.autor:
+                    raise EventoImposible(f"El asistente {evento.asistente} de {equipo} no puede ser "
+                                          f"el autor del gol")
+                if evento.asistente not in en_cancha:
+                    raise EventoImposible(f"El asistente {evento.asistente} de {equipo} no está en cancha")
+            self._goles[equipo] += 1
+        
+        elif isinstance(evento, Tarjeta):
+            clave = (equipo, evento.jugador)
+            if evento.jugador not in self._plantel[equipo]:
+                raise EventoImposible(f"El jugador {evento.jugador} no está en el plantel de {equipo}")
+            if clave in self._expulsados:
+                raise EventoImposible(f"El jugador {evento.jugador} de {equipo} ya fue expulsado")
+            if evento.color.upper() == 'AMARILLA':
+                self._amarillas[clave] = self._amarillas.get(clave, 0) + 1
+                expulsion = self._amarillas[clave] >= 2
+            else:
+                expulsion = True
+            if expulsion:
+                self._expulsados.add(clave)
+                self._disponibles[equipo].discard(evento.jugador)
+                if evento.jugador in en_cancha:
+                    en_cancha.remove(evento.jugador)
+                    self._salida[clave] = evento.tiempo
+        
+        elif isinstance(evento, Cambio):
+            if evento.jugador_sale not in en_cancha:
+                raise EventoImposible(f"El jugador {evento.jugador_sale} de {equipo} no está en cancha")
+            if evento.jugador_entra not in self._disponibles[equipo]:
+                raise EventoImposible(f"El jugador {evento.jugador_entra} de {equipo} no puede ingresar")
+            en_cancha.remove(evento.jugador_sale)
+            en_cancha.add(evento.jugador_entra)
+            self._disponibles[equipo].remove(evento.jugador_entra)
+            self._salida[(equipo, evento.jugador_sale)] = evento.tiempo
+            self._entrada[(equipo, evento.jugador_entra)] = evento.tiempo
+        
+        self.minuto = evento.tiempo
+    
+    def finalizar(self):
+        """Marca el partido como terminado; no se aceptan más eventos"""
+        self.finalizado = True
+    
+    def en_cancha(self, equipo: str) -> frozenset:
+        """Números de los jugadores de un equipo que están en cancha"""
+        return frozenset(self._en_cancha.get(equipo, ()))
+    
+    def esta_en_cancha(self, equipo: str, numero: int) -> bool:
+        return numero in self._en_cancha.get(equipo, ())
+    
+    def esta_expulsado(self, equipo: str, numero: int) -> bool:
+        return (equipo, numero) in self._expulsados
+    
+    def amarillas(self, equipo: str, numero: int) -> int:
+        return self._amarillas.get((equipo, numero), 0)
+    
+    def marcador(self) -> Dict[str, int]:
+        """Goles de local y de visitante hasta el momento"""
+        return {'local': self._goles[self.equipo_local], 'visitante': self._goles[self.equipo_visitante]}
+    
+    def minutos_jugados(self, equipo: str, numero: int) -> int:
+        """Minutos en cancha de un jugador hasta el minuto actual (o el final del partido)"""
+        entrada = self._entrada.get((equipo, numero))
+        if entrada is None:
+            return 0
+        salida = self._salida.get((equipo, numero))
+        if salida is None:
+            salida = max(self.minuto, self.duracion) if self.finalizado else self.minuto
+        return max(salida - entrada, 0)
+
+
+class RegistroEquipos:
+    """Códigos de equipo internados, cada uno con un identificador entero denso.
+    
+    El primer código visto recibe el 0, el siguiente el 1, etc. Los agregados
+    usan el identificador para indexar listas en lugar de diccionarios por
+    código, y `internar` devuelve siempre el mismo objeto `str` para un mismo
+    código, de modo que partidos y eventos no guardan una copia cada uno.
+    """
+    
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._codigos: List[str] = []
+    
+    def id(self, codigo: str) -> int:
+        """Identificador del código, asignándole uno nuevo si no estaba registrado"""
+        id_equipo = self._ids.get(codigo)
+        if id_equipo is None:
+            codigo = sys.intern(codigo)
+            id_equipo = self._ids[codigo] = len(self._codigos)
+            self._codigos.append(codigo)
+        return id_equipo
+    
+    def buscar(self, codigo: str) -> Optional[int]:
+        """Identificador del código, o None si no está registrado"""
+        return self._ids.get(codigo)
+    
+    def codigo(self, id_equipo: int) -> str:
+        """Código internado de un identificador"""
+        return self._codigos[id_equipo]
+    
+    def internar(self, codigo: str) -> str:
+        """Devuelve el objeto `str` compartido del código, registrándolo si es nuevo"""
+        return self._codigos[self.id(codigo)]
+    
+    def __len__(self) -> int:
+        return len(self._codigos)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._codigos)
+
+
+# Puntos de fair play por tarjeta (menos es mejor)
+PUNTOS_FAIR_PLAY = {'AMARILLA': 1, 'ROJA': 3}
+
+
+def puntos_fair_play(color: str) -> int:
+    """Devuelve la penalización de fair play de una tarjeta"""
+    return PUNTOS_FAIR_PLAY.get(color.upper(), 0)
+
+
+def _puntos_partido(partido: 'Partido') -> Tuple[int, int, int, int]:
+    """Devuelve (goles local, goles visitante, puntos local, puntos visitante) de un partido"""
+    resultado = partido.obtener_resultado()
+    if resultado['ganador'] == partido.equipo_local:
+        puntos_local, puntos_visitante = 3, 0
+    elif resultado['ganador'] == partido.equipo_visitante:
+        puntos_local, puntos_visitante = 0, 3
+    else:  # empate
+        puntos_local, puntos_visitante = 1, 1
+    return resultado['local'], resultado['visitante'], puntos_local, puntos_visitante
+
+
+def _clave_base(stats: Dict, orden: int) -> Tuple:
+    """Clave compuesta de clasificación sin el enfrentamiento directo"""
+    return (-stats['puntos'], -stats['diferencia_goles'], -stats['goles_a_favor'],
+            stats['puntos_fair_play'], orden, stats['equipo'])
+
+
+def resolver_empates(filas: List[Dict],
+                     cara_a_cara: Callable[[List[str]], Iterable[Tuple[str, int, int, int]]]) -> List[Dict]:
+    """Aplica el desempate por enfrentamientos directos a filas ya ordenadas.
+    
+    `filas` debe venir ordenada por puntos, diferencia de gol, goles a favor,
+    fair play y orden de registro. Solo los grupos empatados en los tres
+    primeros criterios consultan `cara_a_cara(grupo)`, que devuelve tuplas
+    (equipo, puntos, goles a favor, goles en contra) de los partidos jugados
+    entre los equipos del grupo. Cada grupo se reordena por la mini tabla
+    resultante; como el orden es estable, los empates que persisten se
+    resuelven por fair play y luego por orden de registro.
+    """
+    resultado: List[Dict] = []
+    inicio = 0
+    while inicio < len(filas):
+        fila = filas[inicio]
+        criterio = (fila['puntos'], fila['diferencia_goles'], fila['goles_a_favor'])
+        fin = inicio + 1
+        while fin < len(filas) and (filas[fin]['puntos'], filas[fin]['diferencia_goles'],
+                                    filas[fin]['goles_a_favor']) == criterio:
+            fin += 1
+        
+        grupo = filas[inicio:fin]
+        if len(grupo) > 1:
+            mini_tabla = {f['equipo']: [0, 0, 0] for f in grupo}
+            for codigo, puntos, goles_a_favor, goles_en_contra in cara_a_cara(list(mini_tabla)):
+                acumulado = mini_tabla[codigo]
+                acumulado[0] += puntos
+                acumulado[1] += goles_a_favor - goles_en_contra
+                acumulado[2] += goles_a_favor
+            grupo.sort(key=lambda f: [-valor for valor in mini_tabla[f['equipo']]])
+        resultado.extend(grupo)
+        inicio = fin
+    
+    return resultado
+
+
+class TablaPosiciones:
+    """Tabla de posiciones mantenida de forma incremental.
+    
+    Cada partido actualiza solo las estadísticas de sus dos equipos y reubica
+    sus claves en una lista ordenada, de modo que la tabla siempre está lista
+    para consultarse sin recorrer los partidos.
+    
+    Criterios de desempate, en orden: puntos, diferencia de gol, goles a favor,
+    enfrentamientos directos entre los equipos empatados (puntos, diferencia
+    y goles), fair play y orden de registro. Los enfrentamientos directos se
+    acumulan por pareja de equipos y solo se consultan para los grupos
+    empatados. Con `cara_a_cara` la tabla no los acumula: la función los
+    calcula a demanda para cada grupo empatado (ver `resolver_empates`).
+    """
+    
+    def __init__(self, registro: Optional[RegistroEquipos] = None,
+                 cara_a_cara: Optional[Callable[[List[str]], Iterable[Tuple[str, int, int, int]]]] = None):
+        self._registro = registro if registro is not None else RegistroEquipos()
+        # Por identificador de equipo (ver RegistroEquipos); None si no está en la tabla
+        self._estadisticas: List[Optional[Dict]] = []
+        self._orden: List[int] = []
+        # Por equipo y rival: [puntos, goles a favor, goles en contra] entre ambos;
+        # None si los enfrentamientos se calculan a demanda con `cara_a_cara`
+        self._cara_a_cara: Optional[List[Optional[Dict[int, List[int]]]]] = [] if cara_a_cara is None else None
+        self._calcular_cara_a_cara = cara_a_cara
+        # Códigos en orden de registro en la tabla
+        self._codigos: List[str] = []
+        # Claves compuestas (ver _clave_base) ordenadas ascendentemente
+        self._clasificacion: List[Tuple] = []
+        self._filas: Optional[List[Dict]] = None
+    
+    def registrar_equipo(self, codigo: str) -> int:
+        """Agrega un equipo a la tabla con estadísticas en cero y devuelve su identificador"""
+        id_equipo = self._registro.id(codigo)
+        if id_equipo < len(self._estadisticas) and self._estadisticas[id_equipo] is not None:
+            return id_equipo
+        
+        faltan = id_equipo + 1 - len(self._estadisticas)
+        if faltan > 0:
+            self._estadisticas.extend([None] * faltan)
+            self._orden.extend([-1] * faltan)
+            if self._cara_a_cara is not None:
+                self._cara_a_cara.extend([None] * faltan)
+        
+        codigo = self._registro.codigo(id_equipo)
+        orden = len(self._codigos)
+        self._codigos.append(codigo)
+        stats = {
+            'equipo': codigo,
+            'partidos_jugados': 0,
+            'ganados': 0,
+            'empatados': 0,
+            'perdidos': 0,
+            'goles_a_favor': 0,
+            'goles_en_contra': 0,
+            'diferencia_goles': 0,
+            'puntos': 0,
+            'puntos_fair_play': 0
+        }
+        self._estadisticas[id_equipo] = stats
+        self._orden[id_equipo] = orden
+        if self._cara_a_cara is not None:
+            self._cara_a_cara[id_equipo] = {}
+        insort(self._clasificacion, _clave_base(stats, orden))
+        self._filas = None
+        return id_equipo
+    
+    def codigos(self) -> List[str]:
+        """Códigos de los equipos de la tabla en orden de registro"""
+        return list(self._codigos)
+    
+    @medido('agregados.tabla_posiciones')
+    def registrar_partido(self, partido: 'Partido'):
+        """Suma el resultado de un partido a la tabla"""
+        local = partido.equipo_local
+        visitante = partido.equipo_visitante
+        goles_local, goles_visitante, puntos_local, puntos_visitante = _puntos_partido(partido)
+        
+        fair_play_local = fair_play_visitante = 0
+        for evento in partido.eventos:
+            if isinstance(evento, Tarjeta):
+                if evento.equipo == local:
+                    fair_play_local += puntos_fair_play(evento.color)
+                elif evento.equipo == visitante:
+                    fair_play_visitante += puntos_fair_play(evento.color)
+        if local == visitante:
+            fair_play_visitante = fair_play_local
+        
+        id_local = self.registrar_equipo(local)
+        id_visitante = self.registrar_equipo(visitante)
+        self._sumar_resultado(id_local, goles_local, goles_visitante, puntos_local, fair_play_local)
+        self._sumar_resultado(id_visitante, goles_visitante, goles_local, puntos_visitante,
+                              fair_play_visitante)
+        if id_local != id_visitante and self._cara_a_cara is not None:
+            self._sumar_enfrentamiento(id_local, id_visitante, puntos_local, goles_local, goles_visitante)
+            self._sumar_enfrentamiento(id_visitante, id_local, puntos_visitante, goles_visitante, goles_local)
+    
+    def _sumar_resultado(self, id_equipo: int, goles_a_favor: int, goles_en_contra: int, puntos: int,
+                         fair_play: int = 0):
+        """Actualiza las estadísticas de un equipo ya registrado y su posición en la clasificación"""
+        stats = self._estadisticas[id_equipo]
+        orden = self._orden[id_equipo]
+        
+        # Quitar la clave vieja antes de modificar las estadísticas
+        clave = _clave_base(stats, orden)
+        del self._clasificacion[bisect_left(self._clasificacion, clave)]
+        
+        stats['partidos_jugados'] += 1
+        stats['goles_a_favor'] += goles_a_favor
+        stats['goles_en_contra'] += goles_en_contra
+        stats['diferencia_goles'] += goles_a_favor - goles_en_contra
+        stats['puntos'] += puntos
+        stats['puntos_fair_play'] += fair_play
+        if puntos == 3:
+            stats['ganados'] += 1
+        elif puntos == 1:
+            stats['empatados'] += 1
+        else:
+            stats['perdidos'] += 1
+        
+        insort(self._clasificacion, _clave_base(stats, orden))
+        self._filas = None
+    
+    def _sumar_enfrentamiento(self, id_equipo: int, id_rival: int, puntos: int, goles_a_favor: int,
+                              goles_en_contra: int):
+        """Acumula el resultado de un equipo contra un rival"""
+        acumulado = self._cara_a_cara[id_equipo].setdefault(id_rival, [0, 0, 0])
+        acumulado[0] += puntos
+        acumulado[1] += goles_a_favor
+        acumulado[2] += goles_en_contra
+    
+    def _enfrentamientos_entre(self, grupo: List[str]) -> Iterator[Tuple[str, int, int, int]]:
+        """Recorre los resultados acumulados entre los equipos de `grupo`"""
+        ids = [self._registro.id(codigo) for codigo in grupo]
+        miembros = set(ids)
+        for codigo, id_equipo in zip(grupo, ids):
+            rivales = self._cara_a_cara[id_equipo]
+            # Recorrer el lado más chico: los rivales del equipo o el grupo
+            if len(rivales) <= len(miembros):
+                for id_rival, (puntos, goles_a_favor, goles_en_contra) in rivales.items():
+                    if id_rival in miembros:
+                        yield codigo, puntos, goles_a_favor, goles_en_contra
+            else:
+                for id_rival in ids:
+                    acumulado = rivales.get(id_rival)
+                    if acumulado:
+                        yield (codigo, *acumulado)
+    
+    def filas(self) -> List[Dict]:
+        """Devuelve copias de las estadísticas en orden de clasificación"""
+        if self._filas is None:
+            ids = self._registro.buscar
+            ordenadas = [self._estadisticas[ids(clave[-1])] for clave in self._clasificacion]
+            self._filas = resolver_empates(ordenadas, self._calcular_cara_a_cara or self._enfrentamientos_entre)
+        return [dict(stats) for stats in self._filas]
+    
+    def copiar(self, cara_a_cara: Optional[Callable[[List[str]], Iterable[Tuple[str, int, int, int]]]] = None
+               ) -> 'TablaPosiciones':
+        """Devuelve una copia independiente de la tabla, con el mismo registro de equipos.
+        
+        Si la tabla acumula enfrentamientos directos la copia también los
+        lleva; si no, la copia tiene solo los totales por equipo y los
+        enfrentamientos los calcula `cara_a_cara`.
+        """
+        copia = TablaPosiciones(self._registro, cara_a_cara)
+        copia._estadisticas = [dict(stats) if stats is not None else None for stats in self._estadisticas]
+        copia._orden = list(self._orden)
+        if self._cara_a_cara is not None:
+            copia._cara_a_cara = [{rival: list(acumulado) for rival, acumulado in rivales.items()}
+                                  if rivales is not None else None for rivales in self._cara_a_cara]
+            copia._calcular_cara_a_cara = None
+        else:
+            copia._cara_a_cara = None
+        copia._codigos = list(self._codigos)
+        copia._clasificacion = list(self._clasificacion)
+        return copia
+
+
+class HistorialPosiciones:
+    """Puntos de control de la tabla de posiciones en orden de fecha.
+    
+    El punto de control i guarda los totales por equipo tras los primeros
+    (i + 1) * `intervalo` partidos ordenados por fecha, sin los enfrentamientos
+    directos, así cada uno ocupa lo mismo que la lista de equipos y no crece
+    con la cantidad de parejas que se enfrentaron. Una tabla histórica se
+    reconstruye copiando el punto de control más cercano y aplicando solo los
+    partidos posteriores; los enfrentamientos directos de un grupo empatado se
+    calculan a demanda con los partidos del rango. Los puntos de control se
+    crean a demanda; un partido insertado con una fecha anterior invalida los
+    que quedan detrás de él.
+    """
+    
+    def __init__(self, intervalo: int = 256, registro: Optional[RegistroEquipos] = None):
+        self.intervalo = intervalo
+        self._registro = registro
+        self._puntos_control: List[TablaPosiciones] = []
+    
+    def invalidar_desde(self, posicion: int):
+        """Descarta los puntos de control que incluyen la posición `posicion` del orden por fecha"""
+        del self._puntos_control[posicion // self.intervalo:]
+    
+    def tabla_tras(self, cantidad: int, indice_fechas: List[Tuple[datetime, int]],
+                   partidos: List['Partido'], codigos: List[str],
+                   cara_a_cara: Callable[[List[str]], Iterable[Tuple[str, int, int, int]]]) -> TablaPosiciones:
+        """Devuelve la tabla tras los primeros `cantidad` partidos de `indice_fechas`.
+        
+        `codigos` son los equipos registrados en orden de registro, para que
+        la tabla histórica desempate igual que la actual, y `cara_a_cara`
+        devuelve los enfrentamientos directos de un grupo dentro de esos
+        mismos partidos.
+        """
+        usados = min(cantidad // self.intervalo, len(self._puntos_control))
+        if usados:
+            tabla = self._puntos_control[usados - 1].copiar(cara_a_cara)
+        else:
+            tabla = TablaPosiciones(self._registro, cara_a_cara)
+        for codigo in codigos:
+            tabla.registrar_equipo(codigo)
+        
+        aplicados = usados * self.intervalo
+        while aplicados < cantidad:
+            _, posicion = indice_fechas[aplicados]
+            tabla.registrar_partido(partidos[posicion])
+            aplicados += 1
+            if aplicados == (len(self._puntos_control) + 1) * self.intervalo:
+                self._puntos_control.append(tabla.copiar())
+        
+        return tabla
+
+
+class TablaGoleadores:
+    """Ranking de goleadores mantenido de forma incremental.
+    
+    Los jugadores se identifican por (código de equipo, número de camiseta) y
+    se agrupan por cantidad de goles, así subir un gol mueve al jugador de un
+    grupo al siguiente sin reordenar el ranking. Dentro de un mismo grupo el
+    orden es el de llegada a esa cantidad de goles.
+    """
+    
+    def __init__(self):
+        self._goles: Dict[Tuple[str, int], int] = {}
+        self._por_cantidad: Dict[int, Dict[Tuple[str, int], None]] = {}
+        self._por_equipo: Dict[str, Dict[int, int]] = {}
+        self._maximo = 0
+    
+    def registrar_gol(self, equipo: str, numero: int):
+        """Suma un gol al jugador indicado"""
+        clave = (equipo, numero)
+        goles = self._goles.get(clave, 0)
+        if goles:
+            grupo = self._por_cantidad[goles]
+            del grupo[clave]
+            if not grupo:
+                del self._por_cantidad[goles]
+        
+        goles += 1
+        self._goles[clave] = goles
+        self._por_cantidad.setdefault(goles, {})[clave] = None
+        self._por_equipo.setdefault(equipo, {})[numero] = goles
+        if goles > self._maximo:
+            self._maximo = goles
+    
+    @medido('agregados.tabla_goleadores')
+    def registrar_partido(self, partido: 'Partido'):
+        """Suma los goles de un partido al ranking"""
+        for evento in partido.eventos:
+            if isinstance(evento, Gol):
+                self.registrar_gol(evento.equipo, evento.autor)
+    
+    def iterar(self) -> Iterator[Tuple[str, int, int]]:
+        """Recorre (equipo, número, goles) de mayor a menor cantidad de goles"""
+        for goles in range(self._maximo, 0, -1):
+            grupo = self._por_cantidad.get(goles)
+            if grupo:
+                for equipo, numero in grupo:
+                    yield equipo, numero, goles
+    
+    def top(self, k: int) -> List[Tuple[str, int, int]]:
+        """Devuelve los k máximos goleadores"""
+        resultado = []
+        for entrada in self.iterar():
+            if len(resultado) >= k:
+                break
+            resultado.append(entrada)
+        return resultado
+    
+    def por_equipo(self, codigo: str) -> List[Tuple[int, int]]:
+        """Devuelve (número, goles) de los goleadores de un equipo"""
+        goleadores = self._por_equipo.get(codigo, {})
+        return sorted(goleadores.items(), key=lambda item: item[1], reverse=True)
+
+
+class EstadisticasJugadores:
+    """Estadísticas acumuladas por jugador, mantenidas de forma incremental.
+    
+    Cada partido se procesa una sola vez al agregarse, recorriendo sus eventos
+    en orden de minuto: titulares entran en el minuto 0, los cambios y las
+    expulsiones (roja o segunda amarilla) marcan entradas y salidas, y quien
+    termina en cancha suma hasta el final del partido (90 minutos o el último
+    evento, si es posterior). A diferencia de `EstadoPartido` no se rechaza
+    ningún evento: los datos inconsistentes se cuentan como vienen.
+    """
+    
+    CAMPOS = ('partidos', 'titular', 'minutos', 'goles', 'asistencias', 'amarillas', 'rojas', 'expulsiones')
+    
+    def __init__(self, registro: Optional[RegistroEquipos] = None):
+        self._registro = registro if registro is not None else RegistroEquipos()
+        # Por identificador de equipo, estadísticas de cada número de camiseta
+        self._estadisticas: List[Dict[int, Dict[str, int]]] = []
+        # (equipo, número, estadísticas) en el orden en que apareció cada jugador
+        self._orden: List[Tuple[str, int, Dict[str, int]]] = []
+    
+    def _jugadores_equipo(self, codigo: str) -> Dict[int, Dict[str, int]]:
+        id_equipo = self._registro.id(codigo)
+        while len(self._estadisticas) <= id_equipo:
+            self._estadisticas.append({})
+        return self._estadisticas[id_equipo]
+    
+    def _nuevo(self, codigo: str, jugadores: Dict[int, Dict[str, int]], numero: int) -> Dict[str, int]:
+        stats = jugadores[numero] = dict.fromkeys(self.CAMPOS, 0)
+        self._orden.append((codigo, numero, stats))
+        return stats
+    
+    @medido('agregados.estadisticas_jugadores')
+    def registrar_partido(self, partido: 'Partido'):
+        """Suma las estadísticas de todos los jugadores de un partido"""
+        # Por equipo: (código, estadísticas del equipo, minuto de entrada, de salida y amarillas por número)
+        equipos: Dict[str, Tuple[str, Dict, Dict[int, int], Dict[int, int], Dict[int, int]]] = {}
+        # Jugadores que pisaron la cancha, en orden de entrada
+        en_cancha: List[Tuple[Tuple, int]] = []
+        for codigo, titulares in ((partido.equipo_local, partido.titulares_local),
+                                  (partido.equipo_visitante, partido.titulares_visitante)):
+            if codigo not in equipos:
+                equipos[codigo] = (codigo, self._jugadores_equipo(codigo), {}, {}, {})
+            datos = equipos[codigo]
+            entrada = datos[2]
+            for numero in titulares:
+                if numero not in entrada:
+                    en_cancha.append((datos, numero))
+                entrada[numero] = 0
+        
+        nuevo = self._nuevo
+        fin = DURACION_PARTIDO
+        for evento in sorted(partido.eventos, key=_tiempo_evento):
+            if evento.tiempo > fin:
+                fin = evento.tiempo
+            datos = equipos.get(evento.equipo)
+            if datos is None:
+                # Evento de un equipo que no juega el partido: se cuenta igual
+                datos = equipos[evento.equipo] = (evento.equipo, self._jugadores_equipo(evento.equipo), {}, {}, {})
+            codigo, jugadores, entrada, salida, amarillas = datos
+            if isinstance(evento, Gol):
+                stats = jugadores.get(evento.autor) or nuevo(codigo, jugadores, evento.autor)
+                stats['goles'] += 1
+                if evento.asistente is not None:
+                    stats = jugadores.get(evento.asistente) or nuevo(codigo, jugadores, evento.asistente)
+                    stats['asistencias'] += 1
+            elif isinstance(evento, Tarjeta):
+                numero = evento.jugador
+                stats = jugadores.get(numero) or nuevo(codigo, jugadores, numero)
+                if evento.color.upper() == 'AMARILLA':
+                    stats['amarillas'] += 1
+                    amarillas[numero] = amarillas.get(numero, 0) + 1
+                    expulsion = amarillas[numero] == 2
+                else:
+                    stats['rojas'] += 1
+                    expulsion = True
+                if expulsion:
+                    stats['expulsiones'] += 1
+                    if numero in entrada and numero not in salida:
+                        salida[numero] = evento.tiempo
+            elif isinstance(evento, Cambio):
+                sale = evento.jugador_sale
+                if sale in entrada and sale not in salida:
+                    salida[sale] = evento.tiempo
+                if evento.jugador_entra not in entrada:
+                    entrada[evento.jugador_entra] = evento.tiempo
+                    en_cancha.append((datos, evento.jugador_entra))
+        
+        for (codigo, jugadores, entrada, salida, _), numero in en_cancha:
+            stats = jugadores.get(numero) or nuevo(codigo, jugadores, numero)
+            minuto_entrada = entrada[numero]
+            stats['partidos'] += 1
+            if minuto_entrada == 0:
+                stats['titular'] += 1
+            minutos = salida.get(numero, fin) - minuto_entrada
+            if minutos > 0:
+                stats['minutos'] += minutos
+    
+    def obtener(self, equipo: str, numero: int) -> Optional[Dict]:
+        """Devuelve una copia de las estadísticas de un jugador con tasas cada 90 minutos"""
+        id_equipo = self._registro.buscar(equipo)
+        if id_equipo is None or id_equipo >= len(self._estadisticas):
+            return None
+        stats = self._estadisticas[id_equipo].get(numero)
+        return _con_tasas(stats) if stats is not None else None
+    
+    def iterar(self) -> Iterator[Tuple[str, int, Dict]]:
+        """Recorre (equipo, número, estadísticas) de todos los jugadores con estadísticas"""
+        for codigo, numero, stats in self._orden:
+            yield codigo, numero, _con_tasas(stats)
+
+
+def _tiempo_evento(evento: Evento) -> int:
+    return evento.tiempo
+
+
+def _con_tasas(stats: Dict[str, int]) -> Dict:
+    """Copia de las estadísticas con goles, asistencias y tarjetas cada 90 minutos"""
+    fila = dict(stats)
+    minutos = stats['minutos']
+    for campo in ('goles', 'asistencias', 'amarillas'):
+        fila[f'{campo}_por_90'] = stats[campo] * 90 / minutos if minutos else 0.0
+    return fila
+
+
+@dataclass
+class PaginaPartidos:
+    """Página de resultados de una consulta de partidos"""
+    partidos: List[Partido]
+    pagina: int
+    por_pagina: int
+    total: int
+    
+    @property
+    def total_paginas(self) -> int:
+        return max(1, -(-self.total // self.por_pagina))
+    
+    @property
+    def inicio(self) -> int:
+        """Posición (desde 1) del primer partido de la página dentro del total"""
+        return (self.pagina - 1) * self.por_pagina + 1
+
+
+class Almacenamiento(ABC):
+    """Interfaz de los backends de almacenamiento persistente del sistema"""
+    
+    @abstractmethod
+    def guardar_equipo(self, equipo: Equipo):
+        """Guarda un equipo con sus jugadores"""
+    
+    @abstractmethod
+    def guardar_partido(self, partido: Partido):
+        """Guarda un partido con sus eventos (puede quedar pendiente hasta confirmar)"""
+    
+    @abstractmethod
+    def cargar_sistema(self, sistema: Optional['SistemaFutbol'] = None) -> 'SistemaFutbol':
+        """Agrega a `sistema` (o a uno nuevo) los equipos y partidos guardados y lo devuelve"""
+    
+    def confirmar(self):
+        """Escribe las operaciones pendientes"""
+
+
 class SistemaFutbol:
     """Sistema principal para gestionar equipos y partidos"""
     
-    def __init__(self):
+    def __init__(self, almacenamiento: Optional[Almacenamiento] = None):
         self.equipos: Dict[str, Equipo] = {}
         self.partidos: List[Partido] = []
+        self.almacenamiento = almacenamiento
+        # Índices ordenados por fecha de claves (fecha, posición en self.partidos)
+        self._indice_fechas: List[Tuple[datetime, int]] = []
+        self._indice_equipos: Dict[str, List[Tuple[datetime, int]]] = {}
+        self._indice_enfrentamientos: Dict[Tuple[str, str], List[Tuple[datetime, int]]] = {}
+        # Registro compartido por los agregados: cada código tiene un único objeto str y un id
+        self._registro = RegistroEquipos()
+        self._tabla_posiciones = TablaPosiciones(self._registro)
+        self._historial_posiciones = HistorialPosiciones(registro=self._registro)
+        self._tabla_goleadores = TablaGoleadores()
+        self._estadisticas_jugadores = EstadisticasJugadores(self._registro)
+        # Cuenta los equipos y partidos agregados, para invalidar cachés derivados del sistema
+        self.version = 0
     
     def agregar_equipo(self, equipo: Equipo):
         """Agrega un equipo al sistema"""
+        self.version += 1
+        equipo.codigo = self._registro.internar(equipo.codigo)
         self.equipos[equipo.codigo] = equipo
+        self._tabla_posiciones.registrar_equipo(equipo.codigo)
+        if self.almacenamiento:
+            self.almacenamiento.guardar_equipo(equipo)
     
     def obtener_equipo(self, codigo: str) -> Optional[Equipo]:
         """Obtiene un equipo por su código"""
         return self.equipos.get(codigo)
     
+    def id_equipo(self, codigo: str) -> Optional[int]:
+        """Identificador entero denso de un código (en orden de aparición), o None si no se vio"""
+        return self._registro.buscar(codigo)
+    
+    def codigo_equipo(self, id_equipo: int) -> str:
+        """Código de un identificador devuelto por `id_equipo`"""
+        return self._registro.codigo(id_equipo)
+    
+    def _internar_codigos(self, partido: Partido):
+        """Reemplaza los códigos del partido y sus eventos por los objetos str del registro"""
+        internar = self._registro.internar
+        partido.equipo_local = internar(partido.equipo_local)
+        partido.equipo_visitante = internar(partido.equipo_visitante)
+        anterior = None
+        for evento in partido.eventos:
+            # Los eventos seguidos del mismo equipo suelen compartir el objeto
+            if evento.equipo is not anterior:
+                anterior = evento.equipo
+                codigo = internar(anterior)
+            evento.equipo = codigo
+    
+    @medido('sistema.agregar_partido')
     def agregar_partido(self, partido: Partido):
-        """Agrega un partido al sistema"""
+        """Agrega un partido al sistema y actualiza tablas e índices"""
+        contar('partidos_agregados')
+        self.version += 1
+        self._internar_codigos(partido)
+        clave = (partido.fecha, len(self.partidos))
         self.partidos.append(partido)
+        posicion = bisect_right(self._indice_fechas, clave)
+        self._indice_fechas.insert(posicion, clave)
+        self._historial_posiciones.invalidar_desde(posicion)
+        insort(self._indice_equipos.setdefault(partido.equipo_local, []), clave)
+        if partido.equipo_visitante != partido.equipo_local:
+            insort(self._indice_equipos.setdefault(partido.equipo_visitante, []), clave)
+        insort(self._indice_enfrentamientos.setdefault(
+            _clave_enfrentamiento(partido.equipo_local, partido.equipo_visitante), []), clave)
+        self._tabla_posiciones.registrar_partido(partido)
+        self._tabla_goleadores.registrar_partido(partido)
+        self._estadisticas_jugadores.registrar_partido(partido)
+        if self.almacenamiento:
+            self.almacenamiento.guardar_partido(partido)
     
-    def obtener_tabla_posiciones(self) -> List[Dict]:
-        """Obtiene la tabla de posiciones ordenada por puntos"""
-        estadisticas = {}
-        
-        # Inicializar estadísticas de todos los equipos
-        for codigo in self.equipos.keys():
-            estadisticas[codigo] = {
-                'equipo': codigo,
-                'partidos_jugados': 0,
-                'ganados': 0,
-                'empatados': 0,
-                'perdidos': 0,
-                'goles_a_favor': 0,
-                'goles_en_contra': 0,
-                'puntos': 0
-            }
+    def confirmar_almacenamiento(self):
+        """Escribe en el almacenamiento los partidos pendientes, si hay uno configurado"""
+        if self.almacenamiento:
+            self.almacenamiento.confirmar()
+    
+    @medido('sistema.consultar_partidos')
+    def consultar_partidos(self, equipo: Optional[str] = None, rival: Optional[str] = None,
+                           desde: Optional[datetime] = None, hasta: Optional[datetime] = None,
+                           pagina: int = 1, por_pagina: int = 20) -> PaginaPartidos:
+        """Consulta partidos ordenados por fecha, con filtros opcionales y paginación.
         
-        # Procesar todos los partidos
-        for partido in self.partidos:
-            resultado = partido.obtener_resultado()
-            goles_local = resultado['local']
-            goles_visitante = resultado['visitante']
-            
-            # Estadísticas del equipo local
-            estadisticas[partido.equipo_local]['partidos_jugados'] += 1
-            estadisticas[partido.equipo_local]['goles_a_favor'] += goles_local
-            estadisticas[partido.equipo_local]['goles_en_contra'] += goles_visitante
-            
-            # Estadísticas del equipo visitante
-            estadisticas[partido.equipo_visitante]['partidos_jugados'] += 1
-            estadisticas[partido.equipo_visitante]['goles_a_favor'] += goles_visitante
-            estadisticas[partido.equipo_visitante]['goles_en_contra'] += goles_local
-            
-            # Puntos y resultados
-            if resultado['ganador'] == partido.equipo_local:
-                estadisticas[partido.equipo_local]['ganados'] += 1
-                estadisticas[partido.equipo_local]['puntos'] += 3
-                estadisticas[partido.equipo_visitante]['perdidos'] += 1
-            elif resultado['ganador'] == partido.equipo_visitante:
-                estadisticas[partido.equipo_visitante]['ganados'] += 1
-                estadisticas[partido.equipo_visitante]['puntos'] += 3
-                estadisticas[partido.equipo_local]['perdidos'] += 1
-            else:  # empate
-                estadisticas[partido.equipo_local]['empatados'] += 1
-                estadisticas[partido.equipo_local]['puntos'] += 1
-                estadisticas[partido.equipo_visitante]['empatados'] += 1
-                estadisticas[partido.equipo_visitante]['puntos'] += 1
-        
-        # Ordenar por puntos (descendente)
-        tabla = list(estadisticas.values())
-        tabla.sort(key=lambda x: x['puntos'], reverse=True)
+        Con `equipo` se listan sus partidos; con `equipo` y `rival`, los
+        enfrentamientos entre ambos. `desde` y `hasta` son inclusivos. Cada
+        consulta hace una búsqueda binaria sobre el índice correspondiente y
+        solo materializa los partidos de la página pedida. `pagina` y
+        `por_pagina` deben ser al menos 1.
+        """
+        if pagina < 1:
+            raise ValueError(f"La página debe ser al menos 1: {pagina}")
+        if por_pagina < 1:
+            raise ValueError(f"La cantidad de partidos por página debe ser al menos 1: {por_pagina}")
+        if equipo is None:
+            equipo, rival = rival, None
         
-        return tabla
+        if equipo is not None and rival is not None:
+            indice = self._indice_enfrentamientos.get(_clave_enfrentamiento(equipo, rival), [])
+        elif equipo is not None:
+            indice = self._indice_equipos.get(equipo, [])
+        else:
+            indice = self._indice_fechas
+        
+        inicio = bisect_left(indice, (desde, -1)) if desde else 0
+        fin = bisect_right(indice, (hasta, len(self.partidos))) if hasta else len(indice)
+        total = max(fin - inicio, 0)
+        
+        desde_pos = inicio + (pagina - 1) * por_pagina
+        hasta_pos = min(desde_pos + por_pagina, fin)
+        partidos = [self.partidos[posicion] for _, posicion in indice[desde_pos:hasta_pos]]
+        
+        return PaginaPartidos(partidos, pagina, por_pagina, total)
     
-    def obtener_tabla_goleadores(self) -> List[Dict]:
-        """Obtiene la tabla de goleadores"""
-        goleadores = {}
-        
-        for partido in self.partidos:
-            for evento in partido.eventos:
-                if isinstance(evento, Gol):
-                    jugador_num = evento.autor
-                    equipo_codigo = evento.equipo
-                    
-                    # Buscar el jugador en los equipos
-                    equipo = self.obtener_equipo(equipo_codigo)
-                    if equipo:
-                        jugador = equipo.obtener_jugador(jugador_num)
-                        if jugador:
-                            clave = f"{jugador.nombre} ({equipo_codigo})"
-                            if clave not in goleadores:
-                                goleadores[clave] = {
-                                    'jugador': jugador.nombre,
-                                    'equipo': equipo_codigo,
-                                    'goles': 0
-                                }
-                            goleadores[clave]['goles'] += 1
-        
-        # Ordenar por cantidad de goles (descendente)
-        tabla = list(goleadores.values())
-        tabla.sort(key=lambda x: x['goles'], reverse=True)
+    @medido('sistema.obtener_tabla_posiciones')
+    def obtener_tabla_posiciones(self, hasta: Optional[datetime] = None) -> List[Dict]:
+        """Obtiene la tabla de posiciones ordenada por puntos.
+        
+        Con `hasta` se obtiene la tabla tal como estaba en esa fecha
+        (inclusive), contando solo los partidos jugados hasta entonces.
+        """
+        if hasta is None:
+            return self._tabla_posiciones.filas()
+        
+        cantidad = bisect_right(self._indice_fechas, (hasta, len(self.partidos)))
+        return self._historial_posiciones.tabla_tras(
+            cantidad, self._indice_fechas, self.partidos, self.codigos_en_orden(),
+            lambda grupo: self._enfrentamientos_hasta(grupo, cantidad)).filas()
+    
+    def _enfrentamientos_hasta(self, grupo: List[str], cantidad: int) -> Iterator[Tuple[str, int, int, int]]:
+        """Resultados entre los equipos de `grupo` dentro de los primeros `cantidad` partidos por fecha"""
+        if not cantidad:
+            return
+        limite = self._indice_fechas[cantidad - 1]
+        for i, equipo in enumerate(grupo):
+            for rival in grupo[i + 1:]:
+                claves = self._indice_enfrentamientos.get(_clave_enfrentamiento(equipo, rival), [])
+                for _, posicion in claves[:bisect_right(claves, limite)]:
+                    partido = self.partidos[posicion]
+                    goles_local, goles_visitante, puntos_local, puntos_visitante = _puntos_partido(partido)
+                    yield partido.equipo_local, puntos_local, goles_local, goles_visitante
+                    yield partido.equipo_visitante, puntos_visitante, goles_visitante, goles_local
+    
+    def codigos_en_orden(self) -> List[str]:
+        """Códigos de los equipos de la tabla de posiciones en orden de registro"""
+        return self._tabla_posiciones.codigos()
+    
+    @medido('sistema.obtener_tabla_goleadores')
+    def obtener_tabla_goleadores(self, limite: Optional[int] = None) -> List[Dict]:
+        """Obtiene la tabla de goleadores, opcionalmente limitada a los primeros"""
+        return list(islice(self.iterar_tabla_goleadores(), limite))
+    
+    def iterar_tabla_goleadores(self) -> Iterator[Dict]:
+        """Recorre la tabla de goleadores sin armarla completa, para mostrarla de a páginas"""
+        for equipo_codigo, numero, goles in self._tabla_goleadores.iterar():
+            # Solo se listan jugadores registrados en su equipo
+            equipo = self.obtener_equipo(equipo_codigo)
+            jugador = equipo.obtener_jugador(numero) if equipo else None
+            if jugador:
+                yield {
+                    'jugador': jugador.nombre,
+                    'equipo': equipo_codigo,
+                    'goles': goles
+                }
+    
+    def obtener_goleadores_equipo(self, codigo: str) -> List[Dict]:
+        """Obtiene los goleadores de un equipo ordenados por goles"""
+        equipo = self.obtener_equipo(codigo)
+        if not equipo:
+            return []
+        
+        tabla = []
+        for numero, goles in self._tabla_goleadores.por_equipo(codigo):
+            jugador = equipo.obtener_jugador(numero)
+            if jugador:
+                tabla.append({
+                    'jugador': jugador.nombre,
+                    'equipo': codigo,
+                    'goles': goles
+                })
         
         return tabla
+    
+    def obtener_estadisticas_jugador(self, codigo: str, numero: int) -> Optional[Dict]:
+        """Obtiene las estadísticas de un jugador, o None si no tiene registros"""
+        return self._estadisticas_jugadores.obtener(codigo, numero)
+    
+    @medido('sistema.obtener_estadisticas_jugadores')
+    def obtener_estadisticas_jugadores(self, equipo: Optional[str] = None, ordenar_por: str = 'minutos',
+                                       minimo_minutos: int = 0, limite: Optional[int] = None) -> List[Dict]:
+        """Obtiene las estadísticas de los jugadores registrados, de mayor a menor según `ordenar_por`.
+        
+        `minimo_minutos` excluye a quienes jugaron poco, útil para que las tasas
+        cada 90 minutos no queden dominadas por muestras chicas.
+        """
+        tabla = []
+        for codigo, numero, stats in self._estadisticas_jugadores.iterar():
+            if equipo is not None and codigo != equipo:
+                continue
+            if stats['minutos'] < minimo_minutos:
+                continue
+            equipo_registrado = self.obtener_equipo(codigo)
+            jugador = equipo_registrado.obtener_jugador(numero) if equipo_registrado else None
+            if jugador:
+                tabla.append({'jugador': jugador.nombre, 'equipo': codigo, 'numero': numero, **stats})
+        
+        tabla.sort(key=lambda fila: fila[ordenar_por], reverse=True)
+        return tabla[:limite] if limite is not None else tabla
+
+
+def _clave_enfrentamiento(equipo_a: str, equipo_b: str) -> Tuple[str, str]:
+    """Clave del índice de enfrentamientos, independiente de quién es local"""
+    return (equipo_a, equipo_b) if equipo_a <= equipo_b else (equipo_b, equipo_a)
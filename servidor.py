@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Servidor de ingesta de partidos en vivo
+Uso: python servidor.py --equipos ejemplos/equipos_ejemplo.py [--puerto 8765 | --unix /tmp/futbol.sock]
+"""
+
+import sys
+
+from src.dsl_externo.servidor import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+from .almacenamiento import AlmacenamientoSQLite
+
+__all__ = ['AlmacenamientoSQLite']
@@ -0,0 +1,345 @@
+"""
+Almacenamiento persistente de equipos, partidos y eventos
+Backend SQLite con inserciones por lotes, consultas agregadas en SQL y carga del
+historial guardado
+"""
+
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from itertools import groupby
+from typing import Dict, List, Optional, Tuple
+# Agregar el directorio raíz al path para importar models
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from models import (Almacenamiento, Cambio, Equipo, Gol, Jugador, Partido, PUNTOS_FAIR_PLAY,
+                    SistemaFutbol, Tarjeta, resolver_empates)
+
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS equipos (
+    codigo TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS jugadores (
+    equipo TEXT NOT NULL REFERENCES equipos(codigo),
+    numero INTEGER NOT NULL,
+    nombre TEXT NOT NULL,
+    PRIMARY KEY (equipo, numero)
+);
+
+CREATE TABLE IF NOT EXISTS partidos (
+    id INTEGER PRIMARY KEY,
+    fecha TEXT NOT NULL,
+    equipo_local TEXT NOT NULL,
+    equipo_visitante TEXT NOT NULL,
+    formacion_local TEXT NOT NULL,
+    formacion_visitante TEXT NOT NULL,
+    titulares_local TEXT NOT NULL,
+    titulares_visitante TEXT NOT NULL,
+    banco_local TEXT NOT NULL,
+    banco_visitante TEXT NOT NULL,
+    goles_local INTEGER NOT NULL,
+    goles_visitante INTEGER NOT NULL
+);
+
+-- tipo: GOL (jugador = autor, jugador_secundario = asistente),
+--       TARJETA (jugador, color) o CAMBIO (jugador = sale, jugador_secundario = entra)
+CREATE TABLE IF NOT EXISTS eventos (
+    id INTEGER PRIMARY KEY,
+    partido_id INTEGER NOT NULL REFERENCES partidos(id),
+    tipo TEXT NOT NULL,
+    tiempo INTEGER NOT NULL,
+    equipo TEXT NOT NULL,
+    jugador INTEGER NOT NULL,
+    jugador_secundario INTEGER,
+    color TEXT
+);
+
+-- Cada partido guardado es una fila, como en SistemaFutbol: las bases que tenían el
+-- índice único por fecha, local y visitante descartaban partidos que la memoria contaba
+DROP INDEX IF EXISTS idx_partidos_identidad;
+CREATE INDEX IF NOT EXISTS idx_partidos_fecha ON partidos(fecha);
+CREATE INDEX IF NOT EXISTS idx_partidos_local ON partidos(equipo_local, fecha);
+CREATE INDEX IF NOT EXISTS idx_partidos_visitante ON partidos(equipo_visitante, fecha);
+CREATE INDEX IF NOT EXISTS idx_eventos_partido ON eventos(partido_id);
+CREATE INDEX IF NOT EXISTS idx_eventos_jugador ON eventos(equipo, jugador, tipo);
+"""
+
+# ?3 es la fecha límite (inclusive) como texto ISO; '9999' incluye todos los partidos.
+# Como en memoria, la tabla incluye los equipos que solo aparecen en partidos, aun en
+# fechas posteriores al límite: van después de los registrados, por orden de aparición
+_TABLA_POSICIONES = """
+WITH codigos AS (
+    SELECT codigo, 0 AS solo_partidos, rowid AS orden FROM equipos
+    UNION ALL
+    SELECT equipo, 1, MIN(orden) FROM (
+        SELECT equipo_local AS equipo, id * 2 AS orden FROM partidos
+        UNION ALL
+        SELECT equipo_visitante, id * 2 + 1 FROM partidos
+    )
+    WHERE equipo NOT IN (SELECT codigo FROM equipos)
+    GROUP BY equipo
+),
+jugados AS (
+    SELECT * FROM partidos WHERE fecha <= ?3
+),
+resultados AS (
+    SELECT equipo_local AS equipo, goles_local AS gf, goles_visitante AS gc FROM jugados
+    UNION ALL
+    SELECT equipo_visitante, goles_visitante, goles_local FROM jugados
+),
+fair_play AS (
+    SELECT ev.equipo,
+           SUM(CASE UPPER(ev.color) WHEN 'AMARILLA' THEN ?1 WHEN 'ROJA' THEN ?2 ELSE 0 END) AS puntos
+    FROM eventos ev
+    JOIN jugados p ON p.id = ev.partido_id
+    WHERE ev.tipo = 'TARJETA' AND ev.equipo IN (p.equipo_local, p.equipo_visitante)
+    GROUP BY ev.equipo
+)
+SELECT c.codigo,
+       COUNT(r.equipo),
+       COALESCE(SUM(r.gf > r.gc), 0),
+       COALESCE(SUM(r.gf = r.gc), 0),
+       COALESCE(SUM(r.gf < r.gc), 0),
+       COALESCE(SUM(r.gf), 0) AS gf,
+       COALESCE(SUM(r.gc), 0),
+       COALESCE(SUM(r.gf - r.gc), 0) AS diferencia,
+       COALESCE(SUM(CASE WHEN r.gf > r.gc THEN 3 WHEN r.gf = r.gc THEN 1 ELSE 0 END), 0) AS puntos,
+       COALESCE(fp.puntos, 0) AS fair_play
+FROM codigos c
+LEFT JOIN resultados r ON r.equipo = c.codigo
+LEFT JOIN fair_play fp ON fp.equipo = c.codigo
+GROUP BY c.codigo
+ORDER BY puntos DESC, diferencia DESC, gf DESC, fair_play, c.solo_partidos, c.orden
+"""
+
+# Entre jugadores con los mismos goles va primero el que llegó antes a esa cantidad, es
+# decir, el de último gol más antiguo: el mismo orden que TablaGoleadores en memoria
+_TABLA_GOLEADORES = """
+SELECT j.nombre, ev.equipo, COUNT(*) AS goles
+FROM eventos ev
+JOIN jugadores j ON j.equipo = ev.equipo AND j.numero = ev.jugador
+WHERE ev.tipo = 'GOL'
+GROUP BY ev.equipo, ev.jugador
+ORDER BY goles DESC, MAX(ev.id)
+LIMIT ?
+"""
+
+
+class AlmacenamientoSQLite(Almacenamiento):
+    """Backend de almacenamiento sobre una base SQLite local.
+    
+    Los partidos se acumulan en memoria y se insertan por lotes de
+    `tamano_lote` partidos en una sola transacción; `confirmar` fuerza la
+    escritura de lo pendiente. Cada partido guardado ocupa su propia fila,
+    como en `SistemaFutbol`, y SQLite asigna su identificador.
+    """
+    
+    def __init__(self, ruta: str = ":memory:", tamano_lote: int = 500):
+        self.ruta = ruta
+        self.tamano_lote = tamano_lote
+        self.conexion = sqlite3.connect(ruta)
+        self.conexion.executescript(ESQUEMA)
+        # Por partido: (fila del partido sin id, filas de sus eventos sin partido_id)
+        self._pendientes: List[Tuple[tuple, List[tuple]]] = []
+    
+    def guardar_equipo(self, equipo: Equipo):
+        """Guarda (o actualiza) un equipo con sus jugadores"""
+        with self.conexion:
+            # ON CONFLICT conserva el rowid, que define el orden de registro
+            self.conexion.execute(
+                "INSERT INTO equipos (codigo, nombre) VALUES (?, ?) "
+                "ON CONFLICT(codigo) DO UPDATE SET nombre = excluded.nombre",
+                (equipo.codigo, equipo.nombre))
+            self.conexion.execute("DELETE FROM jugadores WHERE equipo = ?", (equipo.codigo,))
+            self.conexion.executemany(
+                "INSERT INTO jugadores (equipo, numero, nombre) VALUES (?, ?, ?)",
+                [(equipo.codigo, jugador.numero, jugador.nombre) for jugador in equipo.jugadores])
+    
+    def guardar_partido(self, partido: Partido):
+        """Encola un partido y sus eventos para la próxima inserción por lotes"""
+        resultado = partido.obtener_resultado()
+        fila_partido = (
+            partido.fecha.isoformat(sep=' '),
+            partido.equipo_local,
+            partido.equipo_visitante,
+            partido.formacion_local,
+            partido.formacion_visitante,
+            _lista_a_texto(partido.titulares_local),
+            _lista_a_texto(partido.titulares_visitante),
+            _lista_a_texto(partido.banco_local),
+            _lista_a_texto(partido.banco_visitante),
+            resultado['local'],
+            resultado['visitante']
+        )
+        
+        filas_eventos = []
+        for evento in partido.eventos:
+            if isinstance(evento, Gol):
+                fila = ('GOL', evento.autor, evento.asistente, None)
+            elif isinstance(evento, Tarjeta):
+                fila = ('TARJETA', evento.jugador, None, evento.color)
+            elif isinstance(evento, Cambio):
+                fila = ('CAMBIO', evento.jugador_sale, evento.jugador_entra, None)
+            else:
+                continue
+            tipo, jugador, secundario, color = fila
+            filas_eventos.append((tipo, evento.tiempo, evento.equipo, jugador, secundario, color))
+        
+        self._pendientes.append((fila_partido, filas_eventos))
+        if len(self._pendientes) >= self.tamano_lote:
+            self.confirmar()
+    
+    def confirmar(self):
+        """Inserta en una transacción los partidos y eventos pendientes"""
+        if not self._pendientes:
+            return
+        
+        eventos = []
+        with self.conexion:
+            cursor = self.conexion.cursor()
+            for fila_partido, filas_eventos in self._pendientes:
+                # El id de cada fila lo asigna SQLite: otra conexión puede estar escribiendo
+                cursor.execute(
+                    "INSERT INTO partidos (fecha, equipo_local, equipo_visitante, formacion_local, "
+                    "formacion_visitante, titulares_local, titulares_visitante, banco_local, "
+                    "banco_visitante, goles_local, goles_visitante) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", fila_partido)
+                partido_id = cursor.lastrowid
+                eventos.extend((partido_id, *fila) for fila in filas_eventos)
+            cursor.executemany(
+                "INSERT INTO eventos (partido_id, tipo, tiempo, equipo, jugador, "
+                "jugador_secundario, color) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                eventos)
+        
+        self._pendientes = []
+    
+    def tabla_posiciones(self, hasta: Optional[datetime] = None) -> List[Dict]:
+        """Calcula la tabla de posiciones con agregados SQL y los mismos desempates que en memoria.
+        
+        Con `hasta` se obtiene la tabla tal como estaba en esa fecha
+        (inclusive), como `SistemaFutbol.obtener_tabla_posiciones`.
+        """
+        self.confirmar()
+        limite = _fecha_limite(hasta)
+        claves = ('equipo', 'partidos_jugados', 'ganados', 'empatados', 'perdidos',
+                  'goles_a_favor', 'goles_en_contra', 'diferencia_goles', 'puntos', 'puntos_fair_play')
+        filas = [dict(zip(claves, fila)) for fila in self.conexion.execute(
+            _TABLA_POSICIONES, (PUNTOS_FAIR_PLAY['AMARILLA'], PUNTOS_FAIR_PLAY['ROJA'], limite))]
+        return resolver_empates(filas, lambda grupo: self._enfrentamientos_entre(grupo, limite))
+    
+    def _enfrentamientos_entre(self, grupo: List[str], limite: str = '9999'):
+        """Resultados de los partidos jugados entre los equipos de `grupo` hasta `limite`"""
+        marcas = ','.join('?' * len(grupo))
+        consulta = (f"SELECT equipo_local, equipo_visitante, goles_local, goles_visitante "
+                    f"FROM partidos WHERE equipo_local IN ({marcas}) AND equipo_visitante IN ({marcas}) "
+                    f"AND equipo_local != equipo_visitante AND fecha <= ?")
+        for local, visitante, goles_local, goles_visitante in self.conexion.execute(
+                consulta, [*grupo, *grupo, limite]):
+            puntos_local = 3 if goles_local > goles_visitante else 1 if goles_local == goles_visitante else 0
+            puntos_visitante = 3 if goles_visitante > goles_local else 1 if goles_local == goles_visitante else 0
+            yield local, puntos_local, goles_local, goles_visitante
+            yield visitante, puntos_visitante, goles_visitante, goles_local
+    
+    def tabla_goleadores(self, limite: Optional[int] = None) -> List[Dict]:
+        """Calcula la tabla de goleadores con agregados SQL"""
+        self.confirmar()
+        filas = self.conexion.execute(_TABLA_GOLEADORES, (-1 if limite is None else limite,))
+        return [{'jugador': nombre, 'equipo': equipo, 'goles': goles}
+                for nombre, equipo, goles in filas]
+    
+    def partidos_equipo(self, codigo: str, desde: Optional[datetime] = None,
+                        hasta: Optional[datetime] = None) -> List[Tuple]:
+        """Devuelve (fecha, local, goles local, goles visitante, visitante) de un equipo por fecha"""
+        self.confirmar()
+        desde_texto = desde.isoformat(sep=' ') if desde else ''
+        hasta_texto = _fecha_limite(hasta)
+        return self.conexion.execute(
+            "SELECT fecha, equipo_local, goles_local, goles_visitante, equipo_visitante "
+            "FROM partidos WHERE equipo_local = ?1 AND fecha BETWEEN ?2 AND ?3 "
+            "UNION ALL "
+            "SELECT fecha, equipo_local, goles_local, goles_visitante, equipo_visitante "
+            "FROM partidos WHERE equipo_visitante = ?1 AND fecha BETWEEN ?2 AND ?3 "
+            "ORDER BY fecha",
+            (codigo, desde_texto, hasta_texto)).fetchall()
+    
+    def cargar_sistema(self, sistema: Optional[SistemaFutbol] = None) -> SistemaFutbol:
+        """Agrega a `sistema` (o a uno nuevo) los equipos y partidos guardados y lo devuelve.
+        
+        Los equipos y partidos se agregan en el orden en que se guardaron, así
+        las tablas y consultas históricas en memoria coinciden con las de SQL.
+        Mientras se carga, el sistema no escribe en su propio almacenamiento.
+        """
+        self.confirmar()
+        if sistema is None:
+            sistema = SistemaFutbol()
+        
+        almacenamiento, sistema.almacenamiento = sistema.almacenamiento, None
+        try:
+            jugadores = {codigo: [Jugador(numero, nombre) for _, numero, nombre in filas]
+                         for codigo, filas in groupby(self.conexion.execute(
+                             "SELECT equipo, numero, nombre FROM jugadores ORDER BY equipo, rowid"),
+                             key=lambda fila: fila[0])}
+            for codigo, nombre in self.conexion.execute("SELECT codigo, nombre FROM equipos ORDER BY rowid"):
+                sistema.agregar_equipo(Equipo(nombre, codigo, jugadores.get(codigo, [])))
+            
+            eventos = groupby(self.conexion.execute(
+                "SELECT partido_id, tipo, tiempo, equipo, jugador, jugador_secundario, color "
+                "FROM eventos ORDER BY partido_id, id"), key=lambda fila: fila[0])
+            siguiente = next(eventos, None)
+            for fila in self.conexion.execute(
+                    "SELECT id, fecha, equipo_local, equipo_visitante, formacion_local, formacion_visitante, "
+                    "titulares_local, titulares_visitante, banco_local, banco_visitante "
+                    "FROM partidos ORDER BY id"):
+                partido_id = fila[0]
+                # Eventos huérfanos (de un partido inexistente) se saltean
+                while siguiente is not None and siguiente[0] < partido_id:
+                    siguiente = next(eventos, None)
+                lista = []
+                if siguiente is not None and siguiente[0] == partido_id:
+                    lista = [_fila_a_evento(*evento[1:]) for evento in siguiente[1]]
+                    siguiente = next(eventos, None)
+                sistema.agregar_partido(Partido(
+                    fecha=datetime.fromisoformat(fila[1]),
+                    equipo_local=fila[2],
+                    equipo_visitante=fila[3],
+                    formacion_local=fila[4],
+                    formacion_visitante=fila[5],
+                    titulares_local=_texto_a_lista(fila[6]),
+                    titulares_visitante=_texto_a_lista(fila[7]),
+                    banco_local=_texto_a_lista(fila[8]),
+                    banco_visitante=_texto_a_lista(fila[9]),
+                    eventos=lista
+                ))
+        finally:
+            sistema.almacenamiento = almacenamiento
+        return sistema
+    
+    def cerrar(self):
+        """Escribe lo pendiente y cierra la conexión"""
+        self.confirmar()
+        self.conexion.close()
+
+
+def _lista_a_texto(numeros: List[int]) -> str:
+    return ','.join(map(str, numeros))
+
+
+def _texto_a_lista(texto: str) -> List[int]:
+    return [int(numero) for numero in texto.split(',')] if texto else []
+
+
+def _fecha_limite(hasta: Optional[datetime]) -> str:
+    return hasta.isoformat(sep=' ') if hasta else '9999'
+
+
+def _fila_a_evento(tipo: str, tiempo: int, equipo: str, jugador: int,
+                   secundario: Optional[int], color: Optional[str]):
+    """Reconstruye un evento a partir de su fila en la tabla `eventos`"""
+    if tipo == 'GOL':
+        return Gol(tiempo, equipo, jugador, secundario)
+    if tipo == 'TARJETA':
+        return Tarjeta(tiempo, equipo, jugador, color)
+    return Cambio(tiempo, equipo, jugador, secundario)
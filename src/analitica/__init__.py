@@ -0,0 +1,3 @@
+from .analitica import Analitica, EventosColumnares, exportar_eventos, NUMPY_DISPONIBLE
+
+__all__ = ['Analitica', 'EventosColumnares', 'exportar_eventos', 'NUMPY_DISPONIBLE']
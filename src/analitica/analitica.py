@@ -0,0 +1,342 @@
+"""
+Analítica de temporada sobre columnas de eventos
+Exporta los eventos del sistema a arreglos NumPy y calcula estadísticas con
+operaciones vectorizadas; sin NumPy se usan los recorridos tradicionales
+"""
+
+import os
+import sys
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+# Agregar el directorio raíz al path para importar models
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from models import Cambio, Gol, PUNTOS_FAIR_PLAY, SistemaFutbol, Tarjeta, resolver_empates
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+NUMPY_DISPONIBLE = np is not None
+
+# Códigos de la columna `tipo`
+TIPO_GOL, TIPO_AMARILLA, TIPO_ROJA, TIPO_CAMBIO = 0, 1, 2, 3
+
+
+@dataclass
+class EventosColumnares:
+    """Eventos y partidos de un sistema exportados por columnas.
+    
+    Las columnas de eventos tienen una fila por evento; `local` y `visitante`
+    tienen una fila por partido. Los equipos se guardan como índices en
+    `codigos`, que sigue el orden de registro de la tabla de posiciones.
+    """
+    codigos: List[str]
+    minuto: 'np.ndarray'
+    equipo: 'np.ndarray'
+    jugador: 'np.ndarray'
+    tipo: 'np.ndarray'
+    partido: 'np.ndarray'
+    local: 'np.ndarray'
+    visitante: 'np.ndarray'
+    
+    @property
+    def num_partidos(self) -> int:
+        return len(self.local)
+
+
+class Analitica:
+    """Estadísticas de temporada de un sistema.
+    
+    Con NumPy los eventos se exportan a columnas y cada estadística se
+    calcula con operaciones vectorizadas; la exportación es incremental y
+    solo recorre los partidos agregados desde la consulta anterior, y las
+    columnas se vuelven a armar cuando cambia la versión del sistema (un
+    equipo o partido nuevo). Sin NumPy
+    (o con `usar_numpy=False`) se recorren los partidos del sistema. Ambos
+    caminos devuelven los mismos resultados.
+    """
+    
+    def __init__(self, sistema: SistemaFutbol, usar_numpy: Optional[bool] = None):
+        if usar_numpy and not NUMPY_DISPONIBLE:
+            raise ImportError("NumPy no está instalado")
+        self.sistema = sistema
+        self.usar_numpy = NUMPY_DISPONIBLE if usar_numpy is None else usar_numpy
+        self._codigos: List[str] = []
+        self._indices: Dict[str, int] = {}
+        self._columnas = {nombre: array('i') for nombre in
+                          ('minuto', 'equipo', 'jugador', 'tipo', 'partido', 'local', 'visitante')}
+        self._exportados = 0
+        self._version = -1
+        self._eventos: Optional[EventosColumnares] = None
+    
+    def eventos(self) -> EventosColumnares:
+        """Devuelve las columnas de eventos al día con el sistema"""
+        if not NUMPY_DISPONIBLE:
+            raise ImportError("NumPy no está instalado")
+        
+        self._sincronizar_equipos()
+        # Un equipo registrado sin partidos también cambia la versión: debe aparecer en las tablas
+        if self._eventos is None or self._version != self.sistema.version:
+            self._exportar_nuevos()
+            columnas = {nombre: np.frombuffer(columna, dtype=np.intc).copy()
+                        for nombre, columna in self._columnas.items()}
+            self._eventos = EventosColumnares(codigos=list(self._codigos), **columnas)
+            self._version = self.sistema.version
+        return self._eventos
+    
+    def _sincronizar_equipos(self):
+        """Asigna índices a los equipos registrados desde la última exportación"""
+        for codigo in self.sistema.codigos_en_orden()[len(self._codigos):]:
+            self._indices[codigo] = len(self._codigos)
+            self._codigos.append(codigo)
+    
+    def _exportar_nuevos(self):
+        """Agrega a las columnas los partidos que todavía no se exportaron"""
+        c = self._columnas
+        minuto, equipo, jugador, tipo, partido = (c['minuto'], c['equipo'], c['jugador'],
+                                                  c['tipo'], c['partido'])
+        indices = self._indices
+        
+        for numero_partido in range(self._exportados, len(self.sistema.partidos)):
+            p = self.sistema.partidos[numero_partido]
+            c['local'].append(indices[p.equipo_local])
+            c['visitante'].append(indices[p.equipo_visitante])
+            
+            for evento in p.eventos:
+                # Los eventos de equipos ajenos al partido no cuentan en ninguna estadística
+                if evento.equipo != p.equipo_local and evento.equipo != p.equipo_visitante:
+                    continue
+                if isinstance(evento, Gol):
+                    codigo_tipo, numero = TIPO_GOL, evento.autor
+                elif isinstance(evento, Tarjeta):
+                    codigo_tipo = TIPO_ROJA if evento.color.upper() == 'ROJA' else TIPO_AMARILLA
+                    numero = evento.jugador
+                elif isinstance(evento, Cambio):
+                    codigo_tipo, numero = TIPO_CAMBIO, evento.jugador_sale
+                else:
+                    continue
+                minuto.append(evento.tiempo)
+                equipo.append(indices[evento.equipo])
+                jugador.append(numero)
+                tipo.append(codigo_tipo)
+                partido.append(numero_partido)
+        
+        self._exportados = len(self.sistema.partidos)
+    
+    # ------------------------------------------------------------------
+    # Tabla de posiciones
+    # ------------------------------------------------------------------
+    
+    def tabla_posiciones(self) -> List[Dict]:
+        """Tabla de posiciones con los mismos criterios de desempate que el sistema"""
+        if not self.usar_numpy:
+            return self.sistema.obtener_tabla_posiciones()
+        
+        ev = self.eventos()
+        num_equipos = len(ev.codigos)
+        goles_local, goles_visitante = self._goles_por_partido(ev)
+        
+        def por_equipo(valores_local, valores_visitante):
+            return (np.bincount(ev.local, valores_local, num_equipos)
+                    + np.bincount(ev.visitante, valores_visitante, num_equipos)).astype(np.int64)
+        
+        gana_local = goles_local > goles_visitante
+        gana_visitante = goles_visitante > goles_local
+        empate = ~(gana_local | gana_visitante)
+        puntos_local = np.where(gana_local, 3, np.where(empate, 1, 0))
+        puntos_visitante = np.where(gana_visitante, 3, np.where(empate, 1, 0))
+        
+        jugados = por_equipo(None, None)
+        ganados = por_equipo(gana_local, gana_visitante)
+        empatados = por_equipo(empate, empate)
+        goles_a_favor = por_equipo(goles_local, goles_visitante)
+        goles_en_contra = por_equipo(goles_visitante, goles_local)
+        puntos = por_equipo(puntos_local, puntos_visitante)
+        diferencia = goles_a_favor - goles_en_contra
+        
+        penalizacion = np.zeros(3, dtype=np.int64)
+        penalizacion[TIPO_AMARILLA] = PUNTOS_FAIR_PLAY['AMARILLA']
+        penalizacion[TIPO_ROJA] = PUNTOS_FAIR_PLAY['ROJA']
+        tarjetas = (ev.tipo == TIPO_AMARILLA) | (ev.tipo == TIPO_ROJA)
+        fair_play = np.bincount(ev.equipo[tarjetas], penalizacion[ev.tipo[tarjetas]],
+                                num_equipos).astype(np.int64)
+        
+        # np.lexsort ordena por la última clave primero
+        orden = np.lexsort((np.arange(num_equipos), fair_play, -goles_a_favor, -diferencia, -puntos))
+        filas = [{
+            'equipo': ev.codigos[i],
+            'partidos_jugados': int(jugados[i]),
+            'ganados': int(ganados[i]),
+            'empatados': int(empatados[i]),
+            'perdidos': int(jugados[i] - ganados[i] - empatados[i]),
+            'goles_a_favor': int(goles_a_favor[i]),
+            'goles_en_contra': int(goles_en_contra[i]),
+            'diferencia_goles': int(diferencia[i]),
+            'puntos': int(puntos[i]),
+            'puntos_fair_play': int(fair_play[i])
+        } for i in orden.tolist()]
+        
+        def cara_a_cara(grupo: List[str]):
+            miembros = np.array([self._indices[codigo] for codigo in grupo])
+            entre = np.isin(ev.local, miembros) & np.isin(ev.visitante, miembros) & (ev.local != ev.visitante)
+            for local, visitante, gl, gv in zip(ev.local[entre].tolist(), ev.visitante[entre].tolist(),
+                                                goles_local[entre].tolist(), goles_visitante[entre].tolist()):
+                yield ev.codigos[local], 3 if gl > gv else 1 if gl == gv else 0, gl, gv
+                yield ev.codigos[visitante], 3 if gv > gl else 1 if gl == gv else 0, gv, gl
+        
+        return resolver_empates(filas, cara_a_cara)
+    
+    def _goles_por_partido(self, ev: EventosColumnares):
+        """Devuelve los goles de local y de visitante de cada partido"""
+        goles = ev.tipo == TIPO_GOL
+        partido = ev.partido[goles]
+        del_local = ev.equipo[goles] == ev.local[partido]
+        goles_local = np.bincount(partido[del_local], minlength=ev.num_partidos)
+        goles_visitante = np.bincount(partido[~del_local], minlength=ev.num_partidos)
+        return goles_local, goles_visitante
+    
+    # ------------------------------------------------------------------
+    # Goleadores
+    # ------------------------------------------------------------------
+    
+    def tabla_goleadores(self, limite: Optional[int] = None) -> List[Dict]:
+        """Goleadores ordenados por goles, orden de registro del equipo y número.
+        
+        Como en el sistema, solo se listan jugadores registrados en su equipo.
+        """
+        if self.usar_numpy:
+            ev = self.eventos()
+            goles = ev.tipo == TIPO_GOL
+            equipos = ev.equipo[goles].astype(np.int64)
+            jugadores = ev.jugador[goles].astype(np.int64)
+            base = int(jugadores.max()) + 1 if len(jugadores) else 1
+            claves, cantidades = np.unique(equipos * base + jugadores, return_counts=True)
+            # Mayor cantidad primero; np.unique ya deja las claves ordenadas por equipo y número
+            orden = np.argsort(-cantidades, kind='stable')
+            conteos = [(clave // base, clave % base, cantidad) for clave, cantidad in
+                       zip(claves[orden].tolist(), cantidades[orden].tolist())]
+            codigos = ev.codigos
+        else:
+            self._sincronizar_equipos()
+            codigos = self._codigos
+            por_jugador: Dict[tuple, int] = {}
+            for p in self.sistema.partidos:
+                for evento in p.eventos:
+                    if isinstance(evento, Gol) and evento.equipo in (p.equipo_local, p.equipo_visitante):
+                        clave = (self._indices[evento.equipo], evento.autor)
+                        por_jugador[clave] = por_jugador.get(clave, 0) + 1
+            conteos = sorted(((equipo, numero, cantidad) for (equipo, numero), cantidad in por_jugador.items()),
+                             key=lambda fila: (-fila[2], fila[0], fila[1]))
+        
+        tabla = []
+        for indice_equipo, numero, cantidad in conteos:
+            if limite is not None and len(tabla) >= limite:
+                break
+            equipo = self.sistema.obtener_equipo(codigos[indice_equipo])
+            jugador = equipo.obtener_jugador(numero) if equipo else None
+            if jugador:
+                tabla.append({
+                    'jugador': jugador.nombre,
+                    'equipo': equipo.codigo,
+                    'numero': numero,
+                    'goles': cantidad
+                })
+        
+        return tabla
+    
+    # ------------------------------------------------------------------
+    # Distribuciones y conteos
+    # ------------------------------------------------------------------
+    
+    def goles_por_minuto(self, intervalo: int = 15) -> List[int]:
+        """Histograma de goles: el elemento i cuenta los goles entre i*intervalo y (i+1)*intervalo - 1"""
+        if self.usar_numpy:
+            ev = self.eventos()
+            minutos = ev.minuto[ev.tipo == TIPO_GOL]
+            return np.bincount(minutos // intervalo).tolist() if len(minutos) else []
+        
+        histograma: List[int] = []
+        for p in self.sistema.partidos:
+            for evento in p.eventos:
+                if isinstance(evento, Gol) and evento.equipo in (p.equipo_local, p.equipo_visitante):
+                    tramo = evento.tiempo // intervalo
+                    if tramo >= len(histograma):
+                        histograma.extend([0] * (tramo + 1 - len(histograma)))
+                    histograma[tramo] += 1
+        return histograma
+    
+    def tarjetas_por_equipo(self) -> Dict[str, Dict[str, int]]:
+        """Cantidad de amarillas y rojas de cada equipo"""
+        if self.usar_numpy:
+            ev = self.eventos()
+            num_equipos = len(ev.codigos)
+            amarillas = np.bincount(ev.equipo[ev.tipo == TIPO_AMARILLA], minlength=num_equipos).tolist()
+            rojas = np.bincount(ev.equipo[ev.tipo == TIPO_ROJA], minlength=num_equipos).tolist()
+            return {codigo: {'amarillas': amarillas[i], 'rojas': rojas[i]}
+                    for i, codigo in enumerate(ev.codigos)}
+        
+        self._sincronizar_equipos()
+        tarjetas = {codigo: {'amarillas': 0, 'rojas': 0} for codigo in self._codigos}
+        for p in self.sistema.partidos:
+            for evento in p.eventos:
+                if isinstance(evento, Tarjeta) and evento.equipo in (p.equipo_local, p.equipo_visitante):
+                    clave = 'rojas' if evento.color.upper() == 'ROJA' else 'amarillas'
+                    tarjetas[evento.equipo][clave] += 1
+        return tarjetas
+    
+    def local_visitante(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Rendimiento de cada equipo separado en partidos de local y de visitante"""
+        if self.usar_numpy:
+            ev = self.eventos()
+            num_equipos = len(ev.codigos)
+            goles_local, goles_visitante = self._goles_por_partido(ev)
+            
+            def resumen(equipos, goles_propios, goles_rivales):
+                contar = lambda pesos: np.bincount(equipos, pesos, num_equipos).astype(np.int64).tolist()
+                ganados = goles_propios > goles_rivales
+                empatados = goles_propios == goles_rivales
+                return {
+                    'partidos_jugados': contar(None),
+                    'ganados': contar(ganados),
+                    'empatados': contar(empatados),
+                    'perdidos': contar(goles_propios < goles_rivales),
+                    'goles_a_favor': contar(goles_propios),
+                    'goles_en_contra': contar(goles_rivales),
+                    'puntos': contar(np.where(ganados, 3, np.where(empatados, 1, 0)))
+                }
+            
+            lados = {'local': resumen(ev.local, goles_local, goles_visitante),
+                     'visitante': resumen(ev.visitante, goles_visitante, goles_local)}
+            return {codigo: {lado: {clave: valores[i] for clave, valores in columnas.items()}
+                             for lado, columnas in lados.items()}
+                    for i, codigo in enumerate(ev.codigos)}
+        
+        self._sincronizar_equipos()
+        ceros = lambda: dict.fromkeys(('partidos_jugados', 'ganados', 'empatados', 'perdidos',
+                                       'goles_a_favor', 'goles_en_contra', 'puntos'), 0)
+        splits = {codigo: {'local': ceros(), 'visitante': ceros()} for codigo in self._codigos}
+        for p in self.sistema.partidos:
+            resultado = p.obtener_resultado()
+            for lado, codigo, propios, rivales in (
+                    ('local', p.equipo_local, resultado['local'], resultado['visitante']),
+                    ('visitante', p.equipo_visitante, resultado['visitante'], resultado['local'])):
+                stats = splits[codigo][lado]
+                stats['partidos_jugados'] += 1
+                stats['goles_a_favor'] += propios
+                stats['goles_en_contra'] += rivales
+                if propios > rivales:
+                    stats['ganados'] += 1
+                    stats['puntos'] += 3
+                elif propios == rivales:
+                    stats['empatados'] += 1
+                    stats['puntos'] += 1
+                else:
+                    stats['perdidos'] += 1
+        return splits
+
+
+def exportar_eventos(sistema: SistemaFutbol) -> EventosColumnares:
+    """Exporta los eventos de un sistema a columnas NumPy"""
+    return Analitica(sistema, usar_numpy=True).eventos()
@@ -1,4 +1,8 @@
-from .dsl_externo import ParserFutbol, procesar_archivo_partidos, procesar_comando_partido
-
-__all__ = ['ParserFutbol', 'procesar_archivo_partidos', 'procesar_comando_partido']
+from .dsl_externo import (ParserFutbol, ErrorComando, Diagnostico, LexerRapido, procesar_archivo_partidos,
+                          procesar_comando_partido)
+from .importador import ResultadoArchivo, ResumenImportacion, importar_archivo, importar_en_lote
+from .servidor import EstadisticasServidor, ServidorIngesta
 
+__all__ = ['ParserFutbol', 'ErrorComando', 'procesar_archivo_partidos', 'procesar_comando_partido',
+           'Diagnostico', 'LexerRapido', 'ResultadoArchivo', 'ResumenImportacion', 'importar_archivo',
+           'importar_en_lote', 'EstadisticasServidor', 'ServidorIngesta']
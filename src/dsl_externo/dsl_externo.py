@@ -3,15 +3,18 @@ DSL Externo con PLY para gestión de partidos de fútbol
 Permite procesar comandos desde archivos de texto o consola
 """
 
+import re
 import ply.lex as lex
 import ply.yacc as yacc
+from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 import sys
 import os
 # Agregar el directorio raíz al path para importar models
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-from models import Partido, SistemaFutbol
+from models import Cambio, EstadoPartido, Evento, Gol, Partido, SistemaFutbol, Tarjeta
+from src.instrumentacion import contar, medido
 
 
 # Tokens del lexer
@@ -28,30 +31,27 @@ tokens = (
     'GOL',
     'TARJETA',
     'CAMBIO',
-    'NUMERO',
+    'VALOR_FECHA',
+    'VALOR_FORMACION',
+    'LISTA_NUMEROS',
     'CODIGO_EQUIPO',
     'COLOR',
-    'TIEMPO',
+    'COMANDO',
     'COMA',
-    'GUION',
-    'DOS_PUNTOS',
-    'PUNTO_COMA',
-    'PARENTESIS_ABRE',
-    'PARENTESIS_CIERRA',
-    'CADENA',
-    'NUEVA_LINEA'
+    'NUEVA_LINEA',
+    'ILEGAL'
 )
 
+# Las palabras clave, códigos y colores se reconocen sin distinguir mayúsculas
+FLAGS_LEXER = re.VERBOSE | re.IGNORECASE
+COLORES = frozenset(('AMARILLA', 'ROJA'))
+
 # Reglas de tokens simples
 t_COMA = r','
-t_GUION = r'-'
-t_DOS_PUNTOS = r':'
-t_PUNTO_COMA = r';'
-t_PARENTESIS_ABRE = r'\('
-t_PARENTESIS_CIERRA = r'\)'
-t_NUEVA_LINEA = r'\n'
-
-# Reglas de tokens complejos
+t_ignore = ' \t\r'
+t_ignore_COMMENT = r'\#[^\n]*'
+
+# Reglas de tokens complejos: los comandos van primero para tener prioridad
 def t_FECHA(t):
     r'FECHA\s*:'
     return t
@@ -100,187 +100,626 @@ def t_CAMBIO(t):
     r'CAMBIO\s*:'
     return t
 
-def t_CODIGO_EQUIPO(t):
-    r'[A-Z]{3}'
+def t_COMANDO(t):
+    r'[^\W\d_]+([ \t]+[^\W\d_]+)*[ \t]*:'
+    # Comando que no es del lenguaje: la gramática lo informa como desconocido
+    t.value = t.value[:-1].strip().upper()
     return t
 
-def t_COLOR(t):
-    r'(AMARILLA|ROJA)'
+def t_VALOR_FECHA(t):
+    r'\d{1,2}/\d{1,2}/\d{4}'
     return t
 
-def t_TIEMPO(t):
-    r'\d{1,3}'
-    t.value = int(t.value)
+def t_VALOR_FORMACION(t):
+    r'\d+(-\d+)+'
     return t
 
-def t_NUMERO(t):
-    r'\d{1,2}'
-    t.value = int(t.value)
+def t_LISTA_NUMEROS(t):
+    r'\d+([ \t]*,[ \t]*\d+)*'
+    # Una lista completa es un solo token: la gramática no reduce número por número
+    t.value = [int(numero) for numero in t.value.split(',')]
     return t
 
-def t_CADENA(t):
-    r'"[^"]*"'
-    t.value = t.value[1:-1]  # Remover comillas
+def t_CODIGO_EQUIPO(t):
+    r'[A-Z][A-Z0-9_]*'
+    # Un único objeto str por código para los partidos que se acumulan en memoria
+    t.value = sys.intern(t.value.upper())
+    if t.value in COLORES:
+        t.type = 'COLOR'
     return t
 
-def t_COMMENT(t):
-    r'\#.*'
-    pass  # Ignorar comentarios
-
-def t_WHITESPACE(t):
-    r'[ \t]+'
-    pass  # Ignorar espacios y tabs
+def t_NUEVA_LINEA(t):
+    r'\n'
+    t.lexer.lineno += 1
+    return t
 
 def t_error(t):
-    print(f"Carácter ilegal '{t.value[0]}' en línea {t.lineno}")
+    # El carácter pasa al parser como ILEGAL para que descarte el partido
+    t.type = 'ILEGAL'
+    t.value = t.value[0]
     t.lexer.skip(1)
+    return t
 
 
-# Reglas de gramática
-def p_partido(p):
-    '''partido : FECHA fecha
-               | EQUIPO_LOCAL CODIGO_EQUIPO
-               | EQUIPO_VISITANTE CODIGO_EQUIPO
-               | FORMACION_LOCAL formacion
-               | FORMACION_VISITANTE formacion
-               | TITULARES_LOCAL lista_numeros
-               | TITULARES_VISITANTE lista_numeros
-               | BANCO_LOCAL lista_numeros
-               | BANCO_VISITANTE lista_numeros
-               | evento'''
-    pass
-
-def p_fecha(p):
-    '''fecha : CADENA'''
-    p[0] = p[1]
-
-def p_formacion(p):
-    '''formacion : NUMERO GUION NUMERO GUION NUMERO'''
-    p[0] = f"{p[1]}-{p[3]}-{p[5]}"
-
-def p_lista_numeros(p):
-    '''lista_numeros : NUMERO
-                     | NUMERO COMA lista_numeros'''
+# Reglas de gramática: un archivo es una secuencia de partidos, cada uno
+# iniciado por FECHA:, con una sentencia por línea
+start = 'archivo'
+
+def p_archivo(p):
+    '''archivo : preambulo partidos
+               | preambulo'''
+    partidos = p[2] if len(p) == 3 else []
+    if p.lexer.preambulo:
+        # Sentencias sin ningún FECHA: en todo el archivo
+        partido = _construir_partido(p.lexer, p.lexer.preambulo)
+        p.lexer.preambulo = None
+        if partido is not None:
+            partidos.append(partido)
+    p[0] = partidos
+
+def p_preambulo(p):
+    '''preambulo : cuerpo'''
+    # Las sentencias previas al primer FECHA: se suman al primer partido. Como en el
+    # camino por líneas, un evento que abre el archivo no tiene partido al que sumarse
+    sentencias = p[1]
+    if sentencias and sentencias[0][0] == 'evento' and sentencias[0][1] is not None:
+        _, _, posicion, linea = sentencias[0]
+        _registrar_diagnostico(p.lexer, linea, _columna_datos(p.lexer.lexdata, posicion),
+                               "Debe configurar el partido antes de agregar eventos")
+        sentencias[0] = ('error', None, posicion, linea)
+    p.lexer.preambulo = sentencias
+
+def p_partidos(p):
+    '''partidos : partidos partido
+                | partido'''
     if len(p) == 2:
-        p[0] = [p[1]]
+        p[0] = [] if p[1] is None else [p[1]]
     else:
-        p[0] = [p[1]] + p[3]
-
-def p_evento(p):
-    '''evento : gol
-              | tarjeta
-              | cambio'''
-    p[0] = p[1]
-
-def p_gol(p):
-    '''gol : GOL CODIGO_EQUIPO COMA TIEMPO COMA NUMERO COMA NUMERO
-           | GOL CODIGO_EQUIPO COMA TIEMPO COMA NUMERO'''
-    if len(p) == 8:
-        p[0] = {
-            'tipo': 'gol',
-            'equipo': p[2],
-            'tiempo': p[4],
-            'autor': p[6],
-            'asistente': p[8]
-        }
+        p[0] = p[1]
+        if p[2] is not None:
+            p[0].append(p[2])
+
+def p_partido(p):
+    '''partido : encabezado cuerpo'''
+    sentencias = p[2]
+    sentencias.insert(0, p[1])
+    if p.lexer.preambulo:
+        sentencias[:0] = p.lexer.preambulo
+        p.lexer.preambulo = None
+    p[0] = _construir_partido(p.lexer, sentencias)
+
+def p_encabezado(p):
+    '''encabezado : FECHA VALOR_FECHA NUEVA_LINEA
+                  | FECHA error NUEVA_LINEA'''
+    if p.slice[2].type == 'error':
+        p[0] = ('error', None, p.lexpos(1), p.lineno(1))
+        p.parser.errok()
     else:
-        p[0] = {
-            'tipo': 'gol',
-            'equipo': p[2],
-            'tiempo': p[4],
-            'autor': p[6],
-            'asistente': None
-        }
-
-def p_tarjeta(p):
-    '''tarjeta : TARJETA CODIGO_EQUIPO COMA TIEMPO COMA NUMERO COMA COLOR'''
-    p[0] = {
-        'tipo': 'tarjeta',
-        'equipo': p[2],
-        'tiempo': p[4],
-        'jugador': p[6],
-        'color': p[8]
-    }
-
-def p_cambio(p):
-    '''cambio : CAMBIO CODIGO_EQUIPO COMA TIEMPO COMA NUMERO COMA NUMERO'''
-    p[0] = {
-        'tipo': 'cambio',
-        'equipo': p[2],
-        'tiempo': p[4],
-        'jugador_sale': p[6],
-        'jugador_entra': p[8]
-    }
+        p[0] = ('fecha', p[2], p.lexpos(1) + len(p[1]), p.lineno(1))
+
+def p_cuerpo(p):
+    '''cuerpo : cuerpo sentencia
+              | '''
+    if len(p) == 1:
+        p[0] = []
+    else:
+        p[0] = p[1]
+        if p[2] is not None:
+            p[0].append(p[2])
+
+def p_sentencia_vacia(p):
+    '''sentencia : NUEVA_LINEA'''
+    p[0] = None
+
+def p_sentencia_dato(p):
+    '''sentencia : EQUIPO_LOCAL CODIGO_EQUIPO NUEVA_LINEA
+                 | EQUIPO_VISITANTE CODIGO_EQUIPO NUEVA_LINEA
+                 | FORMACION_LOCAL VALOR_FORMACION NUEVA_LINEA
+                 | FORMACION_VISITANTE VALOR_FORMACION NUEVA_LINEA
+                 | TITULARES_LOCAL LISTA_NUMEROS NUEVA_LINEA
+                 | TITULARES_VISITANTE LISTA_NUMEROS NUEVA_LINEA
+                 | BANCO_LOCAL LISTA_NUMEROS NUEVA_LINEA
+                 | BANCO_VISITANTE LISTA_NUMEROS NUEVA_LINEA'''
+    p[0] = (_CAMPOS[p.slice[1].type], p[2], p.lexpos(1) + len(p[1]), p.lineno(1))
+
+def p_sentencia_gol(p):
+    '''sentencia : GOL CODIGO_EQUIPO COMA LISTA_NUMEROS NUEVA_LINEA'''
+    numeros = p[4]
+    if 2 <= len(numeros) <= 3:
+        asistente = numeros[2] if len(numeros) == 3 else None
+        evento = Gol(numeros[0], p[2], numeros[1], asistente)
+    else:
+        evento = _formato_invalido(p, "Formato de gol inválido. Use: EQUIPO, TIEMPO, AUTOR [, ASISTENTE]")
+    p[0] = ('evento', evento, p.lexpos(1) + len(p[1]), p.lineno(1))
+
+def p_sentencia_tarjeta(p):
+    '''sentencia : TARJETA CODIGO_EQUIPO COMA LISTA_NUMEROS COMA COLOR NUEVA_LINEA
+                 | TARJETA CODIGO_EQUIPO COMA LISTA_NUMEROS COMA CODIGO_EQUIPO NUEVA_LINEA
+                 | TARJETA CODIGO_EQUIPO COMA LISTA_NUMEROS NUEVA_LINEA'''
+    # Los colores inválidos (un código o un número al final) se informan como en
+    # `_procesar_tarjeta`: primero la cantidad de datos y después el color
+    numeros = p[4]
+    datos = len(numeros) + (len(p) == 8)
+    if datos != 3:
+        evento = _formato_invalido(p, "Formato de tarjeta inválido. Use: EQUIPO, TIEMPO, JUGADOR, COLOR")
+    elif p.slice[-2].type != 'COLOR':
+        evento = _formato_invalido(p, "El color debe ser AMARILLA o ROJA")
+    else:
+        evento = Tarjeta(numeros[0], p[2], numeros[1], p[6])
+    p[0] = ('evento', evento, p.lexpos(1) + len(p[1]), p.lineno(1))
+
+def p_sentencia_cambio(p):
+    '''sentencia : CAMBIO CODIGO_EQUIPO COMA LISTA_NUMEROS NUEVA_LINEA'''
+    numeros = p[4]
+    if len(numeros) == 3:
+        evento = Cambio(numeros[0], p[2], numeros[1], numeros[2])
+    else:
+        evento = _formato_invalido(p, "Formato de cambio inválido. Use: EQUIPO, TIEMPO, SALE, ENTRA")
+    p[0] = ('evento', evento, p.lexpos(1) + len(p[1]), p.lineno(1))
+
+def p_sentencia_error(p):
+    '''sentencia : error NUEVA_LINEA'''
+    # p_error ya registró el diagnóstico; se sigue en la línea siguiente
+    p[0] = ('error', None, p.lexpos(2), p.lineno(2))
+    p.parser.errok()
+
+_PATRON_LISTA = re.compile(t_LISTA_NUMEROS.__doc__)
 
 def p_error(p):
     if p:
-        print(f"Error de sintaxis en '{p.value}' en línea {p.lineno}")
-    else:
-        print("Error de sintaxis al final del archivo")
+        if p.type == 'ILEGAL':
+            mensaje = f"Carácter ilegal '{p.value}'"
+        elif p.type == 'COMANDO':
+            mensaje = f"Comando desconocido: {p.value}"
+        elif p.type == 'NUEVA_LINEA':
+            mensaje = "Error de sintaxis: fin de línea inesperado"
+        else:
+            # El valor de una lista de números ya es una list: se muestra el texto del archivo
+            valor = (_PATRON_LISTA.match(p.lexer.lexdata, p.lexpos).group()
+                     if p.type == 'LISTA_NUMEROS' else p.value)
+            mensaje = f"Error de sintaxis en '{valor}'"
+        _registrar_diagnostico(p.lexer, p.lineno, _columna(p.lexer.lexdata, p.lexpos), mensaje)
+    elif _lexer_activo is not None:
+        datos = _lexer_activo.lexdata
+        _registrar_diagnostico(_lexer_activo, _lexer_activo.lineno, _columna(datos, len(datos)),
+                               "Error de sintaxis: fin de entrada inesperado")
+
+
+def _formato_invalido(p, mensaje: str) -> None:
+    """Registra un evento con datos incorrectos; el partido se descarta"""
+    columna = _columna_datos(p.lexer.lexdata, p.lexpos(1) + len(p[1]))
+    _registrar_diagnostico(p.lexer, p.lineno(1), columna, mensaje)
+    return None
+
+
+# Campo del partido que asigna cada comando
+_CAMPOS = {
+    'EQUIPO_LOCAL': 'equipo_local',
+    'EQUIPO_VISITANTE': 'equipo_visitante',
+    'FORMACION_LOCAL': 'formacion_local',
+    'FORMACION_VISITANTE': 'formacion_visitante',
+    'TITULARES_LOCAL': 'titulares_local',
+    'TITULARES_VISITANTE': 'titulares_visitante',
+    'BANCO_LOCAL': 'banco_local',
+    'BANCO_VISITANTE': 'banco_visitante',
+}
+
+CAMPOS_REQUERIDOS = ('fecha', 'equipo_local', 'equipo_visitante',
+                     'formacion_local', 'formacion_visitante',
+                     'titulares_local', 'titulares_visitante',
+                     'banco_local', 'banco_visitante')
+
+
+def _validar_campo(sistema: SistemaFutbol, campo: str, valor, datos: Dict[str, Any]):
+    """Valida y convierte el valor de un comando, con las mismas reglas que `ejecutar_comando`"""
+    if campo == 'fecha':
+        dia, mes, anio = valor.split('/')
+        try:
+            return datetime(int(anio), int(mes), int(dia))
+        except ValueError:
+            raise ValueError(f"Formato de fecha inválido: {valor}. Use DD/MM/YYYY")
+    
+    if campo in ('equipo_local', 'equipo_visitante'):
+        if len(valor) != 3:
+            raise ValueError("El código del equipo debe tener 3 letras")
+        if sistema.obtener_equipo(valor) is None:
+            raise ValueError(f"El equipo {valor} no está registrado")
+    elif campo.startswith(('titulares', 'banco')):
+        if campo.startswith('titulares') and len(valor) != 11:
+            raise ValueError("Debe haber exactamente 11 titulares")
+        # Los jugadores se validan si el equipo ya fue indicado
+        codigo = datos.get('equipo_local' if campo.endswith('local') else 'equipo_visitante')
+        equipo = sistema.obtener_equipo(codigo) if codigo else None
+        if equipo:
+            for num in valor:
+                if not equipo.obtener_jugador(num):
+                    raise ValueError(f"El jugador #{num} no existe en el equipo {equipo.codigo}")
+    return valor
+
+
+def _construir_partido(lexer, sentencias: List[tuple]) -> Optional[Partido]:
+    """Construye el partido de un bloque FECHA: a partir de sus sentencias.
+    
+    Cada sentencia es (campo, valor, posición de los datos, línea). Los
+    errores se agregan a los diagnósticos del lexer y descartan el partido.
+    """
+    datos: Dict[str, Any] = {}
+    eventos: List[Evento] = []
+    valido = True
+    for campo, valor, posicion, linea in sentencias:
+        if campo == 'evento' and valor is not None:
+            eventos.append(valor)
+        elif campo == 'error' or campo == 'evento':
+            valido = False
+        else:
+            try:
+                datos[campo] = _validar_campo(lexer.sistema, campo, valor, datos)
+            except ValueError as e:
+                valido = False
+                _registrar_diagnostico(lexer, linea, _columna_datos(lexer.lexdata, posicion), str(e))
+    
+    if not valido or not sentencias:
+        return None
+    for campo in CAMPOS_REQUERIDOS:
+        if campo not in datos:
+            _registrar_diagnostico(lexer, sentencias[0][3], 1,
+                                   f"Partido inválido: Falta el campo requerido: {campo}")
+            return None
+    contar('partidos_finalizados')
+    contar('eventos_creados', len(eventos))
+    return Partido(eventos=eventos, **datos)
+
+
+@dataclass
+class Diagnostico:
+    """Error detectado en una línea del DSL externo"""
+    linea: int
+    columna: int
+    mensaje: str
+    archivo: Optional[str] = None
+    
+    def __str__(self):
+        ubicacion = f"{self.archivo}:" if self.archivo else "línea "
+        return f"{ubicacion}{self.linea}:{self.columna}: {self.mensaje}"
+
+
+# Lexer del análisis en curso, para ubicar los errores de fin de entrada en p_error
+_lexer_activo = None
+
+
+def _columna(datos: str, posicion: int) -> int:
+    """Columna (desde 1) de una posición dentro del texto analizado"""
+    return posicion - datos.rfind('\n', 0, posicion)
+
+
+def _columna_datos(datos: str, posicion: int) -> int:
+    """Columna del primer carácter no blanco desde `posicion` (los datos de un comando)"""
+    while datos[posicion:posicion + 1] in (' ', '\t'):
+        posicion += 1
+    return _columna(datos, posicion)
+
+
+def _registrar_diagnostico(lexer, linea: int, columna: int, mensaje: str):
+    """Agrega un diagnóstico a la lista del lexer en lugar de imprimirlo"""
+    if not hasattr(lexer, 'diagnosticos'):
+        lexer.diagnosticos = []
+    lexer.diagnosticos.append(Diagnostico(linea, columna, mensaje))
+
+
+class ErrorComando(ValueError):
+    """Comando con formato inválido o desconocido"""
+    
+    def __init__(self, mensaje: str, columna: int = 1):
+        super().__init__(mensaje)
+        self.columna = columna
+
+
+def columna_del_error(comando: str, error: Exception) -> int:
+    """Columna (desde 1) a la que se atribuye un error de `ParserFutbol.ejecutar_comando`.
+    
+    Si el mensaje cita un fragmento del comando ('...'), se ubica en ese
+    fragmento; si no, al comienzo de los datos, después de los dos puntos.
+    """
+    if isinstance(error, ErrorComando):
+        return error.columna
+    dos_puntos = comando.find(':')
+    if dos_puntos < 0:
+        return 1
+    
+    citado = re.search(r"'([^']+)'", str(error))
+    if citado:
+        posicion = comando.find(citado.group(1), dos_puntos + 1)
+        if posicion >= 0:
+            return posicion + 1
+    
+    datos = comando[dos_puntos + 1:]
+    return dos_puntos + 2 + len(datos) - len(datos.lstrip())
+
+
+class TokenDSL:
+    """Token del lexer rápido, con los mismos atributos que `ply.lex.LexToken`"""
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+    
+    def __init__(self, tipo: str, valor, linea: int, posicion: int, lexer):
+        self.type = tipo
+        self.value = valor
+        self.lineno = linea
+        self.lexpos = posicion
+        self.lexer = lexer
+    
+    def __repr__(self):
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+
+# Reglas del lexer PLY en su orden de prioridad: las expresiones del lexer
+# rápido se arman con sus mismas expresiones para producir los mismos tokens
+_REGLAS_COMANDOS = (t_FECHA, t_EQUIPO_LOCAL, t_EQUIPO_VISITANTE, t_FORMACION_LOCAL,
+                    t_FORMACION_VISITANTE, t_TITULARES_LOCAL, t_TITULARES_VISITANTE,
+                    t_BANCO_LOCAL, t_BANCO_VISITANTE, t_GOL, t_TARJETA, t_CAMBIO)
+_REGLAS_LEXER = _REGLAS_COMANDOS + (t_COMANDO, t_VALOR_FECHA, t_VALOR_FORMACION, t_LISTA_NUMEROS,
+                                    t_CODIGO_EQUIPO, t_NUEVA_LINEA)
+
+_PATRON_RAPIDO = re.compile(
+    # Espacios y comentarios se consumen como prefijo de cada token; FIN evita que
+    # el prefijo retroceda al final del texto y deje un blanco o un # como ILEGAL
+    r'(?:[ \t\r]+|\#[^\n]*)*(?:'
+    + '|'.join(f'(?P<{regla.__name__[2:]}>{regla.__doc__})' for regla in _REGLAS_LEXER)
+    + r'|(?P<COMA>,)|(?P<FIN>\Z)|(?P<ILEGAL>[^\n]))',
+    FLAGS_LEXER)
+
+# Línea regular completa (comando y datos, o vacía/comentario) en una sola coincidencia.
+# Las alternativas de los datos siguen la prioridad del lexer PLY en esa posición
+_PATRON_LINEA = re.compile(
+    r'[ \t\r]*(?:(?P<comando>' + '|'.join(regla.__doc__ for regla in _REGLAS_COMANDOS) + r')[ \t\r]*'
+    r'(?:(?P<fecha>' + t_VALOR_FECHA.__doc__ + r')'
+    r'|(?P<formacion>' + t_VALOR_FORMACION.__doc__ + r')'
+    r'|(?P<lista>' + t_LISTA_NUMEROS.__doc__ + r')'
+    r'|(?P<codigo>' + t_CODIGO_EQUIPO.__doc__ + r')[ \t\r]*(?P<coma>,)[ \t\r]*'
+    r'(?P<numeros>' + t_LISTA_NUMEROS.__doc__ + r')'
+    r'(?:[ \t\r]*(?P<coma_color>,)[ \t\r]*(?P<color>' + t_CODIGO_EQUIPO.__doc__ + r'))?'
+    r'|(?P<equipo>' + t_CODIGO_EQUIPO.__doc__ + r'))[ \t\r]*)?(?:\#[^\n]*)?\n',
+    FLAGS_LEXER)
+
+# Un identificador al final de la línea con una de estas palabras puede empezar un
+# comando que continúa en la línea siguiente (p. ej. "EQUIPO\nLOCAL:"): va por la maestra
+_INICIOS_DE_COMANDO = frozenset(regla.__doc__.split('\\')[0] for regla in _REGLAS_COMANDOS)
+
+
+def _tipo_comando(texto: str) -> str:
+    """Tipo de token de un comando reconocido, p. ej. 'EQUIPO  local :' -> EQUIPO_LOCAL"""
+    return '_'.join(texto[:-1].upper().split())
+
+
+class LexerRapido:
+    """Lexer del DSL externo sin una función por token.
+    
+    Cada línea regular (un comando con sus datos, o una línea vacía o de
+    comentario) se reconoce con una sola coincidencia y sus tokens se emiten
+    directamente; las demás líneas se recorren con una expresión maestra de
+    grupos con nombre. Ambas se arman con las reglas del lexer PLY y producen
+    la misma secuencia de tokens (tipos, valores, líneas y posiciones). Se
+    usa con `ParserFutbol(sistema, lexer_rapido=True)`.
+    """
+    
+    def __init__(self):
+        self.lexdata = ''
+        self.lexpos = 0
+        self.lineno = 1
+        self.diagnosticos: List[Diagnostico] = []
+        self._tokens = iter(())
+        self._tipos_comando: Dict[str, str] = {}
+    
+    def clone(self) -> 'LexerRapido':
+        return LexerRapido()
+    
+    def input(self, datos: str):
+        self.lexdata = datos
+        self.lexpos = 0
+        self._tokens = self._generar(datos)
+    
+    def token(self) -> Optional[TokenDSL]:
+        return next(self._tokens, None)
+    
+    def __iter__(self):
+        return self._tokens
+    
+    def _generar(self, datos: str):
+        """Genera los tokens de `datos`, actualizando `lineno` en cada salto de línea"""
+        coincidir_linea = _PATRON_LINEA.match
+        tipos_comando = self._tipos_comando
+        colores = COLORES
+        intern = sys.intern
+        linea = self.lineno
+        posicion = 0
+        fin = len(datos)
+        while posicion < fin:
+            m = coincidir_linea(datos, posicion)
+            if m is not None:
+                comando, fecha, formacion, lista, codigo, numeros, color, equipo = m.group(
+                    'comando', 'fecha', 'formacion', 'lista', 'codigo', 'numeros', 'color', 'equipo')
+                identificador = color or equipo
+                if identificador is None or identificador.upper() not in _INICIOS_DE_COMANDO:
+                    if comando is not None:
+                        tipo = tipos_comando.get(comando)
+                        if tipo is None:
+                            tipo = tipos_comando[comando] = _tipo_comando(comando)
+                        yield TokenDSL(tipo, comando, linea, m.start('comando'), self)
+                        if fecha is not None:
+                            yield TokenDSL('VALOR_FECHA', fecha, linea, m.start('fecha'), self)
+                        elif formacion is not None:
+                            yield TokenDSL('VALOR_FORMACION', formacion, linea, m.start('formacion'), self)
+                        elif lista is not None:
+                            yield TokenDSL('LISTA_NUMEROS', [int(numero) for numero in lista.split(',')],
+                                           linea, m.start('lista'), self)
+                        elif equipo is not None:
+                            equipo = intern(equipo.upper())
+                            yield TokenDSL('COLOR' if equipo in colores else 'CODIGO_EQUIPO', equipo,
+                                           linea, m.start('equipo'), self)
+                        else:
+                            codigo = intern(codigo.upper())
+                            yield TokenDSL('COLOR' if codigo in colores else 'CODIGO_EQUIPO', codigo,
+                                           linea, m.start('codigo'), self)
+                            yield TokenDSL('COMA', ',', linea, m.start('coma'), self)
+                            yield TokenDSL('LISTA_NUMEROS', [int(numero) for numero in numeros.split(',')],
+                                           linea, m.start('numeros'), self)
+                            if color is not None:
+                                yield TokenDSL('COMA', ',', linea, m.start('coma_color'), self)
+                                color = color.upper()
+                                yield TokenDSL('COLOR' if color in colores else 'CODIGO_EQUIPO', color,
+                                               linea, m.start('color'), self)
+                    posicion = m.end()
+                    yield TokenDSL('NUEVA_LINEA', '\n', linea, posicion - 1, self)
+                    linea += 1
+                    self.lineno = linea
+                    self.lexpos = posicion
+                    continue
+            
+            # Línea irregular: se recorre con la expresión maestra hasta su salto de línea
+            for coincidencia in _PATRON_RAPIDO.finditer(datos, posicion):
+                tipo = coincidencia.lastgroup
+                if tipo == 'FIN':
+                    posicion = fin
+                    break
+                inicio = coincidencia.start(tipo)
+                valor = coincidencia.group(tipo)
+                posicion = self.lexpos = coincidencia.end()
+                if tipo == 'NUEVA_LINEA':
+                    yield TokenDSL(tipo, valor, linea, inicio, self)
+                    linea += 1
+                    self.lineno = linea
+                    break
+                elif tipo == 'LISTA_NUMEROS':
+                    yield TokenDSL(tipo, [int(numero) for numero in valor.split(',')], linea, inicio, self)
+                elif tipo == 'CODIGO_EQUIPO':
+                    valor = intern(valor.upper())
+                    yield TokenDSL('COLOR' if valor in colores else tipo, valor, linea, inicio, self)
+                elif tipo == 'COMANDO':
+                    yield TokenDSL(tipo, valor[:-1].strip().upper(), linea, inicio, self)
+                else:
+                    yield TokenDSL(tipo, valor, linea, inicio, self)
+
+
+# Lexer y parser LALR compartidos, construidos una sola vez por proceso
+_lexer_base = None
+_parser_base = None
+
+
+def _obtener_lexer_parser():
+    """Construye (la primera vez) y devuelve el lexer y el parser compartidos.
+    
+    Las tablas LALR se cargan del parsetab.py incluido en el paquete en modo
+    optimize, sin validar la gramática ni escribir archivos.
+    """
+    global _lexer_base, _parser_base
+    if _parser_base is None:
+        _lexer_base = lex.lex(reflags=FLAGS_LEXER)
+        _parser_base = yacc.yacc(optimize=True, debug=False, write_tables=False)
+    return _lexer_base, _parser_base
 
 
 class ParserFutbol:
-    """Parser para comandos de partidos de fútbol"""
+    """Parser para comandos de partidos de fútbol.
+    
+    Con `en_vivo=True` cada gol, tarjeta y cambio se valida contra el estado
+    en vivo del partido (`EstadoPartido`) apenas llega: los eventos deben
+    enviarse en orden cronológico y después de los planteles.
     
-    def __init__(self, sistema: SistemaFutbol):
+    Con `lexer_rapido=True` `analizar_texto` tokeniza con `LexerRapido` en
+    lugar del lexer PLY; la gramática y los resultados son los mismos.
+    """
+    
+    def __init__(self, sistema: SistemaFutbol, en_vivo: bool = False, lexer_rapido: bool = False):
         self.sistema = sistema
-        self.lexer = lex.lex()
-        self.parser = yacc.yacc()
+        self.en_vivo = en_vivo
+        lexer_base, self.parser = _obtener_lexer_parser()
+        # Cada instancia usa su propia copia del lexer para no compartir estado
+        self.lexer = LexerRapido() if lexer_rapido else lexer_base.clone()
+        # Errores de léxico, sintaxis y validación de analizar_texto
+        self.diagnosticos: List[Diagnostico] = []
+        self.lexer.diagnosticos = self.diagnosticos
         self.partido_actual: Optional[Dict[str, Any]] = None
     
-    def procesar_linea(self, linea: str) -> Optional[Dict[str, Any]]:
-        """Procesa una línea de comando"""
+    @medido('dsl.analizar_texto')
+    def analizar_texto(self, texto: str, linea_inicial: int = 1) -> List[Partido]:
+        """Analiza un texto con uno o más partidos en una sola llamada a la gramática.
+        
+        Devuelve los partidos válidos, en orden, sin agregarlos al sistema. Los
+        errores no se imprimen: se agregan a `diagnosticos`, ordenados por
+        línea, y descartan el partido en el que aparecen; el análisis sigue en
+        la línea siguiente.
+        """
+        global _lexer_activo
+        if not texto.endswith('\n'):
+            texto += '\n'
+        errores_previos = len(self.diagnosticos)
+        lexer = self.lexer
+        lexer.lineno = linea_inicial
+        lexer.sistema = self.sistema
+        lexer.preambulo = None
+        _lexer_activo = lexer
         try:
-            resultado = self.parser.parse(linea.strip(), lexer=self.lexer)
-            return resultado
-        except Exception as e:
-            print(f"Error procesando línea: {linea}")
-            print(f"Error: {e}")
-            return None
+            partidos = self.parser.parse(texto, lexer=lexer)
+        finally:
+            _lexer_activo = None
+            lexer.preambulo = None
+        contar('lineas_analizadas', lexer.lineno - linea_inicial)
+        if len(self.diagnosticos) > errores_previos:
+            self.diagnosticos[errores_previos:] = sorted(
+                self.diagnosticos[errores_previos:], key=lambda d: (d.linea, d.columna))
+        return partidos or []
+    
+    def analizar_archivo(self, archivo_path: str) -> List[Partido]:
+        """Lee un archivo completo y lo analiza con `analizar_texto`"""
+        with open(archivo_path, 'r', encoding='utf-8') as archivo:
+            return self.analizar_texto(archivo.read())
     
     def procesar_comando(self, comando: str) -> bool:
         """Procesa un comando completo"""
+        try:
+            self.ejecutar_comando(comando)
+            return True
+        except ErrorComando as e:
+            print(e)
+            return False
+        except Exception as e:
+            print(f"Error procesando comando '{comando}': {e}")
+            return False
+    
+    def ejecutar_comando(self, comando: str):
+        """Ejecuta un comando completo, lanzando una excepción si es inválido"""
         partes = comando.split(':', 1)
         if len(partes) != 2:
-            print(f"Formato de comando inválido: {comando}")
-            return False
+            raise ErrorComando(f"Formato de comando inválido: {comando}", 1)
         
         tipo_comando = partes[0].strip().upper()
         datos = partes[1].strip()
         
-        try:
-            if tipo_comando == 'FECHA':
-                self._procesar_fecha(datos)
-            elif tipo_comando == 'EQUIPO LOCAL':
-                self._procesar_equipo_local(datos)
-            elif tipo_comando == 'EQUIPO VISITANTE':
-                self._procesar_equipo_visitante(datos)
-            elif tipo_comando == 'FORMACION LOCAL':
-                self._procesar_formacion_local(datos)
-            elif tipo_comando == 'FORMACION VISITANTE':
-                self._procesar_formacion_visitante(datos)
-            elif tipo_comando == 'TITULARES LOCAL':
-                self._procesar_titulares_local(datos)
-            elif tipo_comando == 'TITULARES VISITANTE':
-                self._procesar_titulares_visitante(datos)
-            elif tipo_comando == 'BANCO LOCAL':
-                self._procesar_banco_local(datos)
-            elif tipo_comando == 'BANCO VISITANTE':
-                self._procesar_banco_visitante(datos)
-            elif tipo_comando == 'GOL':
-                self._procesar_gol(datos)
-            elif tipo_comando == 'TARJETA':
-                self._procesar_tarjeta(datos)
-            elif tipo_comando == 'CAMBIO':
-                self._procesar_cambio(datos)
-            else:
-                print(f"Comando desconocido: {tipo_comando}")
-                return False
-            
-            return True
-        except Exception as e:
-            print(f"Error procesando comando '{comando}': {e}")
-            return False
+        if tipo_comando == 'FECHA':
+            self._procesar_fecha(datos)
+        elif tipo_comando == 'EQUIPO LOCAL':
+            self._procesar_equipo_local(datos)
+        elif tipo_comando == 'EQUIPO VISITANTE':
+            self._procesar_equipo_visitante(datos)
+        elif tipo_comando == 'FORMACION LOCAL':
+            self._procesar_formacion_local(datos)
+        elif tipo_comando == 'FORMACION VISITANTE':
+            self._procesar_formacion_visitante(datos)
+        elif tipo_comando == 'TITULARES LOCAL':
+            self._procesar_titulares_local(datos)
+        elif tipo_comando == 'TITULARES VISITANTE':
+            self._procesar_titulares_visitante(datos)
+        elif tipo_comando == 'BANCO LOCAL':
+            self._procesar_banco_local(datos)
+        elif tipo_comando == 'BANCO VISITANTE':
+            self._procesar_banco_visitante(datos)
+        elif tipo_comando == 'GOL':
+            self._procesar_gol(datos)
+        elif tipo_comando == 'TARJETA':
+            self._procesar_tarjeta(datos)
+        elif tipo_comando == 'CAMBIO':
+            self._procesar_cambio(datos)
+        else:
+            raise ErrorComando(f"Comando desconocido: {tipo_comando}", len(comando) - len(comando.lstrip()) + 1)
     
     def _procesar_fecha(self, datos: str):
         """Procesa la fecha del partido"""
@@ -414,16 +853,7 @@ class ParserFutbol:
         if self.partido_actual is None:
             raise ValueError("Debe configurar el partido antes de agregar eventos")
         
-        if 'eventos' not in self.partido_actual:
-            self.partido_actual['eventos'] = []
-        
-        self.partido_actual['eventos'].append({
-            'tipo': 'gol',
-            'equipo': equipo,
-            'tiempo': tiempo,
-            'autor': autor,
-            'asistente': asistente
-        })
+        self._agregar_evento(Gol(tiempo, equipo, autor, asistente))
     
     def _procesar_tarjeta(self, datos: str):
         """Procesa una tarjeta"""
@@ -442,16 +872,7 @@ class ParserFutbol:
         if self.partido_actual is None:
             raise ValueError("Debe configurar el partido antes de agregar eventos")
         
-        if 'eventos' not in self.partido_actual:
-            self.partido_actual['eventos'] = []
-        
-        self.partido_actual['eventos'].append({
-            'tipo': 'tarjeta',
-            'equipo': equipo,
-            'tiempo': tiempo,
-            'jugador': jugador,
-            'color': color
-        })
+        self._agregar_evento(Tarjeta(tiempo, equipo, jugador, color))
     
     def _procesar_cambio(self, datos: str):
         """Procesa un cambio"""
@@ -467,19 +888,45 @@ class ParserFutbol:
         if self.partido_actual is None:
             raise ValueError("Debe configurar el partido antes de agregar eventos")
         
+        self._agregar_evento(Cambio(tiempo, equipo, jugador_sale, jugador_entra))
+    
+    def _agregar_evento(self, evento: Evento):
+        """Agrega un evento al partido actual, validándolo en modo en vivo"""
+        if self.en_vivo:
+            estado = self.estado_en_vivo()
+            if estado is None:
+                raise ValueError("En vivo, los equipos, titulares y bancos deben cargarse antes de los eventos")
+            estado.aplicar(evento)
+        
         if 'eventos' not in self.partido_actual:
             self.partido_actual['eventos'] = []
-        
-        self.partido_actual['eventos'].append({
-            'tipo': 'cambio',
-            'equipo': equipo,
-            'tiempo': tiempo,
-            'jugador_sale': jugador_sale,
-            'jugador_entra': jugador_entra
-        })
+        self.partido_actual['eventos'].append(evento)
     
+    def estado_en_vivo(self) -> Optional[EstadoPartido]:
+        """Estado en vivo del partido actual, creado cuando sus planteles están completos"""
+        if self.partido_actual is None:
+            return None
+        estado = self.partido_actual.get('estado')
+        if estado is None:
+            campos = ('equipo_local', 'equipo_visitante', 'titulares_local', 'titulares_visitante',
+                      'banco_local', 'banco_visitante')
+            if any(campo not in self.partido_actual for campo in campos):
+                return None
+            estado = EstadoPartido(*(self.partido_actual[campo] for campo in campos))
+            self.partido_actual['estado'] = estado
+        return estado
+    
+    @medido('dsl.finalizar_partido')
     def finalizar_partido(self) -> Optional[Partido]:
         """Finaliza el partido actual y lo agrega al sistema"""
+        partido = self.construir_partido()
+        if partido is not None:
+            self.sistema.agregar_partido(partido)
+        return partido
+    
+    @medido('dsl.construir_partido')
+    def construir_partido(self) -> Optional[Partido]:
+        """Construye el partido actual sin agregarlo al sistema"""
         if self.partido_actual is None:
             return None
         
@@ -507,41 +954,24 @@ class ParserFutbol:
         )
         
         # Agregar eventos
-        for evento_data in self.partido_actual.get('eventos', []):
-            if evento_data['tipo'] == 'gol':
-                partido.agregar_gol(
-                    evento_data['equipo'],
-                    evento_data['tiempo'],
-                    evento_data['autor'],
-                    evento_data['asistente']
-                )
-            elif evento_data['tipo'] == 'tarjeta':
-                partido.agregar_tarjeta(
-                    evento_data['equipo'],
-                    evento_data['tiempo'],
-                    evento_data['jugador'],
-                    evento_data['color']
-                )
-            elif evento_data['tipo'] == 'cambio':
-                partido.agregar_cambio(
-                    evento_data['equipo'],
-                    evento_data['tiempo'],
-                    evento_data['jugador_sale'],
-                    evento_data['jugador_entra']
-                )
-        
-        # Agregar al sistema
-        self.sistema.agregar_partido(partido)
+        for evento in self.partido_actual.get('eventos', []):
+            partido.agregar_evento(evento)
         
         # Limpiar partido actual
-        partido_finalizado = partido
         self.partido_actual = None
         
-        return partido_finalizado
+        contar('partidos_finalizados')
+        contar('eventos_creados', len(partido.eventos))
+        return partido
 
 
+@medido('dsl.procesar_archivo_partidos')
 def procesar_archivo_partidos(archivo_path: str, sistema: SistemaFutbol) -> bool:
-    """Procesa un archivo de partidos - PUEDE CONTENER MÚLTIPLES PARTIDOS"""
+    """Procesa un archivo de partidos - PUEDE CONTENER MÚLTIPLES PARTIDOS
+    
+    Se detiene en el primer error; `importador.importar_archivo` en cambio
+    continúa con el siguiente partido y junta todos los diagnósticos.
+    """
     try:
         parser = ParserFutbol(sistema)
         
@@ -571,6 +1001,7 @@ def procesar_archivo_partidos(archivo_path: str, sistema: SistemaFutbol) -> bool
             parser.finalizar_partido()
             print(f"✅ Último partido finalizado correctamente")
         
+        sistema.confirmar_almacenamiento()
         return True
     except FileNotFoundError:
         print(f"❌ Archivo no encontrado: {archivo_path}")
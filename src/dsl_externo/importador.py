@@ -0,0 +1,481 @@
+"""
+Importación masiva de archivos de partidos
+Procesa directorios o patrones glob de archivos .txt acumulando diagnósticos
+"""
+
+import argparse
+import glob
+import io
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
+# Agregar el directorio raíz al path para importar models
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from models import Cambio, Equipo, Gol, ListaVersionada, Partido, SistemaFutbol, Tarjeta
+from src import instrumentacion
+from .dsl_externo import Diagnostico, ParserFutbol, columna_del_error
+
+
+@dataclass
+class ResultadoArchivo:
+    """Resultado de importar un archivo de partidos"""
+    archivo: str
+    partidos: int = 0
+    lineas: int = 0
+    errores: int = 0
+    diagnosticos: List[Diagnostico] = field(default_factory=list)
+    
+    @property
+    def exitoso(self) -> bool:
+        return self.errores == 0
+
+
+@dataclass
+class ResumenImportacion:
+    """Totales de una importación en lote"""
+    archivos: int = 0
+    archivos_con_errores: int = 0
+    partidos: int = 0
+    lineas: int = 0
+    errores: int = 0
+    segundos: float = 0.0
+    diagnosticos: List[Diagnostico] = field(default_factory=list)
+    
+    @property
+    def partidos_por_segundo(self) -> float:
+        return self.partidos / self.segundos if self.segundos > 0 else 0.0
+
+
+def iterar_archivos(fuentes: Iterable[str]) -> Iterator[str]:
+    """Recorre las rutas de archivos .txt de una lista de directorios, patrones o archivos"""
+    for fuente in fuentes:
+        if os.path.isdir(fuente):
+            with os.scandir(fuente) as entradas:
+                nombres = sorted(entrada.name for entrada in entradas
+                                 if entrada.is_file() and entrada.name.endswith('.txt'))
+            for nombre in nombres:
+                yield os.path.join(fuente, nombre)
+        elif glob.has_magic(fuente):
+            yield from sorted(glob.iglob(fuente, recursive=True))
+        else:
+            yield fuente
+
+
+# Bloque de un archivo: (archivo, [(número de línea, texto), ...]) con un único FECHA:
+Bloque = Tuple[str, List[Tuple[int, str]]]
+
+
+def iterar_bloques(archivo_path: str) -> Generator[Bloque, None, int]:
+    """Divide un archivo en bloques de líneas que comienzan en cada comando FECHA:.
+    
+    Las líneas previas al primer FECHA: se incluyen en el primer bloque, igual
+    que en la carga secuencial. Los comentarios y líneas vacías se omiten.
+    Devuelve la cantidad de líneas leídas.
+    """
+    with open(archivo_path, 'r', encoding='utf-8') as archivo:
+        return (yield from _bloques_de_lineas(archivo_path, archivo))
+
+
+def _bloques_de_lineas(archivo_path: str, lineas_texto: Iterable[str]) -> Generator[Bloque, None, int]:
+    """Bloques FECHA: de una secuencia de líneas, numeradas desde 1; devuelve cuántas hubo"""
+    lineas: List[Tuple[int, str]] = []
+    hay_fecha = False
+    num_linea = 0
+    for num_linea, linea in enumerate(lineas_texto, 1):
+        linea = linea.strip()
+        if not linea or linea.startswith('#'):
+            continue
+        
+        if linea.upper().startswith('FECHA:'):
+            if hay_fecha:
+                yield archivo_path, lineas
+                lineas = []
+            hay_fecha = True
+        lineas.append((num_linea, linea))
+    
+    if lineas:
+        yield archivo_path, lineas
+    return num_linea
+
+
+def _es_linea_fecha(linea: bytes) -> bool:
+    try:
+        return linea.decode('utf-8').strip().upper().startswith('FECHA:')
+    except UnicodeDecodeError:
+        return False
+
+
+def dividir_archivo(archivo_path: str, bytes_por_tramo: int) -> List[Tuple[int, int]]:
+    """Divide un archivo en tramos de bytes (inicio, fin) de unos `bytes_por_tramo` cada uno.
+    
+    Cada corte cae al comienzo de una línea FECHA: posterior a la primera del
+    archivo, así analizar los tramos por separado arma los mismos bloques que
+    leer el archivo entero. Solo se leen las líneas cercanas a cada corte.
+    """
+    tamano = os.path.getsize(archivo_path)
+    cortes = [0]
+    with open(archivo_path, 'rb') as archivo:
+        # El primer tramo incluye las líneas previas al primer FECHA: y esa misma línea
+        for linea in iter(archivo.readline, b''):
+            if _es_linea_fecha(linea):
+                break
+        objetivo = max(archivo.tell(), bytes_por_tramo)
+        while objetivo < tamano:
+            archivo.seek(objetivo)
+            archivo.readline()
+            posicion = archivo.tell()
+            for linea in iter(archivo.readline, b''):
+                if _es_linea_fecha(linea):
+                    break
+                posicion = archivo.tell()
+            if posicion >= tamano:
+                break
+            cortes.append(posicion)
+            objetivo = posicion + bytes_por_tramo
+    cortes.append(tamano)
+    return list(zip(cortes, cortes[1:]))
+
+
+# Error de un bloque: (número de línea, columna, mensaje)
+ErrorLinea = Tuple[int, int, str]
+
+
+@instrumentacion.medido('importador.analizar_bloque')
+def _importar_bloque(parser: ParserFutbol, lineas: List[Tuple[int, str]]
+                     ) -> Tuple[Optional[Partido], List[ErrorLinea]]:
+    """Construye el partido de un bloque.
+    
+    Un error descarta el partido, pero el resto de las líneas del bloque se
+    sigue analizando para informar todos sus errores en una sola pasada.
+    """
+    parser.partido_actual = None
+    errores: List[ErrorLinea] = []
+    for num_linea, linea in lineas:
+        try:
+            parser.ejecutar_comando(linea)
+        except Exception as e:
+            errores.append((num_linea, columna_del_error(linea, e), str(e)))
+            # Partido vacío para que las líneas siguientes no fallen en cascada
+            if parser.partido_actual is None:
+                parser.partido_actual = {}
+    
+    if errores:
+        parser.partido_actual = None
+        return None, errores
+    
+    try:
+        return parser.construir_partido(), []
+    except Exception as e:
+        parser.partido_actual = None
+        return None, [(lineas[0][0], 1, f"Partido inválido: {e}")]
+
+
+# Partido compacto que devuelven los trabajadores: tuplas de tipos básicos, más baratas de
+# serializar que el grafo de objetos de un Partido
+PartidoCompacto = Tuple
+_GOL, _TARJETA, _CAMBIO = 0, 1, 2
+
+
+def _compactar_partido(partido: Partido) -> PartidoCompacto:
+    """Convierte un partido en tuplas de tipos básicos"""
+    eventos = []
+    for evento in partido.eventos:
+        if isinstance(evento, Gol):
+            eventos.append((_GOL, evento.tiempo, evento.equipo, evento.autor, evento.asistente))
+        elif isinstance(evento, Tarjeta):
+            eventos.append((_TARJETA, evento.tiempo, evento.equipo, evento.jugador, evento.color))
+        else:
+            eventos.append((_CAMBIO, evento.tiempo, evento.equipo, evento.jugador_sale, evento.jugador_entra))
+    return (partido.fecha, partido.equipo_local, partido.equipo_visitante, partido.formacion_local,
+            partido.formacion_visitante, partido.titulares_local, partido.titulares_visitante,
+            partido.banco_local, partido.banco_visitante, eventos)
+
+
+_CLASES_EVENTO = {_GOL: Gol, _TARJETA: Tarjeta, _CAMBIO: Cambio}
+
+
+def _expandir_partido(compacto: PartidoCompacto) -> Partido:
+    """Reconstruye el partido de `_compactar_partido`"""
+    *datos, eventos = compacto
+    return Partido(*datos, ListaVersionada(_CLASES_EVENTO[tipo](*campos) for tipo, *campos in eventos))
+
+
+# Sistema de solo lectura de cada proceso trabajador
+_sistema_trabajador: Optional[SistemaFutbol] = None
+
+
+def _inicializar_trabajador(equipos: Dict[str, Equipo]):
+    """Carga en el proceso trabajador una copia del plantel de equipos"""
+    global _sistema_trabajador
+    _sistema_trabajador = SistemaFutbol()
+    for equipo in equipos.values():
+        _sistema_trabajador.agregar_equipo(equipo)
+
+
+# Tramo de un archivo: (archivo, byte de inicio, byte de fin)
+Tramo = Tuple[str, int, int]
+
+
+def _importar_tramos_trabajador(tramos: List[Tramo]) -> list:
+    """Lee y analiza tramos de archivos en un proceso trabajador.
+    
+    Por tramo devuelve (archivo, líneas leídas, error de lectura o None,
+    [(partido compacto o None, errores), ...]); los números de línea son
+    relativos al comienzo del tramo.
+    """
+    parser = ParserFutbol(_sistema_trabajador)
+    resultados = []
+    for archivo_path, inicio, fin in tramos:
+        bloques = []
+        lineas = 0
+        error = None
+        try:
+            if fin > inicio:
+                with open(archivo_path, 'rb') as archivo:
+                    archivo.seek(inicio)
+                    texto = archivo.read(fin - inicio).decode('utf-8')
+                generador = _bloques_de_lineas(archivo_path, io.StringIO(texto, newline=None))
+                while True:
+                    try:
+                        _, lineas_bloque = next(generador)
+                    except StopIteration as fin_bloques:
+                        lineas = fin_bloques.value
+                        break
+                    partido, errores = _importar_bloque(parser, lineas_bloque)
+                    bloques.append((_compactar_partido(partido) if partido is not None else None, errores))
+        except (OSError, UnicodeDecodeError) as e:
+            error = f"No se pudo leer el archivo: {e}"
+        resultados.append((archivo_path, lineas, error, bloques))
+    return resultados
+
+
+def _agrupar(tramos: Iterable[Tramo], bytes_por_tarea: int) -> Iterator[List[Tramo]]:
+    """Agrupa tramos en tareas de unos `bytes_por_tarea` (los archivos chicos van juntos)"""
+    tarea: List[Tramo] = []
+    acumulado = 0
+    for tramo in tramos:
+        tarea.append(tramo)
+        acumulado += tramo[2] - tramo[1]
+        if acumulado >= bytes_por_tarea:
+            yield tarea
+            tarea = []
+            acumulado = 0
+    if tarea:
+        yield tarea
+
+
+def _resultados_paralelos(tramos: Iterable[Tramo], sistema: SistemaFutbol, procesos: int,
+                          bytes_por_tarea: int):
+    """Procesa tramos en un pool de procesos y devuelve sus resultados en el orden original.
+    
+    Los trabajadores leen los archivos por su cuenta: el proceso principal
+    solo les pasa rutas y posiciones. Solo se mantienen en vuelo unas pocas
+    tareas por proceso, de modo que la memoria no depende del tamaño de los
+    archivos.
+    """
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar_trabajador,
+                             initargs=(dict(sistema.equipos),)) as pool:
+        pendientes = deque()
+        for tarea in _agrupar(tramos, bytes_por_tarea):
+            pendientes.append(pool.submit(_importar_tramos_trabajador, tarea))
+            if len(pendientes) >= procesos * 2:
+                yield from pendientes.popleft().result()
+        while pendientes:
+            yield from pendientes.popleft().result()
+
+
+def _resultados_secuenciales(bloques: Iterable[Bloque], sistema: SistemaFutbol):
+    """Procesa bloques uno a uno en el proceso actual"""
+    parser = ParserFutbol(sistema)
+    for archivo, lineas in bloques:
+        yield (archivo,) + _importar_bloque(parser, lineas)
+
+
+def importar_archivo(archivo_path: str, sistema: SistemaFutbol,
+                     max_diagnosticos: int = 100) -> ResultadoArchivo:
+    """Importa un archivo de partidos sin detenerse ante líneas inválidas.
+    
+    Un error descarta el partido en curso; la importación continúa con el
+    siguiente comando FECHA: del archivo. Cada línea inválida queda en los
+    diagnósticos con su línea y columna.
+    """
+    resumen = importar_en_lote([archivo_path], sistema, max_diagnosticos=max_diagnosticos)
+    resultado = ResultadoArchivo(archivo_path, resumen.partidos, resumen.lineas, resumen.errores)
+    resultado.diagnosticos = resumen.diagnosticos
+    return resultado
+
+
+@instrumentacion.medido('importador.importar_en_lote')
+def importar_en_lote(fuentes: Iterable[str], sistema: SistemaFutbol,
+                     max_diagnosticos: int = 1000,
+                     al_terminar_archivo: Optional[Callable[[ResultadoArchivo], None]] = None,
+                     procesos: int = 1, bytes_por_tarea: int = 1 << 20) -> ResumenImportacion:
+    """Importa todos los archivos de partidos indicados.
+    
+    Los archivos se procesan de a uno y sus resultados no se conservan: el
+    resumen guarda totales y como máximo `max_diagnosticos` diagnósticos, de
+    modo que la memoria usada no depende de la cantidad de archivos. Para
+    inspeccionar cada archivo se puede pasar `al_terminar_archivo`.
+    
+    Con `procesos` > 1 los archivos se dividen en tramos de unos
+    `bytes_por_tarea` que comienzan en un FECHA:, y un pool de procesos con
+    una copia de los equipos los lee y analiza. Los trabajadores devuelven
+    partidos compactos que se agregan al sistema en el orden en que aparecen
+    en los archivos; agregarlos sigue siendo trabajo del proceso principal.
+    """
+    resumen = ResumenImportacion()
+    inicio = time.perf_counter()
+    resultados_archivo: Dict[str, ResultadoArchivo] = {}
+    errores_lectura: Dict[str, str] = {}
+    
+    def bloques_de_archivos() -> Iterator[Bloque]:
+        for archivo_path in iterar_archivos(fuentes):
+            resultado = ResultadoArchivo(archivo_path)
+            resultados_archivo[archivo_path] = resultado
+            try:
+                resultado.lineas = yield from iterar_bloques(archivo_path)
+            except (OSError, UnicodeDecodeError) as e:
+                # Se registra al cerrar el archivo para respetar el orden de los diagnósticos
+                errores_lectura[archivo_path] = f"No se pudo leer el archivo: {e}"
+            # Bloque vacío para que los archivos sin partidos también se cierren en orden
+            yield archivo_path, []
+    
+    def registrar_errores(resultado: ResultadoArchivo, errores: List[ErrorLinea]):
+        for num_linea, columna, mensaje in errores:
+            resultado.errores += 1
+            if len(resumen.diagnosticos) < max_diagnosticos:
+                diagnostico = Diagnostico(num_linea, columna, mensaje, resultado.archivo)
+                resultado.diagnosticos.append(diagnostico)
+                resumen.diagnosticos.append(diagnostico)
+    
+    def cerrar_archivo(resultado: ResultadoArchivo):
+        if resultado.archivo in errores_lectura:
+            registrar_errores(resultado, [(0, 0, errores_lectura.pop(resultado.archivo))])
+        resumen.archivos += 1
+        resumen.partidos += resultado.partidos
+        resumen.lineas += resultado.lineas
+        resumen.errores += resultado.errores
+        if not resultado.exitoso:
+            resumen.archivos_con_errores += 1
+        if al_terminar_archivo:
+            al_terminar_archivo(resultado)
+    
+    def tramos_de_archivos() -> Iterator[Tramo]:
+        for archivo_path in iterar_archivos(fuentes):
+            resultados_archivo[archivo_path] = ResultadoArchivo(archivo_path)
+            try:
+                tramos = dividir_archivo(archivo_path, bytes_por_tarea)
+            except OSError as e:
+                errores_lectura[archivo_path] = f"No se pudo leer el archivo: {e}"
+                tramos = [(0, 0)]
+            for inicio, fin in tramos:
+                yield archivo_path, inicio, fin
+    
+    def resultados_de_tramos():
+        for archivo_path, lineas, error, bloques in _resultados_paralelos(
+                tramos_de_archivos(), sistema, procesos, bytes_por_tarea):
+            resultado = resultados_archivo[archivo_path]
+            if error and archivo_path not in errores_lectura:
+                # Como en la lectura secuencial, el archivo se corta en el primer error de lectura
+                errores_lectura[archivo_path] = error
+                resultado.lineas = 0
+            if archivo_path in errores_lectura:
+                yield archivo_path, None, []
+                continue
+            # Los números de línea del trabajador son relativos al tramo
+            base = resultado.lineas
+            resultado.lineas += lineas
+            for compacto, errores in bloques:
+                yield (archivo_path, _expandir_partido(compacto) if compacto is not None else None,
+                       [(num_linea + base, columna, mensaje) for num_linea, columna, mensaje in errores])
+            # Resultado vacío para que los tramos sin partidos también cierren su archivo en orden
+            yield archivo_path, None, []
+    
+    if procesos > 1:
+        resultados = resultados_de_tramos()
+    else:
+        resultados = _resultados_secuenciales(bloques_de_archivos(), sistema)
+    
+    actual: Optional[ResultadoArchivo] = None
+    for archivo, partido, errores in resultados:
+        if actual is not None and actual.archivo != archivo:
+            cerrar_archivo(resultados_archivo.pop(actual.archivo))
+        actual = resultados_archivo[archivo]
+        
+        if partido is not None:
+            sistema.agregar_partido(partido)
+            actual.partidos += 1
+        registrar_errores(actual, errores)
+    
+    # Cerrar el último archivo y los que no llegaron a producir bloques
+    for resultado in list(resultados_archivo.values()):
+        cerrar_archivo(resultado)
+    
+    sistema.confirmar_almacenamiento()
+    resumen.segundos = time.perf_counter() - inicio
+    instrumentacion.contar('lineas_analizadas', resumen.lineas)
+    return resumen
+
+
+def cargar_equipos(script_path: str, sistema: SistemaFutbol):
+    """Ejecuta un script de DSL interno que registra equipos en `sistema`"""
+    with open(script_path, 'r', encoding='utf-8') as archivo:
+        codigo = compile(archivo.read(), script_path, 'exec')
+    exec(codigo, {'__name__': '__equipos__', 'sistema': sistema})
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos para la importación en lote"""
+    from src.almacenamiento import AlmacenamientoSQLite
+    from src.dsl_interno import SistemaFutbol as SistemaDSL
+    
+    argumentos = argparse.ArgumentParser(
+        description="Importa en lote archivos de partidos (.txt) del DSL externo")
+    argumentos.add_argument('fuentes', nargs='+',
+                            help="Directorios, patrones glob o archivos de partidos")
+    argumentos.add_argument('--equipos', required=True,
+                            help="Script de DSL interno que registra los equipos en `sistema`")
+    argumentos.add_argument('--max-diagnosticos', type=int, default=50,
+                            help="Cantidad máxima de diagnósticos a mostrar")
+    argumentos.add_argument('--detalle', action='store_true',
+                            help="Muestra el resultado de cada archivo")
+    argumentos.add_argument('--db',
+                            help="Base SQLite donde guardar equipos y partidos importados")
+    argumentos.add_argument('--procesos', type=int, default=1,
+                            help="Procesos para analizar en paralelo (0 = todos los núcleos)")
+    argumentos.add_argument('--perfil', nargs='?', const='resumen', metavar='ARCHIVO',
+                            help="Muestra el tiempo por etapa al terminar; con ARCHIVO guarda "
+                                 "además un perfil de cProfile")
+    args = argumentos.parse_args(argv)
+    instrumentacion.configurar(args.perfil)
+    
+    almacenamiento = AlmacenamientoSQLite(args.db) if args.db else None
+    sistema = SistemaDSL(almacenamiento)
+    cargar_equipos(args.equipos, sistema)
+    
+    def mostrar_archivo(resultado: ResultadoArchivo):
+        estado = "✅" if resultado.exitoso else "❌"
+        print(f"{estado} {resultado.archivo}: {resultado.partidos} partidos, {resultado.errores} errores")
+    
+    resumen = importar_en_lote(args.fuentes, sistema, max_diagnosticos=args.max_diagnosticos,
+                               al_terminar_archivo=mostrar_archivo if args.detalle else None,
+                               procesos=args.procesos or os.cpu_count() or 1)
+    
+    for diagnostico in resumen.diagnosticos:
+        print(f"❌ {diagnostico}")
+    if resumen.errores > len(resumen.diagnosticos):
+        print(f"... y {resumen.errores - len(resumen.diagnosticos)} errores más")
+    
+    print(f"\n📁 Archivos: {resumen.archivos} ({resumen.archivos_con_errores} con errores)")
+    print(f"⚽ Partidos importados: {resumen.partidos}")
+    print(f"⏱️  {resumen.segundos:.2f} s - {resumen.partidos_por_segundo:.1f} partidos/s")
+    
+    if almacenamiento:
+        almacenamiento.cerrar()
+        print(f"💾 Datos guardados en {args.db}")
+    
+    return 0 if resumen.errores == 0 else 1
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'BANCO_LOCAL BANCO_VISITANTE CADENA CAMBIO CODIGO_EQUIPO COLOR COMA DOS_PUNTOS EQUIPO_LOCAL EQUIPO_VISITANTE FECHA FORMACION_LOCAL FORMACION_VISITANTE GOL GUION NUEVA_LINEA NUMERO PARENTESIS_ABRE PARENTESIS_CIERRA PUNTO_COMA TARJETA TIEMPO TITULARES_LOCAL TITULARES_VISITANTEpartido : FECHA fecha\n               | EQUIPO_LOCAL CODIGO_EQUIPO\n               | EQUIPO_VISITANTE CODIGO_EQUIPO\n               | FORMACION_LOCAL formacion\n               | FORMACION_VISITANTE formacion\n               | TITULARES_LOCAL lista_numeros\n               | TITULARES_VISITANTE lista_numeros\n               | BANCO_LOCAL lista_numeros\n               | BANCO_VISITANTE lista_numeros\n               | eventofecha : CADENAformacion : NUMERO GUION NUMERO GUION NUMEROlista_numeros : NUMERO\n                     | NUMERO COMA lista_numerosevento : gol\n              | tarjeta\n              | cambiogol : GOL CODIGO_EQUIPO COMA TIEMPO COMA NUMERO COMA NUMERO\n           | GOL CODIGO_EQUIPO COMA TIEMPO COMA NUMEROtarjeta : TARJETA CODIGO_EQUIPO COMA TIEMPO COMA NUMERO COMA COLORcambio : CAMBIO CODIGO_EQUIPO COMA TIEMPO COMA NUMERO COMA NUMERO'
+_lr_signature = 'archivoBANCO_LOCAL BANCO_VISITANTE CAMBIO CODIGO_EQUIPO COLOR COMA COMANDO EQUIPO_LOCAL EQUIPO_VISITANTE FECHA FORMACION_LOCAL FORMACION_VISITANTE GOL ILEGAL LISTA_NUMEROS NUEVA_LINEA TARJETA TITULARES_LOCAL TITULARES_VISITANTE VALOR_FECHA VALOR_FORMACIONarchivo : preambulo partidos\n               | preambulopreambulo : cuerpopartidos : partidos partido\n                | partidopartido : encabezado cuerpoencabezado : FECHA VALOR_FECHA NUEVA_LINEA\n                  | FECHA error NUEVA_LINEAcuerpo : cuerpo sentencia\n              | sentencia : NUEVA_LINEAsentencia : EQUIPO_LOCAL CODIGO_EQUIPO NUEVA_LINEA\n                 | EQUIPO_VISITANTE CODIGO_EQUIPO NUEVA_LINEA\n                 | FORMACION_LOCAL VALOR_FORMACION NUEVA_LINEA\n                 | FORMACION_VISITANTE VALOR_FORMACION NUEVA_LINEA\n                 | TITULARES_LOCAL LISTA_NUMEROS NUEVA_LINEA\n                 | TITULARES_VISITANTE LISTA_NUMEROS NUEVA_LINEA\n                 | BANCO_LOCAL LISTA_NUMEROS NUEVA_LINEA\n                 | BANCO_VISITANTE LISTA_NUMEROS NUEVA_LINEAsentencia : GOL CODIGO_EQUIPO COMA LISTA_NUMEROS NUEVA_LINEAsentencia : TARJETA CODIGO_EQUIPO COMA LISTA_NUMEROS COMA COLOR NUEVA_LINEA\n                 | TARJETA CODIGO_EQUIPO COMA LISTA_NUMEROS COMA CODIGO_EQUIPO NUEVA_LINEA\n                 | TARJETA CODIGO_EQUIPO COMA LISTA_NUMEROS NUEVA_LINEAsentencia : CAMBIO CODIGO_EQUIPO COMA LISTA_NUMEROS NUEVA_LINEAsentencia : error NUEVA_LINEA'
     
-_lr_action_items = {'FECHA':([0,],[2,]),'EQUIPO_LOCAL':([0,],[3,]),'EQUIPO_VISITANTE':([0,],[4,]),'FORMACION_LOCAL':([0,],[5,]),'FORMACION_VISITANTE':([0,],[6,]),'TITULARES_LOCAL':([0,],[7,]),'TITULARES_VISITANTE':([0,],[8,]),'BANCO_LOCAL':([0,],[9,]),'BANCO_VISITANTE':([0,],[10,]),'GOL':([0,],[15,]),'TARJETA':([0,],[16,]),'CAMBIO':([0,],[17,]),'$end':([1,11,12,13,14,18,19,20,21,22,24,25,26,27,28,29,39,47,48,54,55,56,],[0,-10,-15,-16,-17,-1,-11,-2,-3,-4,-5,-6,-13,-7,-8,-9,-14,-12,-19,-18,-20,-21,]),'CADENA':([2,],[19,]),'CODIGO_EQUIPO':([3,4,15,16,17,],[20,21,30,31,32,]),'NUMERO':([5,6,7,8,9,10,33,34,43,44,45,46,51,53,],[23,23,26,26,26,26,38,26,47,48,49,50,54,56,]),'GUION':([23,38,],[33,43,]),'COMA':([26,30,31,32,40,41,42,48,49,50,],[34,35,36,37,44,45,46,51,52,53,]),'TIEMPO':([35,36,37,],[40,41,42,]),'COLOR':([52,],[55,]),}
+_lr_action_items = {'NUEVA_LINEA':([0,3,6,8,9,21,23,24,25,26,27,28,29,30,31,32,33,37,38,39,40,41,42,43,44,45,46,47,51,52,53,54,56,57,58,59,60,61,],[-10,9,-10,-9,-11,37,9,38,39,40,41,42,43,44,45,46,47,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,54,56,57,-20,-23,-24,60,61,-22,-21,]),'EQUIPO_LOCAL':([0,3,6,8,9,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,10,-10,-9,-11,10,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'EQUIPO_VISITANTE':([0,3,6,8,9,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,11,-10,-9,-11,11,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'FORMACION_LOCAL':([0,3,6,8,9,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,12,-10,-9,-11,12,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'FORMACION_VISITANTE':([0,3,6,8,9,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,13,-10,-9,-11,13,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'TITULARES_LOCAL':([0,3,6,8,9,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,14,-10,-9,-11,14,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'TITULARES_VISITANTE':([0,3,6,8,9,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,15,-10,-9,-11,15,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'BANCO_LOCAL':([0,3,6,8,9,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,16,-10,-9,-11,16,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'BANCO_VISITANTE':([0,3,6,8,9,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,17,-10,-9,-11,17,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'GOL':([0,3,6,8,9,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,18,-10,-9,-11,18,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'TARJETA':([0,3,6,8,9,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,19,-10,-9,-11,19,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'CAMBIO':([0,3,6,8,9,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,20,-10,-9,-11,20,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'error':([0,3,6,7,8,9,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,21,-10,25,-9,-11,21,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'FECHA':([0,2,3,4,5,6,8,9,22,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,7,-3,7,-5,-10,-9,-11,-4,-6,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'$end':([0,1,2,3,4,5,6,8,9,22,23,37,38,39,40,41,42,43,44,45,46,47,54,56,57,60,61,],[-10,0,-2,-3,-1,-5,-10,-9,-11,-4,-6,-25,-7,-8,-12,-13,-14,-15,-16,-17,-18,-19,-20,-23,-24,-22,-21,]),'VALOR_FECHA':([7,],[24,]),'CODIGO_EQUIPO':([10,11,18,19,20,55,],[26,27,34,35,36,58,]),'VALOR_FORMACION':([12,13,],[28,29,]),'LISTA_NUMEROS':([14,15,16,17,48,49,50,],[30,31,32,33,51,52,53,]),'COMA':([34,35,36,52,],[48,49,50,55,]),'COLOR':([55,],[59,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'partido':([0,],[1,]),'evento':([0,],[11,]),'gol':([0,],[12,]),'tarjeta':([0,],[13,]),'cambio':([0,],[14,]),'fecha':([2,],[18,]),'formacion':([5,6,],[22,24,]),'lista_numeros':([7,8,9,10,34,],[25,27,28,29,39,]),}
+_lr_goto_items = {'archivo':([0,],[1,]),'preambulo':([0,],[2,]),'cuerpo':([0,6,],[3,23,]),'partidos':([2,],[4,]),'partido':([2,4,],[5,22,]),'encabezado':([2,4,],[6,6,]),'sentencia':([3,23,],[8,8,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -26,26 +26,30 @@ for _k, _v in _lr_goto_items.items():
        _lr_goto[_x][_k] = _y
 del _lr_goto_items
 _lr_productions = [
-  ("S' -> partido","S'",1,None,None,None),
-  ('partido -> FECHA fecha','partido',2,'p_partido','dsl_externo.py',141),
-  ('partido -> EQUIPO_LOCAL CODIGO_EQUIPO','partido',2,'p_partido','dsl_externo.py',142),
-  ('partido -> EQUIPO_VISITANTE CODIGO_EQUIPO','partido',2,'p_partido','dsl_externo.py',143),
-  ('partido -> FORMACION_LOCAL formacion','partido',2,'p_partido','dsl_externo.py',144),
-  ('partido -> FORMACION_VISITANTE formacion','partido',2,'p_partido','dsl_externo.py',145),
-  ('partido -> TITULARES_LOCAL lista_numeros','partido',2,'p_partido','dsl_externo.py',146),
-  ('partido -> TITULARES_VISITANTE lista_numeros','partido',2,'p_partido','dsl_externo.py',147),
-  ('partido -> BANCO_LOCAL lista_numeros','partido',2,'p_partido','dsl_externo.py',148),
-  ('partido -> BANCO_VISITANTE lista_numeros','partido',2,'p_partido','dsl_externo.py',149),
-  ('partido -> evento','partido',1,'p_partido','dsl_externo.py',150),
-  ('fecha -> CADENA','fecha',1,'p_fecha','dsl_externo.py',154),
-  ('formacion -> NUMERO GUION NUMERO GUION NUMERO','formacion',5,'p_formacion','dsl_externo.py',158),
-  ('lista_numeros -> NUMERO','lista_numeros',1,'p_lista_numeros','dsl_externo.py',162),
-  ('lista_numeros -> NUMERO COMA lista_numeros','lista_numeros',3,'p_lista_numeros','dsl_externo.py',163),
-  ('evento -> gol','evento',1,'p_evento','dsl_externo.py',170),
-  ('evento -> tarjeta','evento',1,'p_evento','dsl_externo.py',171),
-  ('evento -> cambio','evento',1,'p_evento','dsl_externo.py',172),
-  ('gol -> GOL CODIGO_EQUIPO COMA TIEMPO COMA NUMERO COMA NUMERO','gol',8,'p_gol','dsl_externo.py',176),
-  ('gol -> GOL CODIGO_EQUIPO COMA TIEMPO COMA NUMERO','gol',6,'p_gol','dsl_externo.py',177),
-  ('tarjeta -> TARJETA CODIGO_EQUIPO COMA TIEMPO COMA NUMERO COMA COLOR','tarjeta',8,'p_tarjeta','dsl_externo.py',196),
-  ('cambio -> CAMBIO CODIGO_EQUIPO COMA TIEMPO COMA NUMERO COMA NUMERO','cambio',8,'p_cambio','dsl_externo.py',206),
+  ("S' -> archivo","S'",1,None,None,None),
+  ('archivo -> preambulo partidos','archivo',2,'p_archivo','dsl_externo.py',149),
+  ('archivo -> preambulo','archivo',1,'p_archivo','dsl_externo.py',150),
+  ('preambulo -> cuerpo','preambulo',1,'p_preambulo','dsl_externo.py',161),
+  ('partidos -> partidos partido','partidos',2,'p_partidos','dsl_externo.py',173),
+  ('partidos -> partido','partidos',1,'p_partidos','dsl_externo.py',174),
+  ('partido -> encabezado cuerpo','partido',2,'p_partido','dsl_externo.py',183),
+  ('encabezado -> FECHA VALOR_FECHA NUEVA_LINEA','encabezado',3,'p_encabezado','dsl_externo.py',192),
+  ('encabezado -> FECHA error NUEVA_LINEA','encabezado',3,'p_encabezado','dsl_externo.py',193),
+  ('cuerpo -> cuerpo sentencia','cuerpo',2,'p_cuerpo','dsl_externo.py',201),
+  ('cuerpo -> <empty>','cuerpo',0,'p_cuerpo','dsl_externo.py',202),
+  ('sentencia -> NUEVA_LINEA','sentencia',1,'p_sentencia_vacia','dsl_externo.py',211),
+  ('sentencia -> EQUIPO_LOCAL CODIGO_EQUIPO NUEVA_LINEA','sentencia',3,'p_sentencia_dato','dsl_externo.py',215),
+  ('sentencia -> EQUIPO_VISITANTE CODIGO_EQUIPO NUEVA_LINEA','sentencia',3,'p_sentencia_dato','dsl_externo.py',216),
+  ('sentencia -> FORMACION_LOCAL VALOR_FORMACION NUEVA_LINEA','sentencia',3,'p_sentencia_dato','dsl_externo.py',217),
+  ('sentencia -> FORMACION_VISITANTE VALOR_FORMACION NUEVA_LINEA','sentencia',3,'p_sentencia_dato','dsl_externo.py',218),
+  ('sentencia -> TITULARES_LOCAL LISTA_NUMEROS NUEVA_LINEA','sentencia',3,'p_sentencia_dato','dsl_externo.py',219),
+  ('sentencia -> TITULARES_VISITANTE LISTA_NUMEROS NUEVA_LINEA','sentencia',3,'p_sentencia_dato','dsl_externo.py',220),
+  ('sentencia -> BANCO_LOCAL LISTA_NUMEROS NUEVA_LINEA','sentencia',3,'p_sentencia_dato','dsl_externo.py',221),
+  ('sentencia -> BANCO_VISITANTE LISTA_NUMEROS NUEVA_LINEA','sentencia',3,'p_sentencia_dato','dsl_externo.py',222),
+  ('sentencia -> GOL CODIGO_EQUIPO COMA LISTA_NUMEROS NUEVA_LINEA','sentencia',5,'p_sentencia_gol','dsl_externo.py',226),
+  ('sentencia -> TARJETA CODIGO_EQUIPO COMA LISTA_NUMEROS COMA COLOR NUEVA_LINEA','sentencia',7,'p_sentencia_tarjeta','dsl_externo.py',236),
+  ('sentencia -> TARJETA CODIGO_EQUIPO COMA LISTA_NUMEROS COMA CODIGO_EQUIPO NUEVA_LINEA','sentencia',7,'p_sentencia_tarjeta','dsl_externo.py',237),
+  ('sentencia -> TARJETA CODIGO_EQUIPO COMA LISTA_NUMEROS NUEVA_LINEA','sentencia',5,'p_sentencia_tarjeta','dsl_externo.py',238),
+  ('sentencia -> CAMBIO CODIGO_EQUIPO COMA LISTA_NUMEROS NUEVA_LINEA','sentencia',5,'p_sentencia_cambio','dsl_externo.py',252),
+  ('sentencia -> error NUEVA_LINEA','sentencia',2,'p_sentencia_error','dsl_externo.py',261),
 ]
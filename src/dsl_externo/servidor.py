@@ -0,0 +1,279 @@
+"""
+Servidor asíncrono de ingesta de partidos en vivo
+Recibe líneas del DSL externo por TCP o socket Unix, con un parser por conexión
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+# Agregar el directorio raíz al path para importar models
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from models import EstadoPartido, Partido, SistemaFutbol
+from src import instrumentacion
+from .dsl_externo import ParserFutbol
+
+# Protocolo: una línea de respuesta por cada línea recibida
+#   OK                 comando aceptado
+#   OK PARTIDO <n>     partido completo encolado (n = total de partidos encolados)
+#   ERROR <mensaje>    comando rechazado; el estado del partido en curso no cambia
+# FIN cierra el partido en curso; una línea FECHA: también cierra el anterior, como en
+# los archivos. Si el partido cerrado está incompleto se descarta y se responde ERROR
+# (la línea FECHA igualmente inicia el partido nuevo). Al cerrarse la conexión se
+# encola el partido en curso si está completo.
+
+
+@dataclass
+class EstadisticasServidor:
+    """Contadores del servidor de ingesta"""
+    conexiones: int = 0
+    conexiones_activas: int = 0
+    lineas: int = 0
+    errores: int = 0
+    partidos_encolados: int = 0
+    partidos_aplicados: int = 0
+
+
+class ServidorIngesta:
+    """Servidor de ingesta de líneas del DSL externo.
+    
+    Cada conexión tiene su propio `ParserFutbol`, de modo que muchos partidos
+    se cargan en paralelo sin mezclar estados. Los partidos completos pasan
+    por una cola acotada a una única tarea que los agrega al sistema: si la
+    cola se llena, las conexiones dejan de leer del socket hasta que haya
+    lugar y la presión se transmite a los clientes por el control de flujo
+    de TCP.
+    """
+    
+    def __init__(self, sistema: SistemaFutbol, max_pendientes: int = 256, tamano_lote: int = 64,
+                 en_vivo: bool = False):
+        self.sistema = sistema
+        self.en_vivo = en_vivo
+        self.tamano_lote = tamano_lote
+        self.estadisticas = EstadisticasServidor()
+        self.max_pendientes = max_pendientes
+        self._cola: Optional[asyncio.Queue] = None
+        self._servidor: Optional[asyncio.AbstractServer] = None
+        self._aplicador: Optional[asyncio.Task] = None
+        self._conexiones: set = set()
+        self._parsers: Dict[asyncio.Task, ParserFutbol] = {}
+    
+    async def iniciar(self, host: str = '127.0.0.1', puerto: int = 8765):
+        """Empieza a escuchar en un puerto TCP local"""
+        self._servidor = await asyncio.start_server(self._atender, host, puerto)
+        self._iniciar_aplicador()
+    
+    async def iniciar_unix(self, ruta: str):
+        """Empieza a escuchar en un socket Unix"""
+        self._servidor = await asyncio.start_unix_server(self._atender, ruta)
+        self._iniciar_aplicador()
+    
+    @property
+    def direcciones(self) -> List:
+        """Direcciones en las que escucha el servidor"""
+        return [socket.getsockname() for socket in self._servidor.sockets] if self._servidor else []
+    
+    def partidos_en_curso(self) -> List[EstadoPartido]:
+        """Estado en vivo de los partidos que se están cargando (solo con `en_vivo`)"""
+        if not self.en_vivo:
+            return []
+        estados = (parser.estado_en_vivo() for parser in self._parsers.values())
+        return [estado for estado in estados if estado is not None]
+    
+    def _iniciar_aplicador(self):
+        # La cola se crea dentro del bucle de eventos que la va a usar
+        if self._cola is None:
+            self._cola = asyncio.Queue(self.max_pendientes)
+        if self._aplicador is None:
+            self._aplicador = asyncio.create_task(self._aplicar_partidos())
+    
+    async def cerrar(self, espera: float = 5.0):
+        """Deja de aceptar conexiones y aplica los partidos pendientes.
+        
+        Las conexiones abiertas tienen `espera` segundos para terminar; las que
+        siguen abiertas se cortan y su partido en curso se pierde.
+        """
+        if self._servidor:
+            self._servidor.close()
+        if self._conexiones:
+            _, abiertas = await asyncio.wait(set(self._conexiones), timeout=espera)
+            for tarea in abiertas:
+                tarea.cancel()
+            await asyncio.gather(*abiertas, return_exceptions=True)
+        if self._servidor:
+            await self._servidor.wait_closed()
+        if self._cola is not None:
+            await self._cola.join()
+        if self._aplicador:
+            self._aplicador.cancel()
+            try:
+                await self._aplicador
+            except asyncio.CancelledError:
+                pass
+            self._aplicador = None
+        self.sistema.confirmar_almacenamiento()
+    
+    async def _aplicar_partidos(self):
+        """Agrega al sistema los partidos encolados, confirmando el almacenamiento por lotes"""
+        cola = self._cola
+        while True:
+            lote = [await cola.get()]
+            while len(lote) < self.tamano_lote and not cola.empty():
+                lote.append(cola.get_nowait())
+            
+            for partido in lote:
+                try:
+                    self.sistema.agregar_partido(partido)
+                    self.estadisticas.partidos_aplicados += 1
+                except Exception as e:
+                    print(f"❌ Error agregando partido {partido}: {e}")
+            if cola.empty():
+                self.sistema.confirmar_almacenamiento()
+            
+            for _ in lote:
+                cola.task_done()
+    
+    async def _atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """Procesa las líneas de una conexión con su propio parser"""
+        tarea = asyncio.current_task()
+        self._conexiones.add(tarea)
+        self.estadisticas.conexiones += 1
+        self.estadisticas.conexiones_activas += 1
+        parser = ParserFutbol(self.sistema, en_vivo=self.en_vivo)
+        self._parsers[tarea] = parser
+        
+        try:
+            while True:
+                try:
+                    crudo = await lector.readline()
+                except ValueError:
+                    # Línea más larga que el límite del lector: se descarta la conexión
+                    escritor.write("ERROR línea demasiado larga\n".encode('utf-8'))
+                    break
+                if not crudo:
+                    break
+                
+                linea = crudo.decode('utf-8', errors='replace').strip()
+                if not linea or linea.startswith('#'):
+                    continue
+                self.estadisticas.lineas += 1
+                instrumentacion.contar('lineas_analizadas')
+                
+                respuesta = await self._procesar_linea(parser, linea)
+                escritor.write(f"{respuesta}\n".encode('utf-8'))
+                # Si el cliente no lee las respuestas, se deja de leer sus comandos
+                await escritor.drain()
+            
+            if parser.partido_actual is not None:
+                try:
+                    await self._encolar(parser)
+                except Exception as e:
+                    self.estadisticas.errores += 1
+                    print(f"❌ Partido incompleto descartado al cerrar la conexión: {e}")
+        except ConnectionError:
+            pass
+        finally:
+            self.estadisticas.conexiones_activas -= 1
+            self._conexiones.discard(tarea)
+            self._parsers.pop(tarea, None)
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except ConnectionError:
+                pass
+    
+    async def _procesar_linea(self, parser: ParserFutbol, linea: str) -> str:
+        """Aplica una línea al parser de la conexión y devuelve la respuesta"""
+        try:
+            if linea.upper() == 'FIN':
+                if await self._encolar(parser):
+                    return f"OK PARTIDO {self.estadisticas.partidos_encolados}"
+                return "OK"
+            
+            error_anterior = None
+            if linea.upper().startswith('FECHA:') and parser.partido_actual \
+                    and 'fecha' in parser.partido_actual:
+                try:
+                    await self._encolar(parser)
+                except Exception as e:
+                    error_anterior = e
+            parser.ejecutar_comando(linea)
+            if error_anterior is not None:
+                self.estadisticas.errores += 1
+                return f"ERROR partido anterior descartado: {error_anterior}"
+            return "OK"
+        except Exception as e:
+            self.estadisticas.errores += 1
+            return f"ERROR {e}"
+    
+    async def _encolar(self, parser: ParserFutbol) -> bool:
+        """Construye el partido en curso y lo encola; espera si la cola está llena"""
+        try:
+            partido: Optional[Partido] = parser.construir_partido()
+        finally:
+            # Un partido inválido no debe contaminar el siguiente
+            parser.partido_actual = None
+        if partido is None:
+            return False
+        await self._cola.put(partido)
+        self.estadisticas.partidos_encolados += 1
+        return True
+
+
+async def _servir(args, sistema: SistemaFutbol):
+    servidor = ServidorIngesta(sistema, max_pendientes=args.max_pendientes, en_vivo=args.en_vivo)
+    if args.unix:
+        await servidor.iniciar_unix(args.unix)
+    else:
+        await servidor.iniciar(args.host, args.puerto)
+    print(f"📡 Escuchando en {', '.join(map(str, servidor.direcciones))} (Ctrl+C para terminar)")
+    
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await servidor.cerrar()
+        e = servidor.estadisticas
+        print(f"\n🔌 Conexiones: {e.conexiones}")
+        print(f"📝 Líneas: {e.lineas} ({e.errores} errores)")
+        print(f"⚽ Partidos aplicados: {e.partidos_aplicados}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos del servidor de ingesta"""
+    from src.almacenamiento import AlmacenamientoSQLite
+    from src.dsl_interno import SistemaFutbol as SistemaDSL
+    from .importador import cargar_equipos
+    
+    argumentos = argparse.ArgumentParser(
+        description="Servidor de ingesta de partidos en vivo con el DSL externo")
+    argumentos.add_argument('--equipos', required=True,
+                            help="Script de DSL interno que registra los equipos en `sistema`")
+    argumentos.add_argument('--host', default='127.0.0.1', help="Dirección TCP local")
+    argumentos.add_argument('--puerto', type=int, default=8765, help="Puerto TCP")
+    argumentos.add_argument('--unix', help="Escuchar en un socket Unix en lugar de TCP")
+    argumentos.add_argument('--db', help="Base SQLite donde guardar equipos y partidos")
+    argumentos.add_argument('--max-pendientes', type=int, default=256,
+                            help="Partidos completos en espera antes de frenar a los clientes")
+    argumentos.add_argument('--en-vivo', action='store_true',
+                            help="Valida cada evento contra el estado del partido (orden cronológico)")
+    argumentos.add_argument('--perfil', nargs='?', const='resumen', metavar='ARCHIVO',
+                            help="Muestra el tiempo por etapa al terminar; con ARCHIVO guarda "
+                                 "además un perfil de cProfile")
+    args = argumentos.parse_args(argv)
+    instrumentacion.configurar(args.perfil)
+    
+    almacenamiento = AlmacenamientoSQLite(args.db) if args.db else None
+    sistema = SistemaDSL(almacenamiento)
+    cargar_equipos(args.equipos, sistema)
+    
+    try:
+        asyncio.run(_servir(args, sistema))
+    except KeyboardInterrupt:
+        pass
+    
+    if almacenamiento:
+        almacenamiento.cerrar()
+        print(f"💾 Datos guardados en {args.db}")
+    return 0
@@ -3,7 +3,7 @@ DSL Interno con Patrón Fluent Interface
 Para la carga de equipos y jugadores de fútbol
 """
 
-from typing import List, Optional
+from typing import List, Optional, Set
 import sys
 import os
 # Agregar el directorio raíz al path para importar models
@@ -49,6 +49,7 @@ class EquipoBuilder:
         self.nombre: Optional[str] = None
         self.codigo: Optional[str] = None
         self.jugadores: List[Jugador] = []
+        self._numeros: Set[int] = set()
     
     def con_nombre(self, nombre: str) -> 'EquipoBuilder':
         """Establece el nombre del equipo"""
@@ -67,11 +68,12 @@ class EquipoBuilder:
     def agregar_jugador(self, numero: int, nombre: str) -> 'EquipoBuilder':
         """Agrega un jugador al equipo"""
         # Verificar que no se repita el número
-        if any(jugador.numero == numero for jugador in self.jugadores):
+        if numero in self._numeros:
             raise ValueError(f"El número {numero} ya está ocupado en este equipo")
         
         jugador = Jugador(numero, nombre)
         self.jugadores.append(jugador)
+        self._numeros.add(numero)
         return self
     
     def agregar_jugador_builder(self, jugador_builder: JugadorBuilder) -> 'EquipoBuilder':
@@ -79,10 +81,11 @@ class EquipoBuilder:
         jugador = jugador_builder.construir()
         
         # Verificar que no se repita el número
-        if any(j.numero == jugador.numero for j in self.jugadores):
+        if jugador.numero in self._numeros:
             raise ValueError(f"El número {jugador.numero} ya está ocupado en este equipo")
         
         self.jugadores.append(jugador)
+        self._numeros.add(jugador.numero)
         return self
     
     def construir(self) -> Equipo:
@@ -92,16 +95,14 @@ class EquipoBuilder:
         if self.codigo is None:
             raise ValueError("Debe especificar el código del equipo")
         
-        equipo = Equipo(self.nombre, self.codigo)
-        equipo.jugadores = self.jugadores.copy()
-        return equipo
+        return Equipo(self.nombre, self.codigo, self.jugadores.copy())
 
 
 class SistemaFutbol(SistemaBase):
     """Sistema de fútbol con DSL interno para carga de datos"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, almacenamiento=None):
+        super().__init__(almacenamiento)
     
     def crear_equipo(self) -> EquipoBuilder:
         """Inicia la creación de un nuevo equipo"""
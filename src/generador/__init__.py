@@ -0,0 +1,3 @@
+from .generador import GeneradorLiga, calendario_todos_contra_todos, codigo_equipo, partido_a_dsl
+
+__all__ = ['GeneradorLiga', 'calendario_todos_contra_todos', 'codigo_equipo', 'partido_a_dsl']
@@ -0,0 +1,344 @@
+"""
+Generador de ligas sintéticas
+Equipos, planteles, fixture todos contra todos y eventos verosímiles, deterministas por semilla
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+# Agregar el directorio raíz al path para importar models
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from models import Cambio, DURACION_PARTIDO, Equipo, Evento, Gol, Partido, SistemaFutbol, Tarjeta
+
+# Promedios por equipo y partido, parecidos a los de una liga profesional
+GOLES_LOCAL = 1.5
+GOLES_VISITANTE = 1.15
+AMARILLAS_POR_EQUIPO = 1.9
+PROBABILIDAD_ROJA = 0.04
+PROBABILIDAD_ASISTENCIA = 0.7
+PROBABILIDAD_DESCUENTO = 0.05
+CAMBIOS_POR_EQUIPO = (3, 5)
+
+FORMACIONES = ('4-4-2', '4-3-3', '4-2-3-1', '3-5-2', '5-3-2', '4-1-4-1')
+PORTEROS = (1, 12)
+SUPLENTES = 7
+DIAS_ENTRE_FECHAS = 7
+DIAS_ENTRE_TEMPORADAS = 28
+
+_PREFIJOS = ('Club', 'Deportivo', 'Atlético', 'Unión', 'Sporting', 'Real', 'Racing', 'Independiente')
+_CIUDADES = ('Norte', 'Sur', 'Valle', 'Puerto', 'Montaña', 'Río', 'Llanura', 'Bahía', 'Sierra', 'Costa',
+             'Lago', 'Colina', 'Pradera', 'Bosque', 'Isla', 'Meseta', 'Delta', 'Cañada', 'Ribera', 'Laguna')
+_NOMBRES = ('Juan', 'Pedro', 'Luis', 'Carlos', 'Diego', 'Martín', 'Pablo', 'Andrés', 'Javier', 'Mateo',
+            'Lucas', 'Tomás', 'Nicolás', 'Sergio', 'Hugo', 'Álvaro', 'Iker', 'Raúl', 'Bruno', 'Emilio')
+_APELLIDOS = ('García', 'Fernández', 'López', 'Martínez', 'Sánchez', 'Pérez', 'Gómez', 'Díaz', 'Romero',
+              'Torres', 'Ruiz', 'Álvarez', 'Moreno', 'Navarro', 'Castro', 'Ortega', 'Rubio', 'Molina',
+              'Suárez', 'Vega')
+
+
+def codigo_equipo(indice: int) -> str:
+    """Código de 3 letras del equipo número `indice` (AAA, AAB, ...)"""
+    return chr(65 + indice // 676 % 26) + chr(65 + indice // 26 % 26) + chr(65 + indice % 26)
+
+
+def calendario_todos_contra_todos(codigos: List[str], vueltas: int = 2) -> List[List[Tuple[str, str]]]:
+    """Fechas de un torneo todos contra todos por el método del círculo.
+    
+    Cada fecha es una lista de (local, visitante) en la que cada equipo juega
+    a lo sumo una vez; con cantidad impar de equipos uno queda libre por
+    fecha. Las vueltas pares invierten la localía de la primera.
+    """
+    equipos: List[Optional[str]] = list(codigos)
+    if len(equipos) % 2:
+        equipos.append(None)
+    n = len(equipos)
+    ida = []
+    # Partidos de local en la ida: cada cruce es local para quien menos jugó en casa
+    de_local = dict.fromkeys(codigos, 0)
+    for ronda in range(n - 1):
+        fecha = []
+        for i in range(n // 2):
+            local, visitante = equipos[i], equipos[n - 1 - i]
+            if local is None or visitante is None:
+                continue
+            if (de_local[local], ronda % 2) > (de_local[visitante], 0):
+                local, visitante = visitante, local
+            de_local[local] += 1
+            fecha.append((local, visitante))
+        ida.append(fecha)
+        equipos.insert(1, equipos.pop())
+    
+    fechas = []
+    for vuelta in range(vueltas):
+        if vuelta % 2:
+            fechas.extend([(visitante, local) for local, visitante in fecha] for fecha in ida)
+        else:
+            fechas.extend(list(fecha) for fecha in ida)
+    return fechas
+
+
+class GeneradorLiga:
+    """Generador determinista de ligas sintéticas.
+    
+    La misma semilla produce siempre los mismos equipos y partidos, y los
+    primeros `k` partidos no dependen de cuántos se pidan, de modo que las
+    distintas escalas de un benchmark comparten su prefijo. Los partidos
+    siguen el fixture todos contra todos y, si se piden más de los que tiene
+    un torneo, se juegan temporadas sucesivas. Los eventos son consistentes
+    con `EstadoPartido`: goles de jugadores en cancha, cambios desde el banco
+    y expulsiones (roja o doble amarilla) que dejan al equipo con uno menos.
+    """
+    
+    def __init__(self, num_equipos: int = 20, semilla: int = 0, jugadores_por_equipo: int = 23,
+                 vueltas: int = 2, inicio: datetime = datetime(2000, 8, 1)):
+        if num_equipos < 2:
+            raise ValueError("La liga necesita al menos 2 equipos")
+        if jugadores_por_equipo < 11 + SUPLENTES:
+            raise ValueError(f"Cada plantel necesita al menos {11 + SUPLENTES} jugadores")
+        self.num_equipos = num_equipos
+        self.semilla = semilla
+        self.jugadores_por_equipo = jugadores_por_equipo
+        self.vueltas = vueltas
+        self.inicio = inicio
+        self.codigos = [codigo_equipo(i) for i in range(num_equipos)]
+        
+        rng = random.Random(f"{semilla}-equipos")
+        self._nombres_equipos = self._nombres_de_equipos(rng)
+        self._planteles = [[f"{rng.choice(_NOMBRES)} {rng.choice(_APELLIDOS)}"
+                            for _ in range(jugadores_por_equipo)] for _ in range(num_equipos)]
+        # Fuerza relativa de cada equipo: multiplica sus goles esperados
+        self._fuerza = {codigo: math.exp(rng.gauss(0, 0.15)) for codigo in self.codigos}
+        self._fechas = calendario_todos_contra_todos(self.codigos, vueltas)
+    
+    def _nombres_de_equipos(self, rng: random.Random) -> List[str]:
+        nombres = []
+        usados: Dict[str, int] = {}
+        for _ in range(self.num_equipos):
+            nombre = f"{rng.choice(_PREFIJOS)} {rng.choice(_CIUDADES)}"
+            usados[nombre] = usados.get(nombre, 0) + 1
+            nombres.append(nombre if usados[nombre] == 1 else f"{nombre} {usados[nombre]}")
+        return nombres
+    
+    @property
+    def partidos_por_temporada(self) -> int:
+        return sum(len(fecha) for fecha in self._fechas)
+    
+    def equipos(self) -> List[Equipo]:
+        """Equipos con su plantel completo (objetos nuevos en cada llamada)"""
+        equipos = []
+        for codigo, nombre, plantel in zip(self.codigos, self._nombres_equipos, self._planteles):
+            equipo = Equipo(nombre, codigo)
+            for numero, jugador in enumerate(plantel, 1):
+                equipo.agregar_jugador(numero, jugador)
+            equipos.append(equipo)
+        return equipos
+    
+    def calendario(self) -> Iterator[Tuple[datetime, str, str]]:
+        """Recorre (fecha, local, visitante) temporada tras temporada, sin fin"""
+        dias_temporada = len(self._fechas) * DIAS_ENTRE_FECHAS + DIAS_ENTRE_TEMPORADAS
+        temporada = 0
+        while True:
+            inicio = self.inicio + timedelta(days=temporada * dias_temporada)
+            for numero_fecha, fecha in enumerate(self._fechas):
+                dia = inicio + timedelta(days=numero_fecha * DIAS_ENTRE_FECHAS)
+                for local, visitante in fecha:
+                    yield dia, local, visitante
+            temporada += 1
+    
+    def partidos(self, cantidad: Optional[int] = None) -> Iterator[Partido]:
+        """Genera `cantidad` partidos (por defecto, una temporada completa)"""
+        if cantidad is None:
+            cantidad = self.partidos_por_temporada
+        rng = random.Random(f"{self.semilla}-partidos")
+        for _, (fecha, local, visitante) in zip(range(cantidad), self.calendario()):
+            yield self._partido(rng, fecha, local, visitante)
+    
+    def _alineacion(self, rng: random.Random) -> Tuple[str, List[int], List[int]]:
+        """Formación, titulares (arquero primero, de defensa a ataque) y banco"""
+        campo = [numero for numero in range(1, self.jugadores_por_equipo + 1) if numero not in PORTEROS]
+        elegidos = rng.sample(campo, 10 + SUPLENTES - 1)
+        titulares = [PORTEROS[0]] + elegidos[:10]
+        banco = sorted([PORTEROS[1]] + elegidos[10:])
+        return rng.choice(FORMACIONES), titulares, banco
+    
+    def _partido(self, rng: random.Random, fecha: datetime, local: str, visitante: str) -> Partido:
+        formacion_local, titulares_local, banco_local = self._alineacion(rng)
+        formacion_visitante, titulares_visitante, banco_visitante = self._alineacion(rng)
+        
+        # Primero se sortean qué pasa y cuándo; después, a quién, en orden de minuto
+        sucesos: List[Tuple[int, str, str]] = []
+        relacion = self._fuerza[local] / self._fuerza[visitante]
+        for equipo, goles_esperados in ((local, GOLES_LOCAL * relacion), (visitante, GOLES_VISITANTE / relacion)):
+            sucesos.extend((_minuto(rng), 'gol', equipo) for _ in range(_poisson(rng, goles_esperados)))
+            sucesos.extend((_minuto(rng), 'amarilla', equipo) for _ in range(_poisson(rng, AMARILLAS_POR_EQUIPO)))
+            if rng.random() < PROBABILIDAD_ROJA:
+                sucesos.append((_minuto(rng), 'roja', equipo))
+            sucesos.extend((rng.randint(46, 88), 'cambio', equipo)
+                           for _ in range(rng.randint(*CAMBIOS_POR_EQUIPO)))
+        sucesos.sort(key=lambda suceso: suceso[0])
+        
+        en_cancha = {local: list(titulares_local), visitante: list(titulares_visitante)}
+        disponibles = {local: [n for n in banco_local if n not in PORTEROS],
+                       visitante: [n for n in banco_visitante if n not in PORTEROS]}
+        # Peso de gol de cada jugador: crece de la defensa al ataque
+        peso = {(local, n): i for i, n in enumerate(titulares_local)}
+        peso.update(((visitante, n), i) for i, n in enumerate(titulares_visitante))
+        amonestados = set()
+        eventos: List[Evento] = []
+        
+        for minuto, tipo, equipo in sucesos:
+            jugadores = en_cancha[equipo]
+            if not jugadores:
+                continue
+            if tipo == 'gol':
+                autor = rng.choices(jugadores, weights=[peso[(equipo, n)] + 1 for n in jugadores])[0]
+                asistente = None
+                if len(jugadores) > 1 and rng.random() < PROBABILIDAD_ASISTENCIA:
+                    asistente = rng.choice([n for n in jugadores if n != autor])
+                eventos.append(Gol(minuto, equipo, autor, asistente))
+            elif tipo == 'cambio':
+                campo = [n for n in jugadores if n not in PORTEROS]
+                if not campo or not disponibles[equipo]:
+                    continue
+                sale = rng.choice(campo)
+                entra = disponibles[equipo].pop(rng.randrange(len(disponibles[equipo])))
+                jugadores[jugadores.index(sale)] = entra
+                peso[(equipo, entra)] = peso[(equipo, sale)]
+                eventos.append(Cambio(minuto, equipo, sale, entra))
+            else:
+                jugador = rng.choice(jugadores)
+                expulsion = tipo == 'roja' or (equipo, jugador) in amonestados
+                amonestados.add((equipo, jugador))
+                eventos.append(Tarjeta(minuto, equipo, jugador, 'ROJA' if tipo == 'roja' else 'AMARILLA'))
+                if expulsion:
+                    jugadores.remove(jugador)
+        
+        return Partido(
+            fecha=fecha,
+            equipo_local=local,
+            equipo_visitante=visitante,
+            formacion_local=formacion_local,
+            formacion_visitante=formacion_visitante,
+            titulares_local=titulares_local,
+            titulares_visitante=titulares_visitante,
+            banco_local=banco_local,
+            banco_visitante=banco_visitante,
+            eventos=eventos
+        )
+    
+    def crear_sistema(self, cantidad: Optional[int] = None,
+                      sistema: Optional[SistemaFutbol] = None) -> SistemaFutbol:
+        """Registra los equipos y agrega los partidos generados a un sistema"""
+        if sistema is None:
+            sistema = SistemaFutbol()
+        for equipo in self.equipos():
+            sistema.agregar_equipo(equipo)
+        for partido in self.partidos(cantidad):
+            sistema.agregar_partido(partido)
+        return sistema
+    
+    def escribir_equipos(self, ruta: str):
+        """Escribe un script de DSL interno que registra los equipos (para `importar.py --equipos`)"""
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            archivo.write(f"# Equipos de la liga sintética (semilla {self.semilla})\n"
+                          "# Se ejecuta con la variable `sistema` ya definida\n\n")
+            for equipo in self.equipos():
+                archivo.write(f"equipo = sistema.crear_equipo().con_nombre({equipo.nombre!r})"
+                              f".con_codigo({equipo.codigo!r})\n")
+                for jugador in equipo.jugadores:
+                    archivo.write(f"equipo.agregar_jugador({jugador.numero}, {jugador.nombre!r})\n")
+                archivo.write("sistema.registrar_equipo(equipo)\n\n")
+    
+    def escribir_dsl(self, directorio: str, cantidad: Optional[int] = None,
+                     partidos_por_archivo: int = 1000) -> List[str]:
+        """Escribe los partidos en archivos .txt del DSL externo y devuelve sus rutas.
+        
+        Los partidos se generan y escriben de a uno, sin conservarlos en memoria.
+        """
+        os.makedirs(directorio, exist_ok=True)
+        rutas = []
+        archivo = None
+        try:
+            for i, partido in enumerate(self.partidos(cantidad)):
+                if i % partidos_por_archivo == 0:
+                    if archivo:
+                        archivo.close()
+                    rutas.append(os.path.join(directorio, f"partidos_{len(rutas):04d}.txt"))
+                    archivo = open(rutas[-1], 'w', encoding='utf-8')
+                archivo.write(partido_a_dsl(partido))
+        finally:
+            if archivo:
+                archivo.close()
+        return rutas
+
+
+def _poisson(rng: random.Random, media: float) -> int:
+    """Muestra de una distribución de Poisson (método de Knuth, para medias chicas)"""
+    limite = math.exp(-media)
+    cantidad = 0
+    producto = rng.random()
+    while producto > limite:
+        cantidad += 1
+        producto *= rng.random()
+    return cantidad
+
+
+def _minuto(rng: random.Random) -> int:
+    """Minuto de un evento, con algunos en el tiempo de descuento"""
+    if rng.random() < PROBABILIDAD_DESCUENTO:
+        return DURACION_PARTIDO + rng.randint(1, 5)
+    return rng.randint(1, DURACION_PARTIDO)
+
+
+def partido_a_dsl(partido: Partido) -> str:
+    """Escribe un partido con la sintaxis del DSL externo"""
+    lineas = [
+        f"FECHA: {partido.fecha.strftime('%d/%m/%Y')}",
+        f"EQUIPO LOCAL: {partido.equipo_local}",
+        f"EQUIPO VISITANTE: {partido.equipo_visitante}",
+        f"FORMACION LOCAL: {partido.formacion_local}",
+        f"FORMACION VISITANTE: {partido.formacion_visitante}",
+        f"TITULARES LOCAL: {','.join(map(str, partido.titulares_local))}",
+        f"TITULARES VISITANTE: {','.join(map(str, partido.titulares_visitante))}",
+        f"BANCO LOCAL: {','.join(map(str, partido.banco_local))}",
+        f"BANCO VISITANTE: {','.join(map(str, partido.banco_visitante))}",
+    ]
+    for evento in partido.eventos:
+        if isinstance(evento, Gol):
+            asistente = f", {evento.asistente}" if evento.asistente else ""
+            lineas.append(f"GOL: {evento.equipo}, {evento.tiempo}, {evento.autor}{asistente}")
+        elif isinstance(evento, Tarjeta):
+            lineas.append(f"TARJETA: {evento.equipo}, {evento.tiempo}, {evento.jugador}, {evento.color}")
+        elif isinstance(evento, Cambio):
+            lineas.append(f"CAMBIO: {evento.equipo}, {evento.tiempo}, {evento.jugador_sale}, {evento.jugador_entra}")
+    return "\n".join(lineas) + "\n\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos del generador"""
+    argumentos = argparse.ArgumentParser(
+        description="Genera una liga sintética como archivos del DSL externo")
+    argumentos.add_argument('directorio', help="Directorio donde escribir equipos.py y los partidos")
+    argumentos.add_argument('--equipos', type=int, default=20, help="Cantidad de equipos")
+    argumentos.add_argument('--partidos', type=int,
+                            help="Cantidad de partidos (por defecto, una temporada completa)")
+    argumentos.add_argument('--semilla', type=int, default=0, help="Semilla del generador")
+    argumentos.add_argument('--jugadores', type=int, default=23, help="Jugadores por plantel")
+    argumentos.add_argument('--vueltas', type=int, default=2, help="Vueltas del torneo todos contra todos")
+    argumentos.add_argument('--por-archivo', type=int, default=1000, help="Partidos por archivo .txt")
+    args = argumentos.parse_args(argv)
+    
+    generador = GeneradorLiga(args.equipos, args.semilla, args.jugadores, args.vueltas)
+    os.makedirs(args.directorio, exist_ok=True)
+    ruta_equipos = os.path.join(args.directorio, 'equipos.py')
+    generador.escribir_equipos(ruta_equipos)
+    rutas = generador.escribir_dsl(args.directorio, args.partidos, args.por_archivo)
+    
+    cantidad = args.partidos if args.partidos is not None else generador.partidos_por_temporada
+    print(f"👥 {args.equipos} equipos en {ruta_equipos}")
+    print(f"⚽ {cantidad} partidos en {len(rutas)} archivos")
+    print(f"📥 python importar.py --equipos {ruta_equipos} {args.directorio}")
+    return 0
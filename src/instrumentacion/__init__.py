@@ -0,0 +1,5 @@
+from .instrumentacion import (activar, configurar, contar, desactivar, esta_activa, imprimir_resumen, medido,
+                              reiniciar, resumen, tramo, VARIABLE_ENTORNO)
+
+__all__ = ['activar', 'configurar', 'contar', 'desactivar', 'esta_activa', 'imprimir_resumen', 'medido',
+           'reiniciar', 'resumen', 'tramo', 'VARIABLE_ENTORNO']
@@ -0,0 +1,242 @@
+"""
+Instrumentación liviana
+Tramos con nombre y contadores para ver en qué etapa se va el tiempo del análisis, las
+agregaciones y el dibujo de tablas; desactivada no hace más que consultar una bandera
+"""
+
+import atexit
+import cProfile
+import functools
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+# FUTBOL_PERFIL=1 (o "resumen") imprime el resumen al salir; con una ruta además guarda
+# un perfil de cProfile en ese archivo, para abrirlo con pstats o snakeviz. Solo se lee en
+# `configurar`, que llaman los puntos de entrada de línea de comandos: importar los módulos
+# nunca activa la instrumentación
+VARIABLE_ENTORNO = 'FUTBOL_PERFIL'
+_VALORES_RESUMEN = ('1', 'resumen', 'si', 'sí', 'true')
+
+_activa = False
+_inicio = 0.0
+# Por nombre de tramo: [llamadas, segundos totales, segundos de la llamada más larga,
+# segundos dentro de otro tramo]. Los tramos se anidan (reconstruir una tabla histórica
+# dentro de una consulta mide también cada agregado): el tiempo anidado ya está incluido
+# en el del tramo de afuera
+_tramos: Dict[str, List] = {}
+# Tramos abiertos en este momento
+_profundidad = 0
+_contadores: Dict[str, int] = {}
+_perfilador: Optional[cProfile.Profile] = None
+_ruta_pstats: Optional[str] = None
+_salida_registrada = False
+# Métodos medidos: (función original, nombre del tramo) y las envolturas instaladas al activar
+_metodos: List[Tuple[Callable, str]] = []
+_instalados: List[Tuple[type, str, Callable]] = []
+
+
+class _TramoNulo:
+    """Tramo que no mide nada: el mismo objeto sirve para todas las llamadas"""
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excepcion):
+        return False
+
+
+_TRAMO_NULO = _TramoNulo()
+
+
+class _Tramo:
+    """Mide el tiempo entre la entrada y la salida y lo acumula bajo su nombre"""
+    __slots__ = ('nombre', 'inicio', 'anidado')
+    
+    def __init__(self, nombre: str):
+        self.nombre = nombre
+    
+    def __enter__(self):
+        global _profundidad
+        self.anidado = _profundidad > 0
+        _profundidad += 1
+        self.inicio = time.perf_counter()
+        return self
+    
+    def __exit__(self, *excepcion):
+        global _profundidad
+        duracion = time.perf_counter() - self.inicio
+        _profundidad -= 1
+        anidado = duracion if self.anidado else 0.0
+        datos = _tramos.get(self.nombre)
+        if datos is None:
+            _tramos[self.nombre] = [1, duracion, duracion, anidado]
+        else:
+            datos[0] += 1
+            datos[1] += duracion
+            if duracion > datos[2]:
+                datos[2] = duracion
+            datos[3] += anidado
+        return False
+
+
+def esta_activa() -> bool:
+    return _activa
+
+
+def tramo(nombre: str):
+    """Contexto que acumula el tiempo de su bloque bajo `nombre` (si la instrumentación está activa)"""
+    return _Tramo(nombre) if _activa else _TRAMO_NULO
+
+
+def _envolver(funcion: Callable, nombre: str) -> Callable:
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        if not _activa:
+            return funcion(*args, **kwargs)
+        with _Tramo(nombre):
+            return funcion(*args, **kwargs)
+    return envoltura
+
+
+def medido(nombre: str) -> Callable:
+    """Decorador que mide cada llamada a la función como un tramo `nombre`.
+    
+    Los métodos quedan intactos y su clase recibe la envoltura recién al
+    activar la instrumentación, así desactivada no agrega ni una llamada en
+    los caminos calientes. Las funciones de módulo, que pueden haberse
+    importado con `from ... import`, se envuelven siempre y consultan la
+    bandera en cada llamada.
+    """
+    def decorador(funcion: Callable) -> Callable:
+        partes = funcion.__qualname__.split('.')
+        if len(partes) == 2 and not _activa:
+            _metodos.append((funcion, nombre))
+            return funcion
+        return _envolver(funcion, nombre)
+    return decorador
+
+
+def _instalar_envolturas():
+    """Reemplaza en su clase cada método medido por su envoltura"""
+    for funcion, nombre in _metodos:
+        clase_nombre, metodo = funcion.__qualname__.split('.')
+        clase = getattr(sys.modules.get(funcion.__module__), clase_nombre, None)
+        if clase is not None and clase.__dict__.get(metodo) is funcion:
+            setattr(clase, metodo, _envolver(funcion, nombre))
+            _instalados.append((clase, metodo, funcion))
+
+
+def _quitar_envolturas():
+    for clase, metodo, funcion in _instalados:
+        setattr(clase, metodo, funcion)
+    _instalados.clear()
+
+
+def contar(nombre: str, cantidad: int = 1):
+    """Suma `cantidad` al contador `nombre` (si la instrumentación está activa)"""
+    if _activa:
+        _contadores[nombre] = _contadores.get(nombre, 0) + cantidad
+
+
+def activar(ruta_pstats: Optional[str] = None, resumen_al_salir: bool = True):
+    """Empieza a medir; con `ruta_pstats` también perfila con cProfile y guarda el perfil al salir"""
+    global _activa, _inicio, _perfilador, _ruta_pstats, _salida_registrada
+    if not _activa:
+        _activa = True
+        _inicio = time.perf_counter()
+        _instalar_envolturas()
+    if ruta_pstats and _perfilador is None:
+        _ruta_pstats = ruta_pstats
+        _perfilador = cProfile.Profile()
+        _perfilador.enable()
+    if resumen_al_salir and not _salida_registrada:
+        atexit.register(_al_salir)
+        _salida_registrada = True
+
+
+def desactivar():
+    """Deja de medir (los datos juntados se conservan hasta `reiniciar`)"""
+    global _activa, _perfilador
+    _activa = False
+    _quitar_envolturas()
+    if _perfilador is not None:
+        _perfilador.disable()
+
+
+def reiniciar():
+    """Descarta los tramos y contadores juntados"""
+    global _inicio
+    _tramos.clear()
+    _contadores.clear()
+    _inicio = time.perf_counter()
+
+
+def configurar(destino: Optional[str] = None):
+    """Activa la instrumentación según la opción `--perfil` de un punto de entrada.
+    
+    Sin opción (None) se usa `FUTBOL_PERFIL`; vacío no hace nada; "1" o
+    "resumen" imprimen el resumen al salir; cualquier otro valor es la ruta
+    del archivo de perfil de cProfile.
+    """
+    if destino is None:
+        destino = os.environ.get(VARIABLE_ENTORNO)
+    if not destino:
+        return
+    if destino.strip().lower() in _VALORES_RESUMEN:
+        activar()
+    else:
+        activar(ruta_pstats=destino)
+
+
+def resumen() -> Dict:
+    """Tramos y contadores juntados hasta ahora.
+    
+    Por tramo: llamadas, total, promedio y máximo en segundos, y `anidado`,
+    la parte del total que transcurrió dentro de otro tramo.
+    """
+    tramos = {nombre: {'llamadas': llamadas, 'total': total, 'promedio': total / llamadas, 'maximo': maximo,
+                       'anidado': anidado}
+              for nombre, (llamadas, total, maximo, anidado) in _tramos.items()}
+    return {'segundos': time.perf_counter() - _inicio, 'tramos': tramos, 'contadores': dict(_contadores)}
+
+
+def imprimir_resumen(archivo: Optional[TextIO] = None):
+    """Imprime el tiempo por etapa, de la más costosa a la más barata, y los contadores.
+    
+    El porcentaje cuenta solo el tiempo de cada tramo fuera de otros tramos,
+    así la columna no suma más de 100%; "Anidado s" es el tiempo que ya
+    figura en el tramo de afuera.
+    """
+    archivo = archivo or sys.stderr
+    datos = resumen()
+    transcurrido = datos['segundos'] or 1e-9
+    print(f"\n⏱️  Instrumentación: {datos['segundos']:.3f} s medidos", file=archivo)
+    if datos['tramos']:
+        print(f"{'Tramo':<40} {'Llamadas':>10} {'Total s':>10} {'Anidado s':>10} {'%':>6} "
+              f"{'Prom. ms':>10} {'Máx. ms':>10}", file=archivo)
+        for nombre, medicion in sorted(datos['tramos'].items(),
+                                       key=lambda item: (-(item[1]['total'] - item[1]['anidado']),
+                                                         -item[1]['total'])):
+            fuera = medicion['total'] - medicion['anidado']
+            # Los tramos que siempre corren dentro de otro se marcan con ↳
+            etiqueta = f"↳ {nombre}" if fuera <= 0 else nombre
+            print(f"{etiqueta:<40} {medicion['llamadas']:>10,} {medicion['total']:>10.3f} "
+                  f"{medicion['anidado']:>10.3f} {fuera * 100 / transcurrido:>6.1f} "
+                  f"{medicion['promedio'] * 1000:>10.3f} {medicion['maximo'] * 1000:>10.3f}", file=archivo)
+    if datos['contadores']:
+        print(f"{'Contador':<40} {'Valor':>10}", file=archivo)
+        for nombre, valor in sorted(datos['contadores'].items()):
+            print(f"{nombre:<40} {valor:>10,}", file=archivo)
+
+
+def _al_salir():
+    if _perfilador is not None:
+        _perfilador.disable()
+        _perfilador.dump_stats(_ruta_pstats)
+    imprimir_resumen()
+    if _perfilador is not None:
+        print(f"💾 Perfil de cProfile guardado en {_ruta_pstats} "
+              f"(python -m pstats {_ruta_pstats})", file=sys.stderr)
@@ -3,19 +3,27 @@ Menú Principal del Sistema de Gestión de Partidos de Fútbol
 """
 
 import os
-from typing import Optional
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional
 import sys
 import os
 # Agregar el directorio raíz al path para importar módulos
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from src.dsl_interno import SistemaFutbol
-from src.dsl_externo import procesar_archivo_partidos, procesar_comando_partido
+from src.dsl_externo import importar_archivo, procesar_comando_partido
 from src.ui import ui
 
 
 class MenuPrincipal:
     """Menú principal del sistema"""
     
+    PARTIDOS_POR_PAGINA = 10
+    # Filas por pantalla en las tablas (par, así los colores alternan igual en cada página)
+    FILAS_POR_PAGINA = 20
+    # Filas del comienzo de una tabla de las que se toman los anchos de columna
+    MUESTRA_ANCHOS = 200
+    
     def __init__(self, sistema: SistemaFutbol):
         self.sistema = sistema
     
@@ -229,10 +237,15 @@ class MenuPrincipal:
         
         print(f"Procesando archivo: {archivo_path}")
         
-        if procesar_archivo_partidos(archivo_path, self.sistema):
-            print("✓ Archivo procesado exitosamente")
+        # Los partidos válidos se cargan aunque otros tengan errores
+        resultado = importar_archivo(archivo_path, self.sistema)
+        for diagnostico in resultado.diagnosticos:
+            print(f"❌ {diagnostico}")
+        
+        if resultado.exitoso:
+            print(f"✓ Archivo procesado exitosamente ({resultado.partidos} partidos)")
         else:
-            print("✗ Error procesando el archivo")
+            print(f"✗ Se cargaron {resultado.partidos} partidos; {resultado.errores} errores")
     
     def _mostrar_tabla_posiciones(self):
         """Muestra la tabla de posiciones"""
@@ -253,12 +266,15 @@ class MenuPrincipal:
             ui.pause()
             return
         
-        # Preparar datos para la tabla
-        headers = ["Pos", "Equipo", "PJ", "G", "E", "P", "GF", "GC", "Pts"]
-        rows = []
-        
-        for i, equipo_stats in enumerate(tabla, 1):
-            row = [
+        headers = ["Pos", "Equipo", "PJ", "G", "E", "P", "GF", "GC", "DG", "Pts"]
+        self._mostrar_tabla_paginada(headers, lambda desde: self._filas_posiciones(tabla, desde),
+                                     "Clasificación de Equipos", total=len(tabla))
+    
+    @staticmethod
+    def _filas_posiciones(tabla: List[Dict], desde: int) -> Iterator[List[str]]:
+        """Filas de la tabla de posiciones a partir de la posición `desde` (contando desde 0)"""
+        for i, equipo_stats in enumerate(islice(tabla, desde, None), desde + 1):
+            yield [
                 str(i),
                 equipo_stats['equipo'],
                 str(equipo_stats['partidos_jugados']),
@@ -267,13 +283,9 @@ class MenuPrincipal:
                 str(equipo_stats['perdidos']),
                 str(equipo_stats['goles_a_favor']),
                 str(equipo_stats['goles_en_contra']),
+                f"{equipo_stats['diferencia_goles']:+d}",
                 str(equipo_stats['puntos'])
             ]
-            rows.append(row)
-        
-        # Mostrar tabla profesional
-        ui.print_table(headers, rows, "Clasificación de Equipos")
-        ui.pause()
     
     def _mostrar_tabla_goleadores(self):
         """Muestra la tabla de goleadores"""
@@ -286,30 +298,57 @@ class MenuPrincipal:
             ui.pause()
             return
         
-        tabla = self.sistema.obtener_tabla_goleadores()
-        
-        if not tabla:
+        if next(self.sistema.iterar_tabla_goleadores(), None) is None:
             ui.print_status("No hay goles registrados aún", "info")
             ui.print_status("Use la opción 1 para cargar partidos con eventos", "info")
             ui.pause()
             return
         
-        # Preparar datos para la tabla
         headers = ["Pos", "Jugador", "Equipo", "Goles"]
-        rows = []
-        
-        for i, goleador in enumerate(tabla, 1):
-            row = [
+        self._mostrar_tabla_paginada(headers, self._filas_goleadores, "Ranking de Goleadores")
+    
+    def _filas_goleadores(self, desde: int) -> Iterator[List[str]]:
+        """Filas del ranking de goleadores a partir de la posición `desde` (contando desde 0)"""
+        for i, goleador in enumerate(islice(self.sistema.iterar_tabla_goleadores(), desde, None), desde + 1):
+            yield [
                 str(i),
                 goleador['jugador'],
                 goleador['equipo'],
                 str(goleador['goles'])
             ]
-            rows.append(row)
+    
+    def _mostrar_tabla_paginada(self, headers: List[str], filas_desde: Callable[[int], Iterator[List[str]]],
+                                titulo: str, total: Optional[int] = None):
+        """Muestra una tabla de a una página, armando solo las filas visibles.
+        
+        `filas_desde(posicion)` devuelve un generador de filas a partir de esa
+        posición. Los anchos de columna se toman de las primeras filas y se
+        mantienen en todas las páginas, así cada pantalla cuesta lo mismo sin
+        importar el tamaño de la tabla.
+        """
+        anchos = ui.column_widths(headers, filas_desde(0), sample=self.MUESTRA_ANCHOS)
+        pagina = 1
         
-        # Mostrar tabla profesional
-        ui.print_table(headers, rows, "Ranking de Goleadores")
-        ui.pause()
+        while True:
+            filas = filas_desde((pagina - 1) * self.FILAS_POR_PAGINA)
+            ui.print_table(headers, filas, titulo, page_size=self.FILAS_POR_PAGINA, col_widths=anchos)
+            # Lo que queda en el generador indica si hay otra página
+            hay_siguiente = next(filas, None) is not None
+            
+            if total is not None:
+                total_paginas = max((total + self.FILAS_POR_PAGINA - 1) // self.FILAS_POR_PAGINA, 1)
+                print(f"\n📄 Página {pagina} de {total_paginas} ({total} filas)")
+            else:
+                print(f"\n📄 Página {pagina}{'' if hay_siguiente else ' (última)'}")
+            print("S: siguiente | A: anterior | Enter: volver")
+            opcion = ui.input_prompt("Opción: ").strip().upper()
+            
+            if opcion == 'S':
+                pagina += 1 if hay_siguiente else 0
+            elif opcion == 'A':
+                pagina = max(pagina - 1, 1)
+            else:
+                break
     
     def _mostrar_resultados_partidos(self):
         """Muestra todos los resultados de partidos"""
@@ -330,19 +369,60 @@ class MenuPrincipal:
             input("\nPresione Enter para continuar...")
             return
         
-        for i, partido in enumerate(self.sistema.partidos, 1):
-            resultado = partido.obtener_resultado()
-            print(f"\n{i}. {partido}")
+        filtros = {}
+        pagina = 1
+        
+        while True:
+            consulta = self.sistema.consultar_partidos(pagina=pagina, por_pagina=self.PARTIDOS_POR_PAGINA,
+                                                       **filtros)
+            
+            if consulta.total == 0:
+                print("\n💡 Ningún partido coincide con el filtro")
+            
+            for i, partido in enumerate(consulta.partidos, consulta.inicio):
+                print(f"\n{i}. {partido}")
+                
+                # Mostrar eventos del partido
+                if partido.eventos:
+                    print("   📋 Eventos:")
+                    for evento in sorted(partido.eventos, key=lambda e: e.tiempo):
+                        print(f"   - {evento}")
+                else:
+                    print("   📋 Sin eventos registrados")
+            
+            print(f"\n📄 Página {consulta.pagina} de {consulta.total_paginas} "
+                  f"({consulta.total} partidos)")
+            print("S: siguiente | A: anterior | E: filtrar por equipo | "
+                  "D: filtrar por fechas | T: todos | Enter: volver")
+            opcion = input("Opción: ").strip().upper()
             
-            # Mostrar eventos del partido
-            if partido.eventos:
-                print("   📋 Eventos:")
-                for evento in sorted(partido.eventos, key=lambda e: e.tiempo):
-                    print(f"   - {evento}")
+            if opcion == 'S':
+                pagina = min(pagina + 1, consulta.total_paginas)
+            elif opcion == 'A':
+                pagina = max(pagina - 1, 1)
+            elif opcion == 'E':
+                codigos = input("Código del equipo (y opcionalmente del rival): ").strip().upper().split()
+                filtros.pop('equipo', None)
+                filtros.pop('rival', None)
+                if codigos:
+                    filtros['equipo'] = codigos[0]
+                if len(codigos) > 1:
+                    filtros['rival'] = codigos[1]
+                pagina = 1
+            elif opcion == 'D':
+                try:
+                    desde = input("Desde (DD/MM/YYYY, vacío = sin límite): ").strip()
+                    hasta = input("Hasta (DD/MM/YYYY, vacío = sin límite): ").strip()
+                    filtros['desde'] = datetime.strptime(desde, '%d/%m/%Y') if desde else None
+                    filtros['hasta'] = datetime.strptime(hasta, '%d/%m/%Y') if hasta else None
+                    pagina = 1
+                except ValueError:
+                    print("❌ Formato de fecha inválido. Use DD/MM/YYYY")
+            elif opcion == 'T':
+                filtros = {}
+                pagina = 1
             else:
-                print("   📋 Sin eventos registrados")
-        
-        input("\nPresione Enter para continuar...")
+                break
     
     def _mostrar_ayuda(self):
         """Muestra ayuda y tutorial del sistema"""
@@ -0,0 +1,3 @@
+from .persistencia import guardar_snapshot, cargar_snapshot, ErrorSnapshot
+
+__all__ = ['guardar_snapshot', 'cargar_snapshot', 'ErrorSnapshot']
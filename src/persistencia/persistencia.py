@@ -0,0 +1,261 @@
+"""
+Persistencia del sistema en snapshots binarios
+Guarda y restaura equipos, jugadores, partidos y eventos en un formato compacto y versionado
+"""
+
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+# Agregar el directorio raíz al path para importar models
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from models import Cambio, Equipo, Evento, Gol, Jugador, Partido, SistemaFutbol, Tarjeta
+
+# Formato del archivo (little endian):
+#   cabecera   : MAGIA, versión (u16)
+#   cadenas    : cantidad (u32) y cada cadena como largo (u32) + UTF-8
+#   equipos    : cantidad (u32); por equipo código, nombre y jugadores (número u16, nombre)
+#   partidos   : cantidad (u32); por partido cabecera fija, planteles como arreglos u16
+#                y eventos como registros fijos (tipo u8, minuto u16, equipo u32, dato1 u16,
+#                dato2 u16)
+# Códigos de equipo, formaciones y nombres se guardan una sola vez en la tabla de
+# cadenas y se referencian por índices u32. El color de una tarjeta no es una cadena:
+# va en el byte de tipo del evento (amarilla o roja).
+# Versión 1: el color era un índice u16 en la tabla de cadenas, que se desbordaba con
+# más de 65.535 cadenas; se sigue pudiendo leer.
+# Números de camiseta y minutos van en u16 y el largo de cada plantel en u8; 0xFFFF
+# marca un gol sin asistente, así que no puede ser el número de un asistente. Los
+# valores fuera de rango se informan con ErrorSnapshot.
+MAGIA = b'SFUT'
+VERSION = 2
+_VERSIONES_LEGIBLES = (1, VERSION)
+
+_CABECERA = struct.Struct('<4sH')
+_U32 = struct.Struct('<I')
+_EQUIPO = struct.Struct('<III')
+_JUGADOR = struct.Struct('<HI')
+_PARTIDO = struct.Struct('<IIIIIIBBBBI')
+_EVENTO = struct.Struct('<BHIHH')
+
+_GOL, _AMARILLA, _CAMBIO, _ROJA = 0, 1, 2, 3
+_TIPO_TARJETA = {'AMARILLA': _AMARILLA, 'ROJA': _ROJA}
+_COLOR_TARJETA = {_AMARILLA: 'AMARILLA', _ROJA: 'ROJA'}
+_SIN_ASISTENTE = 0xFFFF
+
+
+class ErrorSnapshot(ValueError):
+    """Archivo de snapshot inválido o de una versión no soportada"""
+
+
+class _TablaCadenas:
+    """Asigna un índice a cada cadena distinta"""
+    
+    def __init__(self):
+        self.indices: Dict[str, int] = {}
+    
+    def indice(self, cadena: str) -> int:
+        indice = self.indices.get(cadena)
+        if indice is None:
+            indice = len(self.indices)
+            self.indices[cadena] = indice
+        return indice
+
+
+def _serializar_partido(partido: Partido, cadenas: _TablaCadenas, salida: bytearray):
+    """Agrega un partido con sus planteles y eventos a la salida"""
+    planteles = [partido.titulares_local, partido.titulares_visitante,
+                 partido.banco_local, partido.banco_visitante]
+    fecha = partido.fecha
+    salida += _PARTIDO.pack(
+        fecha.toordinal(),
+        fecha.hour * 3600 + fecha.minute * 60 + fecha.second,
+        cadenas.indice(partido.equipo_local),
+        cadenas.indice(partido.equipo_visitante),
+        cadenas.indice(partido.formacion_local),
+        cadenas.indice(partido.formacion_visitante),
+        *(len(plantel) for plantel in planteles),
+        len(partido.eventos)
+    )
+    for plantel in planteles:
+        salida += array('H', plantel).tobytes()
+    
+    for evento in partido.eventos:
+        equipo = cadenas.indice(evento.equipo)
+        if isinstance(evento, Gol):
+            asistente = _SIN_ASISTENTE if evento.asistente is None else evento.asistente
+            if evento.asistente == _SIN_ASISTENTE:
+                raise ErrorSnapshot(f"Asistente fuera de rango para el snapshot: {evento.asistente}")
+            salida += _EVENTO.pack(_GOL, evento.tiempo, equipo, evento.autor, asistente)
+        elif isinstance(evento, Tarjeta):
+            tipo = _TIPO_TARJETA.get(evento.color.upper())
+            if tipo is None:
+                raise ErrorSnapshot(f"Color de tarjeta no soportado: {evento.color}")
+            salida += _EVENTO.pack(tipo, evento.tiempo, equipo, evento.jugador, 0)
+        elif isinstance(evento, Cambio):
+            salida += _EVENTO.pack(_CAMBIO, evento.tiempo, equipo, evento.jugador_sale,
+                                   evento.jugador_entra)
+
+
+def guardar_snapshot(sistema: SistemaFutbol, ruta: str):
+    """Guarda el sistema completo en un snapshot binario.
+    
+    El archivo se escribe primero en una ruta temporal y luego se renombra,
+    de modo que un snapshot existente nunca queda a medio escribir.
+    """
+    cadenas = _TablaCadenas()
+    cuerpo = bytearray()
+    
+    cuerpo += _U32.pack(len(sistema.equipos))
+    for equipo in sistema.equipos.values():
+        cuerpo += _EQUIPO.pack(cadenas.indice(equipo.codigo), cadenas.indice(equipo.nombre),
+                               len(equipo.jugadores))
+        for jugador in equipo.jugadores:
+            try:
+                cuerpo += _JUGADOR.pack(jugador.numero, cadenas.indice(jugador.nombre))
+            except struct.error:
+                raise ErrorSnapshot(f"Número de jugador fuera de rango en {equipo.codigo}: {jugador.numero}")
+    
+    cuerpo += _U32.pack(len(sistema.partidos))
+    for partido in sistema.partidos:
+        try:
+            _serializar_partido(partido, cadenas, cuerpo)
+        except (struct.error, OverflowError) as e:
+            raise ErrorSnapshot(f"Valor fuera de rango en el partido {partido.equipo_local} vs "
+                                f"{partido.equipo_visitante} del {partido.fecha:%d/%m/%Y}: {e}")
+    
+    salida = bytearray(_CABECERA.pack(MAGIA, VERSION))
+    salida += _U32.pack(len(cadenas.indices))
+    for cadena in cadenas.indices:
+        codificada = cadena.encode('utf-8')
+        salida += _U32.pack(len(codificada))
+        salida += codificada
+    salida += cuerpo
+    
+    temporal = f"{ruta}.tmp"
+    with open(temporal, 'wb') as archivo:
+        archivo.write(salida)
+    os.replace(temporal, ruta)
+
+
+def cargar_snapshot(ruta: str, sistema: Optional[SistemaFutbol] = None) -> SistemaFutbol:
+    """Carga un snapshot binario en `sistema` (o en un sistema nuevo) y lo devuelve"""
+    if sistema is None:
+        sistema = SistemaFutbol()
+    
+    with open(ruta, 'rb') as archivo:
+        datos = memoryview(archivo.read())
+    
+    try:
+        magia, version = _CABECERA.unpack_from(datos, 0)
+    except struct.error:
+        raise ErrorSnapshot(f"El archivo {ruta} no es un snapshot válido")
+    if magia != MAGIA:
+        raise ErrorSnapshot(f"El archivo {ruta} no es un snapshot válido")
+    if version not in _VERSIONES_LEGIBLES:
+        raise ErrorSnapshot(f"Versión de snapshot no soportada: {version} (se esperaba {VERSION})")
+    
+    try:
+        _leer_cuerpo(datos, _CABECERA.size, sistema, version)
+    except (struct.error, IndexError, KeyError, UnicodeDecodeError) as e:
+        raise ErrorSnapshot(f"Snapshot dañado: {e}")
+    
+    return sistema
+
+
+def _leer_cuerpo(datos: memoryview, posicion: int, sistema: SistemaFutbol, version: int = VERSION):
+    """Lee cadenas, equipos y partidos a partir de `posicion`"""
+    (cantidad,) = _U32.unpack_from(datos, posicion)
+    posicion += _U32.size
+    cadenas: List[str] = []
+    for _ in range(cantidad):
+        (largo,) = _U32.unpack_from(datos, posicion)
+        posicion += _U32.size
+        cadenas.append(str(datos[posicion:posicion + largo], 'utf-8'))
+        posicion += largo
+    
+    (cantidad,) = _U32.unpack_from(datos, posicion)
+    posicion += _U32.size
+    for _ in range(cantidad):
+        codigo, nombre, num_jugadores = _EQUIPO.unpack_from(datos, posicion)
+        posicion += _EQUIPO.size
+        jugadores = [Jugador(numero, cadenas[nombre_jugador])
+                     for numero, nombre_jugador in _JUGADOR.iter_unpack(
+                         datos[posicion:posicion + num_jugadores * _JUGADOR.size])]
+        posicion += num_jugadores * _JUGADOR.size
+        sistema.agregar_equipo(Equipo(cadenas[nombre], cadenas[codigo], jugadores))
+    
+    (cantidad,) = _U32.unpack_from(datos, posicion)
+    posicion += _U32.size
+    lector = _LectorPartidos(datos, cadenas, version)
+    for _ in range(cantidad):
+        partido, posicion = lector.leer(posicion)
+        sistema.agregar_partido(partido)
+
+
+class _LectorPartidos:
+    """Lee partidos reutilizando fechas y planteles repetidos entre partidos"""
+    
+    def __init__(self, datos: memoryview, cadenas: List[str], version: int = VERSION):
+        self.datos = datos
+        self.cadenas = cadenas
+        self.version = version
+        self.fechas: Dict[tuple, datetime] = {}
+        self.planteles: Dict[bytes, tuple] = {}
+    
+    def _plantel(self, posicion: int, largo: int) -> List[int]:
+        crudo = bytes(self.datos[posicion:posicion + largo * 2])
+        plantel = self.planteles.get(crudo)
+        if plantel is None:
+            numeros = array('H')
+            numeros.frombytes(crudo)
+            plantel = tuple(numeros)
+            self.planteles[crudo] = plantel
+        return list(plantel)
+    
+    def leer(self, posicion: int):
+        """Lee un partido y devuelve (partido, nueva posición)"""
+        datos = self.datos
+        cadenas = self.cadenas
+        (ordinal, segundos, local, visitante, formacion_local, formacion_visitante,
+         *largos, num_eventos) = _PARTIDO.unpack_from(datos, posicion)
+        posicion += _PARTIDO.size
+        
+        fecha = self.fechas.get((ordinal, segundos))
+        if fecha is None:
+            fecha = datetime.fromordinal(ordinal) + timedelta(seconds=segundos)
+            self.fechas[(ordinal, segundos)] = fecha
+        
+        planteles = []
+        for largo in largos:
+            planteles.append(self._plantel(posicion, largo))
+            posicion += largo * 2
+        
+        eventos: List[Evento] = []
+        agregar = eventos.append
+        fin = posicion + num_eventos * _EVENTO.size
+        for tipo, tiempo, equipo, dato1, dato2 in _EVENTO.iter_unpack(datos[posicion:fin]):
+            if tipo == _GOL:
+                agregar(Gol(tiempo, cadenas[equipo], dato1,
+                            None if dato2 == _SIN_ASISTENTE else dato2))
+            elif tipo == _CAMBIO:
+                agregar(Cambio(tiempo, cadenas[equipo], dato1, dato2))
+            elif self.version == 1:
+                agregar(Tarjeta(tiempo, cadenas[equipo], dato1, cadenas[dato2]))
+            else:
+                agregar(Tarjeta(tiempo, cadenas[equipo], dato1, _COLOR_TARJETA[tipo]))
+        
+        partido = Partido(
+            fecha=fecha,
+            equipo_local=cadenas[local],
+            equipo_visitante=cadenas[visitante],
+            formacion_local=cadenas[formacion_local],
+            formacion_visitante=cadenas[formacion_visitante],
+            titulares_local=planteles[0],
+            titulares_visitante=planteles[1],
+            banco_local=planteles[2],
+            banco_visitante=planteles[3],
+            eventos=eventos
+        )
+        return partido, fin
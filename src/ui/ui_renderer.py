@@ -6,7 +6,9 @@ Sistema de colores, estilos y utilidades visuales
 import os
 import sys
 import time
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Optional, Sequence
+from src.instrumentacion import contar, medido
 
 # Códigos de colores ANSI para terminal
 class Colors:
@@ -151,10 +153,12 @@ class UIRenderer:
     
     def print_section(self, title: str, icon: str = "📋"):
         """Imprime una sección"""
-        print(f"\n{self.theme.secondary}{Colors.BOLD}")
-        print(f"{icon} {title}")
-        print("─" * len(f"{icon} {title}"))
-        print(f"{Colors.RESET}")
+        sys.stdout.write(self._section_text(title, icon))
+    
+    def _section_text(self, title: str, icon: str) -> str:
+        """Texto de una sección, igual al que imprimían sus cuatro `print`"""
+        heading = f"{icon} {title}"
+        return f"\n{self.theme.secondary}{Colors.BOLD}\n{heading}\n{'─' * len(heading)}\n{Colors.RESET}\n"
     
     def print_status(self, status: str, status_type: str = "info"):
         """Imprime un estado con color"""
@@ -177,57 +181,81 @@ class UIRenderer:
         
         print(f"{color}{icon} {status}{Colors.RESET}")
     
-    def print_table(self, headers: List[str], rows: List[List[str]], 
-                   title: str = "", align: str = "left"):
-        """Imprime una tabla profesional"""
-        if not rows:
-            return
-        
-        # Calcular anchos de columna
-        col_widths = []
-        for i, header in enumerate(headers):
-            max_width = len(header)
-            for row in rows:
-                if i < len(row):
-                    max_width = max(max_width, len(str(row[i])))
-            col_widths.append(min(max_width + 2, 20))  # Máximo 20 caracteres
-        
-        # Imprimir título si existe
-        if title:
-            self.print_section(title, "📊")
+    @medido('ui.print_table')
+    def print_table(self, headers: List[str], rows: Iterable[Sequence[str]], 
+                   title: str = "", align: str = "left",
+                   page: int = 1, page_size: Optional[int] = None,
+                   col_widths: Optional[List[int]] = None):
+        """Imprime una tabla profesional (con `page_size`, solo la página `page`) en una sola escritura"""
+        text = self.format_table(headers, rows, title, align, page, page_size, col_widths)
+        if text:
+            sys.stdout.write(text)
+    
+    def format_table(self, headers: List[str], rows: Iterable[Sequence[str]], 
+                     title: str = "", align: str = "left",
+                     page: int = 1, page_size: Optional[int] = None,
+                     col_widths: Optional[List[int]] = None) -> str:
+        """Texto completo de la tabla que dibuja `print_table`.
         
-        # Imprimir encabezado
-        print(f"{self.theme.primary}{Colors.BOLD}")
-        print("┌" + "┬".join("─" * width for width in col_widths) + "┐")
+        Con una lista, los anchos salen de una sola pasada por todas las filas,
+        así cada página tiene las mismas columnas. Con un iterador o generador
+        solo se consumen las filas hasta el final de la página pedida, y los
+        anchos son `col_widths` (fijos o de `column_widths` sobre una muestra)
+        o, si no se indican, los de las filas visibles. En ambos casos solo se
+        arma el texto de las filas de la página.
+        """
+        first = (max(page, 1) - 1) * page_size if page_size else 0
+        if isinstance(rows, (list, tuple)):
+            if not rows:
+                return ""
+            if col_widths is None:
+                col_widths = self.column_widths(headers, rows)
+            visible = rows[first:first + page_size] if page_size else rows
+        else:
+            visible = list(islice(rows, first, first + page_size) if page_size else rows)
+            if not visible:
+                return ""
+            if col_widths is None:
+                col_widths = self.column_widths(headers, visible)
+        contar('filas_dibujadas', len(visible))
         
-        header_row = "│"
-        for i, header in enumerate(headers):
-            header_row += f" {header:<{col_widths[i]-1}}│"
-        print(header_row)
+        primary = f"{self.theme.primary}{Colors.BOLD}\n"
+        reset = f"{Colors.RESET}\n"
+        parts = [self._section_text(title, "📊")] if title else []
         
-        print("├" + "┼".join("─" * width for width in col_widths) + "┤")
-        print(f"{Colors.RESET}")
+        # Encabezado
+        parts.append(primary)
+        parts.append("┌" + "┬".join("─" * width for width in col_widths) + "┐\n")
+        parts.append("│" + "".join(f" {header:<{width - 1}}│" for header, width in zip(headers, col_widths)) + "\n")
+        parts.append("├" + "┼".join("─" * width for width in col_widths) + "┤\n")
+        parts.append(reset)
         
-        # Imprimir filas
-        for row_idx, row in enumerate(rows):
-            color = self.theme.text_primary if row_idx % 2 == 0 else self.theme.text_secondary
-            print(f"{color}")
-            
-            row_str = "│"
-            for i, cell in enumerate(row):
-                if i < len(col_widths):
-                    cell_str = str(cell)[:col_widths[i]-1]  # Truncar si es muy largo
-                    if align == "right":
-                        row_str += f" {cell_str:>{col_widths[i]-1}}│"
-                    else:
-                        row_str += f" {cell_str:<{col_widths[i]-1}}│"
-            print(row_str)
-            print(f"{Colors.RESET}")
+        # Filas: cada una entre su línea de color y la de reset, alternando colores
+        colors = (f"{self.theme.text_primary}\n", f"{self.theme.text_secondary}\n")
+        fill = str.rjust if align == "right" else str.ljust
+        cell_widths = [width - 1 for width in col_widths]
+        for row_idx, row in enumerate(visible, first):
+            parts.append(colors[row_idx & 1])
+            parts.append("│" + "".join(f" {fill(str(cell)[:width], width)}│"
+                                        for cell, width in zip(row, cell_widths)) + "\n")
+            parts.append(reset)
         
-        # Imprimir pie
-        print(f"{self.theme.primary}{Colors.BOLD}")
-        print("└" + "┴".join("─" * width for width in col_widths) + "┘")
-        print(f"{Colors.RESET}")
+        # Pie
+        parts.append(primary)
+        parts.append("└" + "┴".join("─" * width for width in col_widths) + "┘\n")
+        parts.append(reset)
+        return "".join(parts)
+    
+    @staticmethod
+    def column_widths(headers: List[str], rows: Iterable[Sequence[str]], sample: Optional[int] = None) -> List[int]:
+        """Ancho de cada columna (máximo 20 caracteres) en una sola pasada por las filas o sus primeras `sample`"""
+        widths = [len(header) for header in headers]
+        for row in islice(rows, sample):
+            for i, cell in enumerate(row[:len(widths)]):
+                length = len(str(cell))
+                if length > widths[i]:
+                    widths[i] = length
+        return [min(width + 2, 20) for width in widths]
     
     def print_menu(self, title: str, options: List[Dict[str, str]], 
                   current_state: Dict[str, Any] = None):
@@ -0,0 +1,24 @@
+"""
+Configuración común de las pruebas
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.generador import GeneradorLiga
+
+
+@pytest.fixture
+def generador():
+    """Liga sintética chica y determinista"""
+    return GeneradorLiga(num_equipos=8, semilla=3)
+
+
+@pytest.fixture
+def fecha():
+    return datetime(2024, 3, 1)
@@ -0,0 +1,137 @@
+"""
+Implementaciones de referencia por fuerza bruta
+Recorren los partidos desde cero con el código más directo posible, para comparar
+contra los agregados incrementales
+"""
+
+from models import Cambio, Gol, PUNTOS_FAIR_PLAY, Tarjeta
+
+
+def marcador(partido):
+    goles_local = sum(1 for e in partido.eventos if isinstance(e, Gol) and e.equipo == partido.equipo_local)
+    goles_visitante = sum(1 for e in partido.eventos
+                          if isinstance(e, Gol) and e.equipo == partido.equipo_visitante)
+    return goles_local, goles_visitante
+
+
+def puntos(a_favor, en_contra):
+    return 3 if a_favor > en_contra else 1 if a_favor == en_contra else 0
+
+
+def tabla_posiciones(partidos, codigos):
+    """Tabla con todos los criterios de desempate aplicados explícitamente a cada equipo"""
+    filas = {codigo: {'equipo': codigo, 'partidos_jugados': 0, 'ganados': 0, 'empatados': 0,
+                      'perdidos': 0, 'goles_a_favor': 0, 'goles_en_contra': 0, 'diferencia_goles': 0,
+                      'puntos': 0, 'puntos_fair_play': 0}
+             for codigo in codigos}
+    for partido in partidos:
+        goles = marcador(partido)
+        for lado, codigo in enumerate((partido.equipo_local, partido.equipo_visitante)):
+            fila = filas[codigo]
+            a_favor, en_contra = goles[lado], goles[1 - lado]
+            fila['partidos_jugados'] += 1
+            fila['goles_a_favor'] += a_favor
+            fila['goles_en_contra'] += en_contra
+            fila['diferencia_goles'] += a_favor - en_contra
+            fila['puntos'] += puntos(a_favor, en_contra)
+            fila[{3: 'ganados', 1: 'empatados', 0: 'perdidos'}[puntos(a_favor, en_contra)]] += 1
+            fila['puntos_fair_play'] += sum(PUNTOS_FAIR_PLAY.get(e.color.upper(), 0) for e in partido.eventos
+                                            if isinstance(e, Tarjeta) and e.equipo == codigo)
+    
+    def criterio(codigo):
+        fila = filas[codigo]
+        return fila['puntos'], fila['diferencia_goles'], fila['goles_a_favor']
+    
+    def clave(codigo):
+        empatados = {otro for otro in codigos if criterio(otro) == criterio(codigo)}
+        directo = [0, 0, 0]
+        for partido in partidos:
+            local, visitante = partido.equipo_local, partido.equipo_visitante
+            if local != visitante and {local, visitante} <= empatados and codigo in (local, visitante):
+                goles = marcador(partido)
+                lado = 0 if codigo == local else 1
+                directo[0] += puntos(goles[lado], goles[1 - lado])
+                directo[1] += goles[lado] - goles[1 - lado]
+                directo[2] += goles[lado]
+        return (*(-valor for valor in criterio(codigo)), *(-valor for valor in directo),
+                filas[codigo]['puntos_fair_play'], codigos.index(codigo))
+    
+    return [filas[codigo] for codigo in sorted(codigos, key=clave)]
+
+
+def tabla_goleadores(partidos, equipos):
+    """Goleadores registrados; a igual cantidad va primero quien llegó antes a esa cantidad"""
+    goles = {}
+    ultimo_gol = {}
+    orden = 0
+    for partido in partidos:
+        for evento in partido.eventos:
+            if isinstance(evento, Gol):
+                clave = (evento.equipo, evento.autor)
+                goles[clave] = goles.get(clave, 0) + 1
+                ultimo_gol[clave] = orden
+                orden += 1
+    tabla = []
+    for equipo, numero in sorted(goles, key=lambda clave: (-goles[clave], ultimo_gol[clave])):
+        jugador = equipos[equipo].obtener_jugador(numero) if equipo in equipos else None
+        if jugador:
+            tabla.append({'jugador': jugador.nombre, 'equipo': equipo, 'goles': goles[(equipo, numero)]})
+    return tabla
+
+
+def estadisticas_jugadores(partidos, duracion=90):
+    """Estadísticas por (equipo, número) calculando cada jugador por separado en cada partido"""
+    estadisticas = {}
+    
+    def stats(equipo, numero):
+        return estadisticas.setdefault((equipo, numero), {
+            'partidos': 0, 'titular': 0, 'minutos': 0, 'goles': 0, 'asistencias': 0,
+            'amarillas': 0, 'rojas': 0, 'expulsiones': 0})
+    
+    for partido in partidos:
+        eventos = sorted(partido.eventos, key=lambda e: e.tiempo)
+        fin = max([duracion] + [e.tiempo for e in eventos])
+        
+        # Posición (en el orden por minuto) de cada expulsión: roja o segunda amarilla del partido
+        expulsiones = {}
+        for posicion, evento in enumerate(eventos):
+            if isinstance(evento, Gol):
+                stats(evento.equipo, evento.autor)['goles'] += 1
+                if evento.asistente is not None:
+                    stats(evento.equipo, evento.asistente)['asistencias'] += 1
+            elif isinstance(evento, Tarjeta):
+                clave = (evento.equipo, evento.jugador)
+                amarilla = evento.color.upper() == 'AMARILLA'
+                stats(*clave)['amarillas' if amarilla else 'rojas'] += 1
+                previas = sum(1 for e in eventos[:posicion] if isinstance(e, Tarjeta)
+                              and (e.equipo, e.jugador) == clave and e.color.upper() == 'AMARILLA')
+                if not amarilla or previas == 1:
+                    stats(*clave)['expulsiones'] += 1
+                    expulsiones.setdefault(clave, []).append(posicion)
+        
+        jugadores = []
+        for equipo, titulares in ((partido.equipo_local, partido.titulares_local),
+                                  (partido.equipo_visitante, partido.titulares_visitante)):
+            jugadores += [(equipo, numero) for numero in titulares]
+            jugadores += [(e.equipo, e.jugador_entra) for e in eventos
+                          if isinstance(e, Cambio) and e.equipo == equipo]
+        for equipo, numero in dict.fromkeys(jugadores):
+            titular = numero in (partido.titulares_local if equipo == partido.equipo_local
+                                 else partido.titulares_visitante)
+            if titular:
+                posicion_entrada, minuto_entrada = -1, 0
+            else:
+                posicion_entrada = next(i for i, e in enumerate(eventos) if isinstance(e, Cambio)
+                                        and e.equipo == equipo and e.jugador_entra == numero)
+                minuto_entrada = eventos[posicion_entrada].tiempo
+            salidas = [i for i, e in enumerate(eventos) if isinstance(e, Cambio)
+                       and e.equipo == equipo and e.jugador_sale == numero]
+            salidas += expulsiones.get((equipo, numero), [])
+            salidas = [i for i in salidas if i > posicion_entrada]
+            minuto_salida = eventos[min(salidas)].tiempo if salidas else fin
+            
+            fila = stats(equipo, numero)
+            fila['partidos'] += 1
+            fila['titular'] += minuto_entrada == 0
+            fila['minutos'] += max(minuto_salida - minuto_entrada, 0)
+    return estadisticas
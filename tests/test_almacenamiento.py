@@ -0,0 +1,113 @@
+"""
+Pruebas del backend SQLite contra los agregados en memoria
+"""
+
+import pytest
+
+from models import Almacenamiento, Partido, SistemaFutbol
+from src.almacenamiento import AlmacenamientoSQLite
+
+
+@pytest.fixture
+def liga(generador):
+    """Sistema con un backend SQLite en memoria que confirma en lotes chicos"""
+    almacenamiento = AlmacenamientoSQLite(tamano_lote=7)
+    sistema = generador.crear_sistema(150, SistemaFutbol(almacenamiento))
+    yield sistema, almacenamiento
+    almacenamiento.cerrar()
+
+
+def contar_filas(almacenamiento, tabla):
+    return almacenamiento.conexion.execute(f"SELECT COUNT(*) FROM {tabla}").fetchone()[0]
+
+
+def test_la_interfaz_es_abstracta():
+    with pytest.raises(TypeError):
+        Almacenamiento()
+
+
+def test_tabla_posiciones_coincide_con_memoria(liga):
+    sistema, almacenamiento = liga
+    assert almacenamiento.tabla_posiciones() == sistema.obtener_tabla_posiciones()
+    fechas = sorted({partido.fecha for partido in sistema.partidos})
+    for hasta in fechas[::11]:
+        assert almacenamiento.tabla_posiciones(hasta) == sistema.obtener_tabla_posiciones(hasta)
+
+
+def test_tabla_goleadores_desempata_como_en_memoria(liga):
+    sistema, almacenamiento = liga
+    esperada = sistema.obtener_tabla_goleadores()
+    # La liga tiene empates en cantidad de goles, que es lo que se prueba
+    assert len({fila['goles'] for fila in esperada}) < len(esperada)
+    assert almacenamiento.tabla_goleadores() == esperada
+    assert almacenamiento.tabla_goleadores(limite=10) == esperada[:10]
+
+
+def test_partidos_repetidos_se_guardan_como_en_memoria(liga):
+    sistema, almacenamiento = liga
+    # Misma fecha, local y visitante: SistemaFutbol los cuenta y la base también
+    for partido in sistema.partidos[:3]:
+        sistema.agregar_partido(partido)
+    almacenamiento.confirmar()
+    assert contar_filas(almacenamiento, 'partidos') == len(sistema.partidos)
+    assert contar_filas(almacenamiento, 'eventos') == sum(len(p.eventos) for p in sistema.partidos)
+    assert almacenamiento.tabla_posiciones() == sistema.obtener_tabla_posiciones()
+    assert almacenamiento.tabla_goleadores() == sistema.obtener_tabla_goleadores()
+
+
+def test_equipos_que_solo_aparecen_en_partidos(liga, fecha):
+    sistema, almacenamiento = liga
+    local = sistema.partidos[0]
+    for codigo in ('ZZZ', 'YYY'):
+        partido = Partido(fecha.replace(year=2030), local.equipo_local, codigo, '4-4-2', '4-4-2',
+                          local.titulares_local, list(range(1, 12)), [], [])
+        partido.agregar_gol(codigo, 10, 9)
+        sistema.agregar_partido(partido)
+    
+    assert {'ZZZ', 'YYY'} <= {fila['equipo'] for fila in almacenamiento.tabla_posiciones()}
+    assert almacenamiento.tabla_posiciones() == sistema.obtener_tabla_posiciones()
+    # Antes de sus partidos figuran con cero partidos, igual que en memoria
+    hasta = sistema.partidos[60].fecha
+    assert almacenamiento.tabla_posiciones(hasta) == sistema.obtener_tabla_posiciones(hasta)
+
+
+def test_dos_conexiones_escribiendo_en_la_misma_base(tmp_path, generador):
+    ruta = str(tmp_path / 'liga.db')
+    primera, segunda = AlmacenamientoSQLite(ruta, tamano_lote=4), AlmacenamientoSQLite(ruta, tamano_lote=3)
+    partidos = list(generador.partidos(20))
+    for i, partido in enumerate(partidos):
+        (primera if i % 2 else segunda).guardar_partido(partido)
+    primera.cerrar()
+    segunda.cerrar()
+    
+    almacenamiento = AlmacenamientoSQLite(ruta)
+    cargados = almacenamiento.cargar_sistema().partidos
+    # El orden entre conexiones depende de cuándo confirmó cada una; el contenido no
+    assert sorted(map(str, cargados)) == sorted(map(str, partidos))
+    assert sorted(str(p.eventos) for p in cargados) == sorted(str(p.eventos) for p in partidos)
+    almacenamiento.cerrar()
+
+
+def test_cargar_sistema_reconstruye_el_historial(liga, tmp_path):
+    sistema, almacenamiento = liga
+    cargado = almacenamiento.cargar_sistema()
+    assert cargado.partidos == sistema.partidos
+    assert [e.jugadores for e in cargado.equipos.values()] == [e.jugadores for e in sistema.equipos.values()]
+    assert cargado.obtener_tabla_posiciones() == sistema.obtener_tabla_posiciones()
+    assert cargado.obtener_tabla_goleadores() == sistema.obtener_tabla_goleadores()
+    hasta = sistema.partidos[40].fecha
+    assert cargado.obtener_tabla_posiciones(hasta) == almacenamiento.tabla_posiciones(hasta)
+
+
+def test_cargar_en_un_sistema_con_el_mismo_backend_no_reescribe(tmp_path, generador):
+    ruta = str(tmp_path / 'liga.db')
+    almacenamiento = AlmacenamientoSQLite(ruta)
+    generador.crear_sistema(30, SistemaFutbol(almacenamiento))
+    almacenamiento.cerrar()
+    
+    almacenamiento = AlmacenamientoSQLite(ruta)
+    sistema = almacenamiento.cargar_sistema(SistemaFutbol(almacenamiento))
+    assert len(sistema.partidos) == 30
+    assert sistema.almacenamiento is almacenamiento
+    assert contar_filas(almacenamiento, 'partidos') == 30
+    almacenamiento.cerrar()
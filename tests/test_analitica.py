@@ -0,0 +1,42 @@
+"""
+Pruebas de la analítica con NumPy contra el recorrido de los partidos
+"""
+
+import pytest
+
+from models import Equipo, Jugador, Partido
+
+pytest.importorskip('numpy')
+from src.analitica import Analitica
+
+
+def resultados(analitica):
+    return (analitica.tabla_posiciones(), analitica.tabla_goleadores(), analitica.goles_por_minuto(),
+            analitica.tarjetas_por_equipo(), analitica.local_visitante())
+
+
+def test_numpy_coincide_con_el_recorrido(generador):
+    sistema = generador.crear_sistema(200)
+    assert resultados(Analitica(sistema, usar_numpy=True)) == resultados(Analitica(sistema, usar_numpy=False))
+    assert Analitica(sistema, usar_numpy=True).tabla_posiciones() == sistema.obtener_tabla_posiciones()
+
+
+def test_equipo_agregado_despues_de_consultar(generador, fecha):
+    sistema = generador.crear_sistema(60)
+    analitica = Analitica(sistema, usar_numpy=True)
+    resultados(analitica)
+    
+    # Un equipo nuevo sin partidos no cambia la cantidad de partidos
+    sistema.agregar_equipo(Equipo('Nuevo', 'NUE', [Jugador(9, 'Nueve')]))
+    posiciones = analitica.tabla_posiciones()
+    assert 'NUE' in [fila['equipo'] for fila in posiciones]
+    assert posiciones == sistema.obtener_tabla_posiciones()
+    assert analitica.tarjetas_por_equipo()['NUE'] == {'amarillas': 0, 'rojas': 0}
+    assert 'NUE' in analitica.local_visitante()
+    
+    rival = sistema.codigos_en_orden()[0]
+    partido = Partido(fecha, 'NUE', rival, '4-4-2', '4-4-2', [9], [1], [], [])
+    partido.agregar_gol('NUE', 30, 9)
+    sistema.agregar_partido(partido)
+    assert resultados(analitica) == resultados(Analitica(sistema, usar_numpy=False))
+    assert {'jugador': 'Nueve', 'equipo': 'NUE', 'numero': 9, 'goles': 1} in analitica.tabla_goleadores()
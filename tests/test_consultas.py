@@ -0,0 +1,27 @@
+"""
+Pruebas de las consultas paginadas de partidos
+"""
+
+import pytest
+
+
+def test_paginas_coinciden_con_el_filtro_lineal(generador):
+    sistema = generador.crear_sistema(90)
+    equipo = sistema.partidos[0].equipo_local
+    desde, hasta = sistema.partidos[10].fecha, sistema.partidos[70].fecha
+    esperados = sorted((p for p in sistema.partidos
+                        if equipo in (p.equipo_local, p.equipo_visitante) and desde <= p.fecha <= hasta),
+                       key=lambda p: p.fecha)
+    
+    primera = sistema.consultar_partidos(equipo, desde=desde, hasta=hasta, por_pagina=4)
+    paginas = [sistema.consultar_partidos(equipo, desde=desde, hasta=hasta, pagina=n, por_pagina=4)
+               for n in range(1, primera.total_paginas + 1)]
+    assert primera.total == len(esperados)
+    assert [p for pagina in paginas for p in pagina.partidos] == esperados
+
+
+@pytest.mark.parametrize('opciones', [{'pagina': 0}, {'pagina': -2}, {'por_pagina': 0}, {'por_pagina': -5}])
+def test_pagina_o_tamano_invalidos(generador, opciones):
+    sistema = generador.crear_sistema(10)
+    with pytest.raises(ValueError):
+        sistema.consultar_partidos(**opciones)
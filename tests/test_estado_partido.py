@@ -0,0 +1,24 @@
+"""
+Pruebas de la validación de eventos del estado en vivo
+"""
+
+import pytest
+
+from models import EstadoPartido, EventoImposible, Gol
+
+
+def crear_estado():
+    return EstadoPartido('AAA', 'BBB', list(range(1, 12)), list(range(1, 12)), [12, 13], [12, 13])
+
+
+@pytest.mark.parametrize('asistente, mensaje', [
+    (9, "El asistente 9 de AAA no puede ser el autor del gol"),
+    (12, "El asistente 12 de AAA no está en cancha"),
+])
+def test_asistente_invalido(asistente, mensaje):
+    estado = crear_estado()
+    with pytest.raises(EventoImposible, match=f"^{mensaje}$"):
+        estado.aplicar(Gol(10, 'AAA', 9, asistente))
+    # El evento rechazado no modifica el estado
+    estado.aplicar(Gol(10, 'AAA', 9, 10))
+    assert estado.marcador() == {'local': 1, 'visitante': 0}
@@ -0,0 +1,39 @@
+"""
+Pruebas del generador de ligas sintéticas
+"""
+
+from models import EstadoPartido
+from src.dsl_externo import importar_en_lote
+from src.generador import GeneradorLiga, partido_a_dsl
+
+
+def test_misma_semilla_mismos_partidos():
+    textos = [[partido_a_dsl(p) for p in GeneradorLiga(6, semilla=5).partidos(40)] for _ in range(2)]
+    assert textos[0] == textos[1]
+    assert textos[0] != [partido_a_dsl(p) for p in GeneradorLiga(6, semilla=6).partidos(40)]
+    # Los primeros partidos no dependen de cuántos se pidan
+    assert textos[0][:10] == [partido_a_dsl(p) for p in GeneradorLiga(6, semilla=5).partidos(10)]
+
+
+def test_temporadas_sucesivas_con_fechas_crecientes():
+    generador = GeneradorLiga(4, semilla=1)
+    partidos = list(generador.partidos(generador.partidos_por_temporada * 2 + 3))
+    fechas = [p.fecha for p in partidos]
+    assert fechas == sorted(fechas)
+    assert len({(p.fecha, p.equipo_local, p.equipo_visitante) for p in partidos}) == len(partidos)
+
+
+def test_eventos_validos_para_el_estado_del_partido(generador):
+    # EstadoPartido lanza EventoImposible ante un evento inconsistente
+    for partido in generador.partidos(60):
+        estado = EstadoPartido.desde_partido(partido)
+        resultado = partido.obtener_resultado()
+        assert estado.marcador() == {'local': resultado['local'], 'visitante': resultado['visitante']}
+
+
+def test_archivos_dsl_se_importan_igual(generador, tmp_path):
+    generador.escribir_dsl(str(tmp_path), 70, partidos_por_archivo=25)
+    sistema = generador.crear_sistema(0)
+    resumen = importar_en_lote([str(tmp_path)], sistema)
+    assert (resumen.archivos, resumen.partidos, resumen.errores) == (3, 70, 0)
+    assert sistema.partidos == generador.crear_sistema(70).partidos
@@ -0,0 +1,88 @@
+"""
+Pruebas de la importación en lote: recuperación ante errores y modo en paralelo
+"""
+
+import pytest
+
+from models import SistemaFutbol
+from src.dsl_externo import importar_en_lote
+from src.dsl_externo.importador import _compactar_partido, _expandir_partido, dividir_archivo
+from src.generador import partido_a_dsl
+
+
+def crear_sistema(generador):
+    sistema = SistemaFutbol()
+    for equipo in generador.equipos():
+        sistema.agregar_equipo(equipo)
+    return sistema
+
+
+def importar(fuentes, generador, **opciones):
+    """Importa y devuelve todo lo observable: resumen, resultado por archivo y agregados"""
+    sistema = crear_sistema(generador)
+    archivos = []
+    resumen = importar_en_lote(fuentes, sistema, al_terminar_archivo=lambda r: archivos.append(
+        (r.archivo, r.partidos, r.lineas, r.errores, [str(d) for d in r.diagnosticos])), **opciones)
+    return {
+        'resumen': (resumen.archivos, resumen.archivos_con_errores, resumen.partidos, resumen.lineas,
+                    resumen.errores, [str(d) for d in resumen.diagnosticos]),
+        'archivos': archivos,
+        'partidos': [(str(p), [str(e) for e in p.eventos]) for p in sistema.partidos],
+        'posiciones': sistema.obtener_tabla_posiciones(),
+        'goleadores': sistema.obtener_tabla_goleadores(),
+    }
+
+
+@pytest.fixture
+def directorio(tmp_path, generador):
+    """Archivos válidos, con errores, con preámbulo, con CRLF y vacío"""
+    textos = [partido_a_dsl(p) for p in generador.partidos(60)]
+    (tmp_path / 'a.txt').write_text(''.join(textos[:20]), encoding='utf-8')
+    
+    lineas = ''.join(textos[20:40]).split('\n')
+    lineas[30] = 'TARJETA: AAA, 10, 5, VERDE'
+    lineas[55] = 'BASURA'
+    (tmp_path / 'b.txt').write_text('# preámbulo\nGOL: AAA, 3, 9\n' + '\n'.join(lineas), encoding='utf-8')
+    
+    with open(tmp_path / 'c.txt', 'w', encoding='utf-8', newline='') as archivo:
+        archivo.write(''.join(textos[40:]).replace('\n', '\r\n'))
+    (tmp_path / 'd.txt').write_text('', encoding='utf-8')
+    return tmp_path
+
+
+def test_errores_descartan_solo_su_partido(directorio, generador):
+    resultado = importar([str(directorio)], generador)
+    archivo, partidos, _, errores, diagnosticos = resultado['archivos'][1]
+    assert archivo.endswith('b.txt')
+    # El GOL del preámbulo invalida el primer partido; VERDE y BASURA, los suyos
+    assert (partidos, errores) == (17, 3)
+    assert diagnosticos[0].endswith(':2:6: Debe configurar el partido antes de agregar eventos')
+    assert 'El color debe ser AMARILLA o ROJA' in diagnosticos[1]
+    assert diagnosticos[2].endswith('Formato de comando inválido: BASURA')
+    assert resultado['resumen'][:5] == (4, 1, 57, resultado['resumen'][3], 3)
+
+
+@pytest.mark.parametrize('bytes_por_tarea', [200, 4096, 1 << 20])
+def test_paralelo_igual_a_secuencial(directorio, generador, bytes_por_tarea):
+    secuencial = importar([str(directorio)], generador)
+    paralelo = importar([str(directorio)], generador, procesos=2, bytes_por_tarea=bytes_por_tarea)
+    assert paralelo == secuencial
+
+
+def test_tramos_comienzan_en_fecha_y_cubren_el_archivo(directorio):
+    ruta = directorio / 'b.txt'
+    datos = ruta.read_bytes()
+    tramos = dividir_archivo(str(ruta), 300)
+    assert tramos[0][0] == 0 and tramos[-1][1] == len(datos)
+    assert all(fin == inicio for (_, fin), (inicio, _) in zip(tramos, tramos[1:]))
+    # El primer tramo conserva el preámbulo junto con el primer FECHA:
+    assert b'FECHA:' in datos[tramos[0][0]:tramos[0][1]]
+    for inicio, _ in tramos[1:]:
+        assert datos[inicio:inicio + 6] == b'FECHA:'
+
+
+def test_partido_compacto_ida_y_vuelta(generador):
+    for partido in generador.partidos(30):
+        copia = _expandir_partido(_compactar_partido(partido))
+        assert copia == partido
+        assert copia.obtener_resultado() == partido.obtener_resultado()
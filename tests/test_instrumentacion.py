@@ -0,0 +1,59 @@
+"""
+Pruebas de activación de la instrumentación
+"""
+
+import io
+import os
+import subprocess
+import sys
+
+from src import instrumentacion
+
+RAIZ = os.path.join(os.path.dirname(__file__), '..')
+
+
+def ejecutar(codigo, perfil):
+    entorno = dict(os.environ, FUTBOL_PERFIL=perfil)
+    return subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ, env=entorno,
+                          capture_output=True, text=True, check=True)
+
+
+def test_importar_no_activa_aunque_este_la_variable():
+    salida = ejecutar("import models\n"
+                      "from src import instrumentacion\n"
+                      "print(instrumentacion.esta_activa())", 'resumen')
+    assert salida.stdout.strip() == 'False'
+    assert salida.stderr == ''
+
+
+def test_configurar_usa_la_variable_solo_sin_opcion():
+    salida = ejecutar("from src import instrumentacion\n"
+                      "instrumentacion.configurar('')\n"
+                      "print(instrumentacion.esta_activa())\n"
+                      "instrumentacion.configurar()\n"
+                      "print(instrumentacion.esta_activa())", 'resumen')
+    assert salida.stdout.split() == ['False', 'True']
+    assert 'Instrumentación' in salida.stderr
+
+
+def test_tramos_anidados_no_se_cuentan_dos_veces(generador):
+    sistema = generador.crear_sistema(120)
+    instrumentacion.activar(resumen_al_salir=False)
+    try:
+        instrumentacion.reiniciar()
+        # La tabla histórica se reconstruye registrando partidos dentro de la consulta
+        sistema.obtener_tabla_posiciones(sistema.partidos[100].fecha)
+        datos = instrumentacion.resumen()
+        salida = io.StringIO()
+        instrumentacion.imprimir_resumen(salida)
+    finally:
+        instrumentacion.desactivar()
+        instrumentacion.reiniciar()
+    
+    consulta = datos['tramos']['sistema.obtener_tabla_posiciones']
+    agregados = datos['tramos']['agregados.tabla_posiciones']
+    assert consulta['anidado'] == 0
+    assert agregados['llamadas'] > 0 and agregados['anidado'] == agregados['total']
+    assert agregados['total'] <= consulta['total']
+    assert sum(t['total'] - t['anidado'] for t in datos['tramos'].values()) <= datos['segundos']
+    assert '↳ agregados.tabla_posiciones' in salida.getvalue()
@@ -0,0 +1,74 @@
+"""
+Pruebas de la tabla de goleadores y de las estadísticas de jugadores contra la referencia
+"""
+
+from models import Gol, Partido, SistemaFutbol
+import referencia
+
+
+def sin_tasas(stats):
+    return {campo: valor for campo, valor in stats.items() if not campo.endswith('_por_90')}
+
+
+def test_tabla_goleadores(generador):
+    sistema = generador.crear_sistema(150)
+    esperada = referencia.tabla_goleadores(sistema.partidos, sistema.equipos)
+    assert len({fila['goles'] for fila in esperada}) < len(esperada)
+    assert sistema.obtener_tabla_goleadores() == esperada
+    assert sistema.obtener_tabla_goleadores(7) == esperada[:7]
+    assert list(sistema.iterar_tabla_goleadores()) == esperada
+
+
+def test_goleadores_de_equipo(generador):
+    sistema = generador.crear_sistema(150)
+    for codigo, equipo in sistema.equipos.items():
+        # Por equipo, a igual cantidad de goles va primero quien marcó antes su primer gol
+        goles = {}
+        for partido in sistema.partidos:
+            for evento in partido.eventos:
+                if isinstance(evento, Gol) and evento.equipo == codigo:
+                    goles[evento.autor] = goles.get(evento.autor, 0) + 1
+        esperada = [(equipo.obtener_jugador(numero).nombre, cantidad)
+                    for numero, cantidad in sorted(goles.items(), key=lambda item: -item[1])
+                    if equipo.obtener_jugador(numero)]
+        assert [(f['jugador'], f['goles']) for f in sistema.obtener_goleadores_equipo(codigo)] == esperada
+
+
+def test_estadisticas_jugadores(generador):
+    sistema = generador.crear_sistema(150)
+    esperadas = referencia.estadisticas_jugadores(sistema.partidos)
+    obtenidas = {(codigo, numero): sin_tasas(stats)
+                 for codigo, numero, stats in sistema._estadisticas_jugadores.iterar()}
+    assert obtenidas == esperadas
+    # El generador incluye cambios y expulsiones, que son los casos que mueven los minutos
+    assert any(stats['expulsiones'] for stats in esperadas.values())
+    assert any(stats['partidos'] > stats['titular'] for stats in esperadas.values())
+
+
+def test_estadisticas_con_cambios_y_expulsiones(fecha):
+    partido = Partido(fecha, 'AAA', 'BBB', '4-4-2', '4-4-2', [1, 2, 3], [1, 2], [12], [12])
+    partido.agregar_cambio('AAA', 60, 3, 12)
+    partido.agregar_tarjeta('AAA', 70, 12, 'AMARILLA')
+    partido.agregar_tarjeta('AAA', 80, 12, 'AMARILLA')
+    partido.agregar_tarjeta('BBB', 30, 2, 'ROJA')
+    # Sale un jugador que ya no estaba en cancha: no cambia nada
+    partido.agregar_cambio('BBB', 40, 2, 12)
+    partido.agregar_gol('AAA', 95, 1, 2)
+    sistema = SistemaFutbol()
+    sistema.agregar_partido(partido)
+    
+    esperadas = referencia.estadisticas_jugadores([partido])
+    for (codigo, numero), stats in esperadas.items():
+        assert sin_tasas(sistema.obtener_estadisticas_jugador(codigo, numero)) == stats
+    assert esperadas[('AAA', 12)]['minutos'] == 20
+    assert esperadas[('BBB', 2)]['minutos'] == 30
+    assert esperadas[('AAA', 1)]['minutos'] == 95
+
+
+def test_estadisticas_ordenadas_y_filtradas(generador):
+    sistema = generador.crear_sistema(80)
+    filas = sistema.obtener_estadisticas_jugadores(ordenar_por='goles', minimo_minutos=200)
+    assert [f['goles'] for f in filas] == sorted((f['goles'] for f in filas), reverse=True)
+    assert all(f['minutos'] >= 200 for f in filas)
+    codigo = next(iter(sistema.equipos))
+    assert {f['equipo'] for f in sistema.obtener_estadisticas_jugadores(equipo=codigo)} == {codigo}
@@ -0,0 +1,101 @@
+"""
+Prueba diferencial del lexer rápido contra el lexer PLY
+Ambos deben producir la misma secuencia de tokens (tipo, valor, línea y posición)
+"""
+
+import glob
+import os
+import random
+
+import pytest
+
+from models import SistemaFutbol
+from src.dsl_externo import LexerRapido, ParserFutbol
+from src.generador import GeneradorLiga, partido_a_dsl
+
+# Fragmentos para armar líneas aleatorias, válidas o no
+FRAGMENTOS = ['FECHA:', 'EQUIPO LOCAL:', 'equipo visitante :', 'GOL:', 'TARJETA:', 'CAMBIO:',
+              'ARBITRO:', 'BAR', 'rma', 'aab', 'AMARILLA', 'roja', '12', '3-4-3', '15/10/2023',
+              ',', ' ', '\t', '\r', '\n', '#', ':', '-', '/', '$', 'é', 'Ñ', 'José Müller', 'Ñandú:',
+              'año', '0', '9']
+
+CASOS_BORDE = [
+    '',
+    'FECHA: 01/03/2024',
+    'GOL: AAA, 10, 9\nGOL: AAB, 20, 7',
+    'gol: aaa, 10, 9\ntarjeta: aab, 30, 4, amarilla\n',
+    'equipo local: bar\nEquipo Visitante: Rma\r\n',
+    'ÁRBITRO: Pérez\nGOL: AAA, 10, 9',
+    'TARJETA: AAA, 10, 5, VERDE',
+    'Jugador: José Müller\n# comentario con ñ\nNúñez',
+    'TITULARES LOCAL: 1, 2,3 ,4\t,5',
+    '\n\n\r\n   \t',
+]
+
+
+def tokens(lexer, texto: str) -> list:
+    """Tokens de un texto como tuplas comparables"""
+    lexer.lineno = 1
+    lexer.input(texto)
+    return [(t.type, t.value, t.lineno, t.lexpos) for t in iter(lexer.token, None)]
+
+
+@pytest.fixture(scope='module')
+def lexer_ply():
+    return ParserFutbol(SistemaFutbol()).lexer
+
+
+@pytest.fixture(scope='module')
+def texto_liga():
+    return ''.join(partido_a_dsl(p) for p in GeneradorLiga(num_equipos=6, semilla=11).partidos(40))
+
+
+def textos_aleatorios(texto_liga: str, semilla: int, cantidad: int = 300) -> list:
+    rng = random.Random(semilla)
+    textos = [''.join(rng.choice(FRAGMENTOS) for _ in range(rng.randint(0, 30))) for _ in range(cantidad)]
+    # Líneas válidas con pequeñas alteraciones, para ejercitar el camino de líneas regulares
+    lineas = texto_liga.splitlines(True)
+    for _ in range(cantidad):
+        texto = ''.join(rng.choice(lineas) for _ in range(rng.randint(1, 5)))
+        for _ in range(rng.randint(0, 3)):
+            posicion = rng.randint(0, len(texto))
+            texto = texto[:posicion] + rng.choice(FRAGMENTOS) + texto[posicion + rng.randint(0, 1):]
+        if rng.random() < 0.3:
+            texto = texto.lower()
+        if rng.random() < 0.3:
+            texto = texto.rstrip('\n')
+        textos.append(texto)
+    return textos
+
+
+@pytest.mark.parametrize('texto', CASOS_BORDE)
+def test_casos_borde(lexer_ply, texto):
+    assert tokens(LexerRapido(), texto) == tokens(lexer_ply, texto)
+
+
+def test_liga_y_ejemplos(lexer_ply, texto_liga):
+    raiz = os.path.join(os.path.dirname(__file__), '..')
+    textos = [texto_liga, texto_liga.rstrip('\n'), texto_liga.lower()]
+    for ruta in sorted(glob.glob(os.path.join(raiz, 'ejemplos', '*.txt'))):
+        with open(ruta, encoding='utf-8') as archivo:
+            textos.append(archivo.read())
+    for texto in textos:
+        assert tokens(LexerRapido(), texto) == tokens(lexer_ply, texto)
+
+
+@pytest.mark.parametrize('semilla', [0, 1, 2, 3])
+def test_textos_aleatorios(lexer_ply, texto_liga, semilla):
+    for texto in textos_aleatorios(texto_liga, semilla):
+        assert tokens(LexerRapido(), texto) == tokens(lexer_ply, texto), repr(texto)
+
+
+def test_el_analisis_no_depende_del_lexer(generador, texto_liga):
+    texto = texto_liga.replace('GOL: ', 'gol: ', 3).rstrip('\n') + '\nTARJETA: AAA, 10, 5, VERDE'
+    resultados = []
+    for lexer_rapido in (False, True):
+        parser = ParserFutbol(generador.crear_sistema(0), lexer_rapido=lexer_rapido)
+        partidos = parser.analizar_texto(texto)
+        resultados.append(([str(p) for p in partidos], [str(e) for p in partidos for e in p.eventos],
+                           [str(d) for d in parser.diagnosticos]))
+    assert resultados[0] == resultados[1]
+    assert resultados[0][2]
@@ -0,0 +1,96 @@
+"""
+Pruebas de los cachés de Equipo y Partido
+"""
+
+import copy
+import pickle
+
+from models import Cambio, Equipo, Gol, Jugador, ListaVersionada, Partido, Tarjeta
+
+
+def crear_partido(fecha, eventos):
+    return Partido(fecha, 'AAA', 'BBB', '4-4-2', '4-3-3', list(range(1, 12)), list(range(1, 12)),
+                   [12, 13], [12, 13], eventos)
+
+
+def marcador(partido):
+    resultado = partido.obtener_resultado()
+    return resultado['local'], resultado['visitante'], resultado['ganador']
+
+
+def test_lista_versionada_cuenta_cada_modificacion():
+    lista = ListaVersionada([3, 1, 2])
+    operaciones = [lambda: lista.append(4), lambda: lista.extend([5]), lambda: lista.insert(0, 0),
+                   lambda: lista.remove(0), lambda: lista.pop(), lambda: lista.sort(reverse=True),
+                   lambda: lista.reverse(), lambda: lista.__setitem__(0, 9), lambda: lista.__delitem__(0),
+                   lambda: lista.__iadd__([7]), lambda: lista.__imul__(2), lambda: lista.clear()]
+    for esperada, operacion in enumerate(operaciones, 1):
+        operacion()
+        assert lista.version == esperada
+
+
+def test_equipo_indice_sigue_reemplazos_con_el_mismo_largo():
+    equipo = Equipo('Equipo', 'AAA', [Jugador(1, 'Uno'), Jugador(2, 'Dos')])
+    equipo.jugadores[0] = Jugador(10, 'Diez')
+    assert equipo.obtener_jugador(1) is None
+    assert equipo.obtener_jugador(10).nombre == 'Diez'
+    
+    equipo.jugadores.remove(equipo.obtener_jugador(2))
+    equipo.jugadores.append(Jugador(20, 'Veinte'))
+    assert equipo.obtener_jugador(2) is None
+    assert equipo.obtener_jugador(20).nombre == 'Veinte'
+
+
+def test_equipo_indice_sigue_lista_reasignada():
+    equipo = Equipo('Equipo', 'AAA', [Jugador(1, 'Uno')])
+    equipo.jugadores = [Jugador(5, 'Cinco')]
+    assert equipo.obtener_jugador(1) is None
+    equipo.agregar_jugador(1, 'Otro')
+    assert [j.numero for j in equipo.jugadores] == [5, 1]
+    assert isinstance(equipo.jugadores, ListaVersionada)
+
+
+def test_equipo_rechaza_numero_repetido_tras_modificacion_directa():
+    equipo = Equipo('Equipo', 'AAA')
+    equipo.jugadores.append(Jugador(7, 'Siete'))
+    try:
+        equipo.agregar_jugador(7, 'Otro')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Se aceptó un número repetido")
+
+
+def test_partido_marcador_sigue_reemplazos_con_el_mismo_largo(fecha):
+    partido = crear_partido(fecha, [Gol(10, 'AAA', 9)])
+    assert marcador(partido) == (1, 0, 'AAA')
+    
+    partido.eventos[0] = Gol(10, 'BBB', 9)
+    assert marcador(partido) == (0, 1, 'BBB')
+    
+    partido.eventos.pop()
+    partido.eventos.append(Tarjeta(20, 'AAA', 4, 'AMARILLA'))
+    assert marcador(partido) == (0, 0, None)
+    assert partido.obtener_goles_equipo('BBB') == 0
+
+
+def test_partido_marcador_tras_agregar_y_reasignar(fecha):
+    partido = crear_partido(fecha, [])
+    partido.agregar_gol('AAA', 5, 9)
+    partido.agregar_cambio('AAA', 60, 9, 12)
+    assert marcador(partido) == (1, 0, 'AAA')
+    
+    partido.eventos = [Gol(1, 'BBB', 9), Gol(2, 'BBB', 10), Cambio(3, 'BBB', 9, 12)]
+    assert marcador(partido) == (0, 2, 'BBB')
+    partido.agregar_gol('AAA', 80, 7)
+    assert marcador(partido) == (1, 2, 'BBB')
+
+
+def test_partido_copias_conservan_el_marcador(fecha):
+    partido = crear_partido(fecha, [Gol(10, 'AAA', 9), Gol(30, 'AAA', 9)])
+    for copia in (pickle.loads(pickle.dumps(partido)), copy.deepcopy(partido)):
+        assert copia == partido
+        assert marcador(copia) == (2, 0, 'AAA')
+        copia.eventos[1] = Gol(30, 'BBB', 9)
+        assert marcador(copia) == (1, 1, None)
+    assert marcador(partido) == (2, 0, 'AAA')
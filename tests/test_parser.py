@@ -0,0 +1,84 @@
+"""
+Pruebas de la carga de archivos línea por línea y de los diagnósticos de la gramática
+"""
+
+from models import SistemaFutbol
+from src.dsl_externo import ParserFutbol, importar_archivo, procesar_archivo_partidos
+from src.generador import partido_a_dsl
+
+
+def test_archivo_valido_carga_todos_los_partidos(generador, tmp_path, capsys):
+    sistema = generador.crear_sistema(0)
+    partidos = list(generador.partidos(6))
+    ruta = tmp_path / 'partidos.txt'
+    ruta.write_text('# comentario\n' + ''.join(partido_a_dsl(p) for p in partidos), encoding='utf-8')
+    
+    assert procesar_archivo_partidos(str(ruta), sistema)
+    assert [str(p) for p in sistema.partidos] == [str(p) for p in partidos]
+    assert capsys.readouterr().out.count('finalizado correctamente') == 6
+
+
+def test_color_invalido_usa_el_mensaje_del_camino_por_lineas(generador, tmp_path, capsys):
+    sistema = generador.crear_sistema(0)
+    partidos = list(generador.partidos(2))
+    texto = partido_a_dsl(partidos[0]) + partido_a_dsl(partidos[1]).replace(
+        'BANCO VISITANTE', 'TARJETA: AAA, 10, 5, VERDE\nBANCO VISITANTE')
+    ruta = tmp_path / 'partidos.txt'
+    ruta.write_text(texto, encoding='utf-8')
+    
+    assert not procesar_archivo_partidos(str(ruta), sistema)
+    salida = capsys.readouterr().out
+    assert 'El color debe ser AMARILLA o ROJA' in salida
+    assert 'Error de sintaxis' not in salida
+    # Se detiene en el primer error: solo queda el partido anterior
+    assert len(sistema.partidos) == 1
+
+
+def test_evento_antes_de_la_primera_fecha_no_se_suma_al_partido(generador, tmp_path, capsys):
+    sistema = generador.crear_sistema(0)
+    ruta = tmp_path / 'partidos.txt'
+    ruta.write_text('GOL: AAA, 3, 9\n' + partido_a_dsl(next(generador.partidos(1))), encoding='utf-8')
+    
+    assert not procesar_archivo_partidos(str(ruta), sistema)
+    assert sistema.partidos == []
+    assert 'Error en línea 1' in capsys.readouterr().out
+
+
+def test_error_de_sintaxis_muestra_la_lista_como_en_el_archivo():
+    parser = ParserFutbol(SistemaFutbol())
+    parser.analizar_texto("FECHA: 01/03/2024\nGOL: 1, 2\n")
+    assert [d.mensaje for d in parser.diagnosticos] == ["Error de sintaxis en '1, 2'"]
+
+
+def comparar_con_el_camino_por_lineas(generador, texto, tmp_path):
+    """Analiza `texto` con la gramática y con `importar_archivo`; devuelve los diagnósticos"""
+    ruta = tmp_path / 'partidos.txt'
+    ruta.write_text(texto, encoding='utf-8')
+    resultado = importar_archivo(str(ruta), generador.crear_sistema(0))
+    parser = ParserFutbol(generador.crear_sistema(0))
+    partidos = parser.analizar_texto(texto)
+    
+    assert len(partidos) == resultado.partidos
+    assert [(d.linea, d.columna, d.mensaje) for d in parser.diagnosticos] == \
+        [(d.linea, d.columna, d.mensaje) for d in resultado.diagnosticos]
+    return partidos, [d.mensaje for d in parser.diagnosticos]
+
+
+def test_gramatica_rechaza_un_evento_antes_de_la_primera_fecha(generador, tmp_path):
+    texto = 'GOL: AAA, 3, 9\n' + ''.join(partido_a_dsl(p) for p in generador.partidos(2))
+    partidos, mensajes = comparar_con_el_camino_por_lineas(generador, texto, tmp_path)
+    # El primer bloque incluye la línea del gol y se descarta; el segundo partido se carga
+    assert len(partidos) == 1
+    assert mensajes == ["Debe configurar el partido antes de agregar eventos"]
+
+
+def test_gramatica_valida_el_color_de_las_tarjetas(generador, tmp_path):
+    partidos = list(generador.partidos(3))
+    texto = (partido_a_dsl(partidos[0])
+             + partido_a_dsl(partidos[1]).replace('BANCO VISITANTE', 'TARJETA: AAA, 10, 5, VERDE\n'
+                                                  'TARJETA: AAA, 11, 5, 7\nBANCO VISITANTE')
+             + partido_a_dsl(partidos[2]).replace('BANCO VISITANTE', 'TARJETA: AAA, 10, 5\nBANCO VISITANTE'))
+    cargados, mensajes = comparar_con_el_camino_por_lineas(generador, texto, tmp_path)
+    assert [str(p) for p in cargados] == [str(partidos[0])]
+    assert mensajes == ["El color debe ser AMARILLA o ROJA"] * 2 + \
+        ["Formato de tarjeta inválido. Use: EQUIPO, TIEMPO, JUGADOR, COLOR"]
@@ -0,0 +1,119 @@
+"""
+Pruebas de ida y vuelta de los snapshots binarios
+"""
+
+import pytest
+
+from models import Equipo, Jugador, Partido, SistemaFutbol
+from src.persistencia import ErrorSnapshot, cargar_snapshot, guardar_snapshot
+from src.persistencia import persistencia
+
+
+def claves_equipos(sistema):
+    return [(e.codigo, e.nombre, [(j.numero, j.nombre) for j in e.jugadores])
+            for e in sistema.equipos.values()]
+
+
+def comprobar_ida_y_vuelta(sistema, ruta):
+    guardar_snapshot(sistema, ruta)
+    cargado = cargar_snapshot(ruta)
+    assert claves_equipos(cargado) == claves_equipos(sistema)
+    assert cargado.partidos == sistema.partidos
+    return cargado
+
+
+def test_ida_y_vuelta_de_liga_generada(generador, tmp_path):
+    sistema = generador.crear_sistema(120)
+    cargado = comprobar_ida_y_vuelta(sistema, tmp_path / 'liga.sfut')
+    assert cargado.obtener_tabla_posiciones() == sistema.obtener_tabla_posiciones()
+    assert cargado.obtener_tabla_goleadores() == sistema.obtener_tabla_goleadores()
+
+
+def test_ida_y_vuelta_con_mas_de_65535_cadenas(fecha, tmp_path):
+    # Unos 2.600 equipos de 25 jugadores con nombres distintos: la tabla de cadenas
+    # supera el rango de u16 y las tarjetas aparecen después de ese punto
+    sistema = SistemaFutbol()
+    for i in range(2_650):
+        codigo = f"E{i:04d}"
+        sistema.agregar_equipo(Equipo(f"Equipo {i}", codigo,
+                                      [Jugador(n, f"Jugador {i}-{n}") for n in range(1, 26)]))
+    ultimos = list(sistema.equipos)[-4:]
+    for local, visitante in zip(ultimos[::2], ultimos[1::2]):
+        partido = Partido(fecha, local, visitante, '4-4-2', '4-3-3', list(range(1, 12)),
+                          list(range(1, 12)), [12, 13], [12, 13])
+        partido.agregar_gol(local, 10, 9, 10)
+        partido.agregar_tarjeta(local, 20, 4, 'AMARILLA')
+        partido.agregar_tarjeta(visitante, 70, 5, 'ROJA')
+        partido.agregar_cambio(visitante, 60, 11, 12)
+        sistema.agregar_partido(partido)
+    
+    comprobar_ida_y_vuelta(sistema, tmp_path / 'grande.sfut')
+
+
+def test_colores_se_guardan_normalizados(generador, fecha, tmp_path):
+    sistema = generador.crear_sistema(0)
+    local, visitante = list(sistema.equipos)[:2]
+    partido = Partido(fecha, local, visitante, '4-4-2', '4-3-3', list(range(1, 12)),
+                      list(range(1, 12)), [], [])
+    partido.agregar_tarjeta(local, 5, 3, 'Amarilla')
+    partido.agregar_tarjeta(visitante, 6, 4, 'roja')
+    sistema.agregar_partido(partido)
+    ruta = tmp_path / 'colores.sfut'
+    guardar_snapshot(sistema, ruta)
+    assert [e.color for e in cargar_snapshot(ruta).partidos[0].eventos] == ['AMARILLA', 'ROJA']
+    
+    partido.agregar_tarjeta(local, 7, 3, 'VERDE')
+    with pytest.raises(ErrorSnapshot):
+        guardar_snapshot(sistema, ruta)
+
+
+@pytest.mark.parametrize('modificar', [
+    lambda partido: partido.agregar_gol(partido.equipo_local, 70_000, 9),
+    lambda partido: partido.agregar_gol(partido.equipo_local, 10, 9, 0xFFFF),
+    lambda partido: partido.agregar_tarjeta(partido.equipo_local, 10, -1, 'ROJA'),
+    lambda partido: partido.banco_local.extend(range(12, 300)),
+    lambda partido: partido.titulares_local.__setitem__(0, 70_000),
+])
+def test_valores_fuera_de_rango(generador, fecha, tmp_path, modificar):
+    sistema = generador.crear_sistema(0)
+    local, visitante = list(sistema.equipos)[:2]
+    partido = Partido(fecha, local, visitante, '4-4-2', '4-3-3', list(range(1, 12)),
+                      list(range(1, 12)), [], [])
+    modificar(partido)
+    sistema.agregar_partido(partido)
+    ruta = tmp_path / 'rango.sfut'
+    with pytest.raises(ErrorSnapshot):
+        guardar_snapshot(sistema, ruta)
+    assert not ruta.exists()
+
+
+def test_numero_de_jugador_fuera_de_rango(tmp_path):
+    sistema = SistemaFutbol()
+    sistema.agregar_equipo(Equipo("Equipo", "AAA", [Jugador(70_000, "Jugador")]))
+    with pytest.raises(ErrorSnapshot):
+        guardar_snapshot(sistema, tmp_path / 'rango.sfut')
+
+
+def test_lee_snapshots_de_la_version_1(fecha, tmp_path):
+    # En la versión 1 el color de la tarjeta era un índice en la tabla de cadenas
+    cadenas = ['AAA', 'BBB', '4-4-2', 'ROJA']
+    datos = bytearray(persistencia._CABECERA.pack(persistencia.MAGIA, 1))
+    datos += persistencia._U32.pack(len(cadenas))
+    for cadena in cadenas:
+        datos += persistencia._U32.pack(len(cadena)) + cadena.encode()
+    datos += persistencia._U32.pack(0) + persistencia._U32.pack(1)
+    datos += persistencia._PARTIDO.pack(fecha.toordinal(), 0, 0, 1, 2, 2, 0, 0, 0, 0, 1)
+    datos += persistencia._EVENTO.pack(1, 30, 0, 5, 3)
+    ruta = tmp_path / 'v1.sfut'
+    ruta.write_bytes(bytes(datos))
+    
+    partido = cargar_snapshot(ruta).partidos[0]
+    assert (partido.equipo_local, partido.fecha) == ('AAA', fecha)
+    assert [(e.equipo, e.jugador, e.color) for e in partido.eventos] == [('AAA', 5, 'ROJA')]
+
+
+def test_archivo_invalido(tmp_path):
+    ruta = tmp_path / 'basura.sfut'
+    ruta.write_bytes(b'no es un snapshot')
+    with pytest.raises(ErrorSnapshot):
+        cargar_snapshot(ruta)
@@ -0,0 +1,51 @@
+"""
+Pruebas de la tabla de posiciones actual e histórica contra la referencia
+"""
+
+from datetime import timedelta
+
+from models import Equipo, Jugador, Partido, SistemaFutbol
+import referencia
+
+
+def crear_partido(fecha, local, visitante, goles_local, goles_visitante):
+    partido = Partido(fecha, local, visitante, '4-4-2', '4-4-2', list(range(1, 12)),
+                      list(range(1, 12)), [], [])
+    for minuto in range(goles_local):
+        partido.agregar_gol(local, 10 + minuto, 9)
+    for minuto in range(goles_visitante):
+        partido.agregar_gol(visitante, 50 + minuto, 9)
+    return partido
+
+
+def test_tabla_actual_e_historica_coinciden_con_la_referencia(generador):
+    sistema = generador.crear_sistema(140)
+    # Puntos de control frecuentes para cruzar varios en cada consulta
+    sistema._historial_posiciones.intervalo = 16
+    codigos = sistema.codigos_en_orden()
+    
+    assert sistema.obtener_tabla_posiciones() == referencia.tabla_posiciones(sistema.partidos, codigos)
+    for hasta in sorted({partido.fecha for partido in sistema.partidos}):
+        jugados = [partido for partido in sistema.partidos if partido.fecha <= hasta]
+        assert sistema.obtener_tabla_posiciones(hasta) == referencia.tabla_posiciones(jugados, codigos)
+    # Los puntos de control solo guardan totales por equipo
+    assert sistema._historial_posiciones._puntos_control
+    assert all(punto._cara_a_cara is None for punto in sistema._historial_posiciones._puntos_control)
+
+
+def test_enfrentamiento_directo_anterior_al_punto_de_control(fecha):
+    sistema = SistemaFutbol()
+    for codigo in ('AAA', 'BBB', 'CCC', 'DDD'):
+        sistema.agregar_equipo(Equipo(codigo, codigo, [Jugador(9, f'Nueve {codigo}')]))
+    sistema._historial_posiciones.intervalo = 2
+    # AAA y BBB terminan con 3 puntos, diferencia 0 y 2 goles; BBB ganó el cruce
+    sistema.agregar_partido(crear_partido(fecha, 'BBB', 'AAA', 1, 0))
+    sistema.agregar_partido(crear_partido(fecha + timedelta(days=1), 'AAA', 'CCC', 2, 1))
+    sistema.agregar_partido(crear_partido(fecha + timedelta(days=2), 'DDD', 'BBB', 2, 1))
+    
+    orden = ['DDD', 'BBB', 'AAA', 'CCC']
+    assert [fila['equipo'] for fila in sistema.obtener_tabla_posiciones()] == orden
+    # El cruce queda detrás del punto de control tras dos partidos
+    historica = sistema.obtener_tabla_posiciones(fecha + timedelta(days=2))
+    assert [fila['equipo'] for fila in historica] == orden
+    assert historica == referencia.tabla_posiciones(sistema.partidos, sistema.codigos_en_orden())
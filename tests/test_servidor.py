@@ -0,0 +1,89 @@
+"""
+Pruebas del protocolo del servidor de ingesta
+"""
+
+import asyncio
+
+from src.dsl_externo import ServidorIngesta
+from src.generador import partido_a_dsl
+
+
+def lineas_dsl(partido):
+    return [linea for linea in partido_a_dsl(partido).splitlines() if linea.strip()]
+
+
+async def conversar(servidor, lineas, cerrar=True):
+    """Envía las líneas, devuelve una respuesta por línea y opcionalmente cierra la conexión"""
+    host, puerto = servidor.direcciones[0][:2]
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    respuestas = []
+    for linea in lineas:
+        escritor.write(f"{linea}\n".encode('utf-8'))
+        await escritor.drain()
+        respuestas.append((await lector.readline()).decode('utf-8').rstrip('\n'))
+    if cerrar:
+        escritor.close()
+        await escritor.wait_closed()
+    return respuestas
+
+
+def servir(sistema, *conversaciones):
+    async def sesion():
+        servidor = ServidorIngesta(sistema, max_pendientes=2, tamano_lote=2)
+        await servidor.iniciar('127.0.0.1', 0)
+        respuestas = await asyncio.gather(*(conversar(servidor, lineas) for lineas in conversaciones))
+        await servidor.cerrar()
+        return servidor, respuestas
+    return asyncio.run(sesion())
+
+
+def test_una_respuesta_por_linea_y_partidos_completos(generador):
+    sistema = generador.crear_sistema(0)
+    partidos = list(generador.partidos(3))
+    lineas = lineas_dsl(partidos[0]) + ['FIN'] + lineas_dsl(partidos[1]) + lineas_dsl(partidos[2])
+    servidor, (respuestas,) = servir(sistema, lineas)
+    
+    assert len(respuestas) == len(lineas)
+    assert respuestas.count('OK PARTIDO 1') == 1
+    # FECHA: cierra el partido anterior; el último se encola al cerrar la conexión
+    assert all(r == 'OK' for r in respuestas if r != 'OK PARTIDO 1')
+    assert [str(p) for p in sistema.partidos] == [str(p) for p in partidos]
+    assert sistema.obtener_tabla_posiciones() == generador.crear_sistema(3).obtener_tabla_posiciones()
+    assert (servidor.estadisticas.partidos_encolados, servidor.estadisticas.partidos_aplicados) == (3, 3)
+
+
+def test_errores_no_cambian_el_partido_en_curso(generador):
+    sistema = generador.crear_sistema(0)
+    partido = next(generador.partidos(1))
+    lineas = lineas_dsl(partido)
+    lineas[3:3] = ['TARJETA: AAA, 10, 5, VERDE', 'BASURA', 'GOL: AAA, 10']
+    servidor, (respuestas,) = servir(sistema, lineas + ['FIN'])
+    
+    errores = [r for r in respuestas if r.startswith('ERROR')]
+    assert len(errores) == 3 == servidor.estadisticas.errores
+    assert 'El color debe ser AMARILLA o ROJA' in errores[0]
+    assert respuestas[-1] == 'OK PARTIDO 1'
+    assert [str(e) for e in sistema.partidos[0].eventos] == [str(e) for e in partido.eventos]
+
+
+def test_partido_incompleto_se_descarta(generador):
+    sistema = generador.crear_sistema(0)
+    partidos = list(generador.partidos(2))
+    incompleto = [linea for linea in lineas_dsl(partidos[0]) if not linea.startswith('BANCO')]
+    servidor, (respuestas,) = servir(sistema, incompleto + lineas_dsl(partidos[1]))
+    
+    segunda_fecha = len(incompleto)
+    assert respuestas[segunda_fecha].startswith('ERROR partido anterior descartado')
+    assert [str(p) for p in sistema.partidos] == [str(partidos[1])]
+
+
+def test_conexiones_simultaneas_no_mezclan_partidos(generador):
+    sistema = generador.crear_sistema(0)
+    partidos = list(generador.partidos(8))
+    conversaciones = [lineas_dsl(a) + ['FIN'] + lineas_dsl(b) + ['FIN']
+                      for a, b in zip(partidos[::2], partidos[1::2])]
+    servidor, respuestas = servir(sistema, *conversaciones)
+    
+    assert not any(r.startswith('ERROR') for conversacion in respuestas for r in conversacion)
+    assert sorted(str(p) for p in sistema.partidos) == sorted(str(p) for p in partidos)
+    assert servidor.estadisticas.conexiones == 4